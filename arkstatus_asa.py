@@ -18,6 +18,8 @@ import discord
 from discord.ext import commands, tasks
 from discord import app_commands
 
+from dashboards import edit_dashboard
+
 # ───────────────────────────── Config (Railway ENV) ─────────────────────────────
 AS_API_KEY = os.getenv("AS_API_KEY", "").strip() or None
 AS_CHANNEL_ID = int(os.getenv("AS_CHANNEL_ID", "0"))
@@ -277,6 +279,7 @@ class ArkStatusASA(commands.Cog):
     def __init__(self, bot: discord.Client):
         self.bot = bot
         self.message_ids: Dict[str, int] = _load_state()  # target -> message_id
+        self._last_desc: Dict[str, Optional[str]] = {}  # target -> description last sent
         self._dashboard_loop = tasks.loop(seconds=AS_REFRESH_SEC)(self._tick)
         self._backoff_until = 0.0  # global cooldown based on headers/429
 
@@ -395,27 +398,34 @@ class ArkStatusASA(commands.Cog):
 
             await asyncio.sleep(sleep_between)  # polite spacing
 
+    # A deleted dashboard is sent again on the next tick even if its content is unchanged
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        self._forget_messages({payload.message_id})
+
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
+        self._forget_messages(payload.message_ids)
+
+    def _forget_messages(self, message_ids) -> None:
+        for target, mid in self.message_ids.items():
+            if int(mid) in message_ids:
+                self._last_desc.pop(target, None)
+
     async def _send_or_edit(
         self, channel: discord.abc.Messageable, target: str, embed: discord.Embed
     ):
         mid = self.message_ids.get(target)
+        # Skip edit when nothing changed (compare with the description last sent)
+        if mid and self._last_desc.get(target) == embed.description:
+            return
         try:
-            if mid:
-                msg = await channel.fetch_message(mid)
-                old_desc = msg.embeds[0].description if msg.embeds else None
-                if old_desc == embed.description:
-                    return
-                await msg.edit(embed=embed)
-            else:
-                msg = await channel.send(embed=embed)
-                self.message_ids[target] = msg.id
+            new_id = await edit_dashboard(channel, mid, embed=embed, source="arkstatus")
+            self._last_desc[target] = embed.description
+            if new_id != mid:
+                self.message_ids[target] = new_id
                 _save_state(self.message_ids)
 
-        except discord.NotFound:
-            sent = await channel.send(embed=embed)
-            self.message_ids[target] = sent.id
-            _save_state(self.message_ids)
-
         except discord.Forbidden:
             print(f"[ARKSTATUS] Missing permissions to edit dashboard for {target}")
 
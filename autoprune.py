@@ -9,9 +9,9 @@ from discord import app_commands
 from discord.ext import commands, tasks
 
 from data_manager import (
-    get_autoprune_channels,
-    remove_autoprune_channel,
-    set_autoprune_channel,
+    aget_autoprune_channels,
+    aremove_autoprune_channel,
+    aset_autoprune_channel,
 )
 
 
@@ -259,7 +259,7 @@ class AutoPruneCog(commands.Cog):
 
         # iterate all guilds the bot is in
         for guild in self.bot.guilds:
-            channels = get_autoprune_channels(guild.id)
+            channels = await aget_autoprune_channels(guild.id)
             if not channels:
                 continue
 
@@ -384,7 +384,7 @@ class AutoPruneCog(commands.Cog):
             )
             return
 
-        set_autoprune_channel(
+        await aset_autoprune_channel(
             guild_id=interaction.guild_id,
             channel_id=channel.id,
             keep_last=keep_last,
@@ -438,7 +438,7 @@ class AutoPruneCog(commands.Cog):
     async def autoprune_disable(
         self, interaction: discord.Interaction, channel: discord.TextChannel
     ):
-        ok = remove_autoprune_channel(interaction.guild_id, channel.id)
+        ok = await aremove_autoprune_channel(interaction.guild_id, channel.id)
         msg = (
             f"Auto-prune disabled for {channel.mention}."
             if ok
@@ -452,7 +452,7 @@ class AutoPruneCog(commands.Cog):
     )
     @app_commands.checks.has_permissions(manage_messages=True)
     async def autoprune_list(self, interaction: discord.Interaction):
-        channels = get_autoprune_channels(interaction.guild_id)
+        channels = await aget_autoprune_channels(interaction.guild_id)
         if not channels:
             await interaction.response.send_message(
                 "No auto-prune channels configured.", ephemeral=True
@@ -487,7 +487,7 @@ class AutoPruneCog(commands.Cog):
     async def autoprune_run_now(
         self, interaction: discord.Interaction, channel: discord.TextChannel
     ):
-        channels = get_autoprune_channels(interaction.guild_id)
+        channels = await aget_autoprune_channels(interaction.guild_id)
         cfg = channels.get(str(channel.id))
         if not cfg:
             await interaction.response.send_message(
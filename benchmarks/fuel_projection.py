@@ -0,0 +1,126 @@
+# benchmarks/fuel_projection.py
+# Time to project remaining fuel, units left and LOW/EMPTY crossings for many generators:
+# one calculator call per item dict (how gen_timers used to do it) versus fuel_engine's
+# batched projection, with the Python and (if installed) NumPy kernels.
+#
+#   python benchmarks/fuel_projection.py [--gens 10000] [--lists 250]
+#
+# "columns" rows time the kernel alone on prebuilt columns; "items" rows include reading
+# the fields out of the item dicts, which is what the dashboard render and the alert scheduler
+# pay. The results of every variant are checked against each other.
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fuel_engine import FUEL_TYPES, numpy, project_columns  # noqa: E402
+from fuel_engine import project_items, project_lists  # noqa: E402
+
+LOW_THRESHOLD = 12 * 3600
+
+
+def make_items(n: int, now: float) -> list:
+    items = []
+    for i in range(n):
+        tek = i % 3 != 0
+        items.append(
+            {
+                "name": f"{'Tek' if tek else 'Elec'} Gen {i:05d}",
+                "type": "Tek" if tek else "Electrical",
+                "element": random.randint(0, 200) if tek else 0,
+                "shards": random.randint(0, 5000) if tek else 0,
+                "gas": 0 if tek else random.randint(0, 300),
+                "imbued": 0 if tek else random.randint(0, 100),
+                "timestamp": now - random.uniform(0, 30 * 86400),
+            }
+        )
+    return items
+
+
+def per_item(items: list, now: float) -> list:
+    """The old shape: one closed-form calculator call per item (compute_tek_remaining)."""
+    out = []
+    for item in items:
+        (a_field, a_dur), (b_field, b_dur) = FUEL_TYPES[item["type"]].fuels
+        a, b = int(item.get(a_field, 0)), int(item.get(b_field, 0))
+        elapsed = max(now - float(item.get("timestamp", now)), 0)
+        a_time, b_time = a * a_dur, b * b_dur
+        remaining = max(a_time + b_time - elapsed, 0)
+        rem_a = max(a - int(min(elapsed, a_time) // a_dur), 0)
+        rem_b = max(b - int(min(max(elapsed - a_time, 0), b_time) // b_dur), 0)
+        out.append((int(remaining), rem_a, rem_b))
+    return out
+
+
+def bench(fn, min_time: float = 0.3) -> float:
+    """Average seconds per call."""
+    loops = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        dt = time.perf_counter() - t0
+        if dt >= min_time:
+            return dt / loops
+        loops *= 2
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--gens", type=int, default=10000, help="generators in total")
+    ap.add_argument("--lists", type=int, default=250, help="lists they are spread over")
+    args = ap.parse_args()
+
+    random.seed(1)
+    now = time.time()
+    items = make_items(args.gens, now)
+    per_list = max(1, args.gens // args.lists)
+    docs = {f"list {i}": items[i : i + per_list] for i in range(0, args.gens, per_list)}
+    tek = FUEL_TYPES["Tek"]
+    tek_items = [it for it in items if it["type"] == "Tek"]
+    ts = [it["timestamp"] for it in tek_items]
+    counts = [[it[field] for it in tek_items] for field in tek.fields]
+
+    expected = per_item(items, now)
+    kernels = [False] + ([True] if numpy is not None else [])
+    for use_numpy in kernels:
+        proj = project_items(items, now, LOW_THRESHOLD, use_numpy=use_numpy)
+        got = [(r, *u) for r, u in zip(proj.remaining, proj.units)]
+        assert got == expected, f"{'numpy' if use_numpy else 'python'} kernel differs"
+
+    rows = [("items", "per-item calls", lambda: per_item(items, now))]
+    for use_numpy in kernels:
+        label = "numpy" if use_numpy else "python"
+        rows += [
+            (
+                "columns",
+                f"{label} kernel",
+                lambda u=use_numpy: project_columns(tek, ts, counts, now, LOW_THRESHOLD, u),
+            ),
+            (
+                "items",
+                f"{label} batch",
+                lambda u=use_numpy: project_items(items, now, LOW_THRESHOLD, use_numpy=u),
+            ),
+            (
+                "lists",
+                f"{label} all lists",
+                lambda u=use_numpy: project_lists(docs, now, LOW_THRESHOLD, use_numpy=u),
+            ),
+        ]
+    if numpy is None:
+        print("numpy not installed: Python kernel only")
+
+    print(f"{args.gens} generators ({len(tek_items)} Tek) in {len(docs)} lists")
+    print(f"{'input':<9}{'variant':<20}{'ms/pass':>9}{'us/gen':>9}")
+    for kind, label, fn in rows:
+        n = len(tek_items) if kind == "columns" else args.gens
+        sec = bench(fn)
+        print(f"{kind:<9}{label:<20}{sec * 1e3:>9.2f}{sec / n * 1e6:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
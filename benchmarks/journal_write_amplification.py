@@ -0,0 +1,129 @@
+# benchmarks/journal_write_amplification.py
+# Bytes written to disk for a stream of generator-list mutations: full pretty-printed
+# rewrites (the JSON backend without a journal, one indent=2 file write per save) versus
+# the append-only journal with periodic compaction.
+#
+#   python benchmarks/journal_write_amplification.py [--gens 40] [--ops 2000]
+#
+# Write amplification = bytes written / bytes of the changes themselves (as JSON).
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from storage import KIND_GEN, JsonFileBackend, apply_changes  # noqa: E402
+
+
+def make_item(i: int, now: float) -> dict:
+    tek = i % 3 != 0
+    return {
+        "name": f"{'Tek' if tek else 'Elec'} Gen {i:03d}",
+        "type": "Tek" if tek else "Electrical",
+        "element": random.randint(0, 200) if tek else 0,
+        "shards": random.randint(0, 5000) if tek else 0,
+        "gas": 0 if tek else random.randint(0, 300),
+        "imbued": 0 if tek else random.randint(0, 100),
+        "timestamp": now - random.randint(0, 86400),
+        "alerted_low": False,
+        "alerted_empty": False,
+        "alerts_muted": False,
+        "notes": "",
+    }
+
+
+def set_field(index: int, field: str, value) -> dict:
+    return {"op": "set_field", "index": index, "field": field, "value": value}
+
+
+def make_workload(gens: int, ops: int, seed: int = 1):
+    """Initial doc + list of change batches, mixed like real traffic:
+    refuels (edit_gen_tek), alert flag flips (evaluate_and_ping), mutes, add/remove, moves."""
+    random.seed(seed)
+    now = time.time()
+    doc = {"schema_version": 2, "role_id": 1234, "items": [make_item(i, now) for i in range(gens)]}
+    shadow = json.loads(json.dumps(doc))
+    batches = []
+    next_id = gens
+    for _ in range(ops):
+        n = len(shadow["items"])
+        r = random.random()
+        i = random.randrange(n)
+        if r < 0.45:  # refuel
+            batch = [
+                set_field(i, "element", random.randint(1, 200)),
+                set_field(i, "shards", random.randint(1, 5000)),
+                set_field(i, "timestamp", now),
+                set_field(i, "alerted_low", False),
+                set_field(i, "alerted_empty", False),
+            ]
+        elif r < 0.85:  # LOW / EMPTY alert flag
+            batch = [set_field(i, random.choice(("alerted_low", "alerted_empty")), True)]
+        elif r < 0.90:  # mute/unmute
+            batch = [set_field(i, "alerts_muted", r < 0.875)]
+        elif r < 0.95 or n < 5:  # add
+            batch = [{"op": "add_item", "index": n, "item": make_item(next_id, now)}]
+            next_id += 1
+        elif r < 0.975:  # remove
+            batch = [{"op": "remove_item", "index": i}]
+        else:  # reorder_gen
+            order = list(range(n))
+            order.insert(random.randrange(n), order.pop(i))
+            batch = [{"op": "reorder", "order": order}]
+        apply_changes(shadow, batch)
+        batches.append(batch)
+    return doc, batches
+
+
+def run(backend: JsonFileBackend, doc: dict, batches) -> dict:
+    doc = json.loads(json.dumps(doc))
+    backend.write(KIND_GEN, "bench", doc)
+    backend.bytes_written = 0
+    t0 = time.perf_counter()
+    for batch in batches:
+        apply_changes(doc, batch)
+        backend.apply(KIND_GEN, "bench", doc, batch)
+    elapsed = time.perf_counter() - t0
+    assert backend.read(KIND_GEN, "bench") == doc, "replayed document differs"
+    return {"bytes": backend.bytes_written, "sec": elapsed, "compactions": backend.compactions}
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--gens", type=int, default=40, help="generators in the list")
+    ap.add_argument("--ops", type=int, default=2000, help="saves to replay")
+    ap.add_argument("--compact-kib", type=int, default=64, help="journal compaction threshold")
+    args = ap.parse_args()
+
+    doc, batches = make_workload(args.gens, args.ops)
+    logical = sum(len(json.dumps(ch, separators=(",", ":"))) + 1 for b in batches for ch in b)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, kinds in (("full rewrite", ()), ("journal", (KIND_GEN,))):
+            d = os.path.join(tmp, label.replace(" ", "_"))
+            backend = JsonFileBackend(
+                dirs={KIND_GEN: d},
+                files={},
+                journal_kinds=kinds,
+                compact_bytes=args.compact_kib * 1024,
+            )
+            results[label] = run(backend, doc, batches)
+
+    print(f"{args.gens} generators, {args.ops} saves, {logical / 1024:.1f} KiB of changes")
+    print(f"{'mode':<14}{'written KiB':>13}{'amplif.':>10}{'compactions':>13}{'us/save':>10}")
+    for label, r in results.items():
+        print(
+            f"{label:<14}{r['bytes'] / 1024:>13.1f}{r['bytes'] / logical:>10.1f}"
+            f"{r['compactions']:>13}{r['sec'] / args.ops * 1e6:>10.1f}"
+        )
+    full, journal = results["full rewrite"]["bytes"], results["journal"]["bytes"]
+    print(f"journal writes {full / max(journal, 1):.1f}x fewer bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+# benchmarks/serializer_formats.py
+# Encode/decode time and size on disk of each DATA_FORMAT for realistic documents:
+# a regular list, a generator list and the timers mapping.
+#
+#   python benchmarks/serializer_formats.py [--entries 80] [--gens 40] [--timers 150]
+#
+# orjson and msgpack rows only appear when those packages are installed. Decoding goes
+# through storage.decode(), which parses every JSON flavour with orjson when available.
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from storage import available_serializers, decode  # noqa: E402
+
+CATEGORIES = ("Owner", "Enemy", "Friend", "Ally", "Beta", "Item")
+
+
+def make_list(n: int) -> list:
+    doc = []
+    for i in range(n):
+        if i % 15 == 0:
+            doc.append({"category": "Category", "name": f"Section {i // 15 + 1}"})
+        elif i % 7 == 0:
+            doc.append({"category": "Bullet", "name": f"Reminder number {i}: check the vault"})
+        else:
+            entry = {"category": random.choice(CATEGORIES), "name": f"Tribe Member {i:03d}"}
+            if i % 4 == 0:
+                entry["comment"] = "Seen near the volcano base, usually online evenings (EU)."
+            doc.append(entry)
+    return doc
+
+
+def make_gen_doc(n: int) -> dict:
+    now = time.time()
+    items = []
+    for i in range(n):
+        tek = i % 3 != 0
+        items.append(
+            {
+                "name": f"{'Tek' if tek else 'Elec'} Gen {i:03d}",
+                "type": "Tek" if tek else "Electrical",
+                "element": random.randint(0, 200) if tek else 0,
+                "shards": random.randint(0, 5000) if tek else 0,
+                "gas": 0 if tek else random.randint(0, 300),
+                "imbued": 0 if tek else random.randint(0, 100),
+                "timestamp": now - random.randint(0, 86400),
+                "alerted_low": random.random() < 0.2,
+                "alerted_empty": False,
+                "alerts_muted": random.random() < 0.1,
+                "notes": "",
+            }
+        )
+    return {"schema_version": 2, "role_id": 112233445566778899, "items": items}
+
+
+def make_timers(n: int) -> dict:
+    now = time.time()
+    return {
+        f"{random.getrandbits(128):032x}": {
+            "name": f"Timer {i}",
+            "end_time": now + random.randint(60, 7 * 86400),
+            "channel_id": 987654321098765432,
+            "message_id": 123456789012345678 + i,
+            "paused": False,
+            "owner_id": 111111111111111111,
+            "role_id": None,
+            "expired": random.random() < 0.3,
+        }
+        for i in range(n)
+    }
+
+
+def bench(fn, arg, min_time: float = 0.2) -> float:
+    """Average seconds per call."""
+    loops = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            fn(arg)
+        dt = time.perf_counter() - t0
+        if dt >= min_time:
+            return dt / loops
+        loops *= 2
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--entries", type=int, default=80, help="regular list entries")
+    ap.add_argument("--gens", type=int, default=40, help="generators in the gen list")
+    ap.add_argument("--timers", type=int, default=150, help="timers in timers.json")
+    args = ap.parse_args()
+
+    random.seed(1)
+    docs = {
+        "list": make_list(args.entries),
+        "gen list": make_gen_doc(args.gens),
+        "timers": make_timers(args.timers),
+    }
+    serializers = available_serializers()
+
+    print(f"{'document':<10}{'format':<13}{'bytes':>9}{'encode us':>11}{'decode us':>11}")
+    for label, doc in docs.items():
+        for ser in serializers:
+            payload = ser.dumps(doc)
+            assert decode(payload) == doc, f"{ser.name} round-trip differs"
+            enc = bench(ser.dumps, doc)
+            dec = bench(decode, payload)
+            print(f"{label:<10}{ser.name:<13}{len(payload):>9}{enc * 1e6:>11.1f}{dec * 1e6:>11.1f}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -16,6 +16,8 @@ import discord
 from discord.ext import commands, tasks
 from discord import app_commands
 
+from dashboards import edit_dashboard
+
 # -----------------------
 # Config via ENV (Railway)
 # -----------------------
@@ -162,6 +164,7 @@ class BM_ASA(commands.Cog):
     def __init__(self, bot: discord.Client):
         self.bot = bot
         self.message_ids: Dict[str, int] = _load_state()  # server_id -> message_id
+        self._last_desc: Dict[str, Optional[str]] = {}  # server_id -> description last sent
         self._dashboard_loop = tasks.loop(seconds=BM_REFRESH_SEC)(self._tick)
         self._backoff_until = 0.0  # pause edits on 429
 
@@ -257,30 +260,34 @@ class BM_ASA(commands.Cog):
             await self._send_or_edit(channel, sid, embed)
             await asyncio.sleep(1)  # polite spacing
 
+    # A deleted dashboard is sent again on the next tick even if its content is unchanged
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        self._forget_messages({payload.message_id})
+
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
+        self._forget_messages(payload.message_ids)
+
+    def _forget_messages(self, message_ids) -> None:
+        for server_id, mid in self.message_ids.items():
+            if mid in message_ids:
+                self._last_desc.pop(server_id, None)
+
     async def _send_or_edit(
         self, channel: discord.abc.Messageable, server_id: str, embed: discord.Embed
     ):
         mid = self.message_ids.get(server_id)
+        # Skip edit when nothing changed (compare with the description last sent)
+        if mid and self._last_desc.get(server_id) == embed.description:
+            return
         try:
-            if mid:
-                msg = await channel.fetch_message(mid)
-
-                # Skip edit when nothing changed (compare descriptions)
-                old_desc = msg.embeds[0].description if msg.embeds else None
-                if old_desc == embed.description:
-                    return
-
-                await msg.edit(embed=embed)
-            else:
-                msg = await channel.send(embed=embed)
-                self.message_ids[server_id] = msg.id
+            new_id = await edit_dashboard(channel, mid, embed=embed, source="bm")
+            self._last_desc[server_id] = embed.description
+            if new_id != mid:
+                self.message_ids[server_id] = new_id
                 _save_state(self.message_ids)
 
-        except discord.NotFound:
-            sent = await channel.send(embed=embed)
-            self.message_ids[server_id] = sent.id
-            _save_state(self.message_ids)
-
         except discord.Forbidden:
             print(f"[BM_ASA] Missing permissions to edit dashboard for server {server_id}")
 
@@ -10,19 +10,28 @@ from discord import app_commands
 from dotenv import load_dotenv
 
 from data_manager import (
-    load_list,
-    save_list,
-    list_exists,
-    delete_list,
-    get_all_list_names,
-    get_all_gen_list_names,
-    save_dashboard_id,
-    get_dashboard_id,
-    save_gen_dashboard_id,
-    gen_list_exists,
+    aload_list,
+    asave_list,
+    alist_exists,
+    adelete_list,
+    aget_all_list_names,
+    aget_all_gen_list_names,
+    asave_dashboard_id,
+    aget_dashboard_id,
+    asave_gen_dashboard_pages,
+    agen_list_exists,
+    aload_gen_list,
+    aget_gen_list_role,
+    amigrate_gen_lists,
+    list_doc,
+    alist_entry_index,
+    run_io,
+    LIST_DASHBOARDS,
+    GEN_DASHBOARDS,
 )
 from timers import TimerCog
-from gen_timers import setup_gen_timers, build_gen_timetable_embed
+from dashboards import RefreshQueue, edit_dashboard
+from gen_timers import setup_gen_timers, build_gen_pages
 from logging_cog import LoggingCog
 
 load_dotenv()
@@ -139,8 +148,8 @@ CATEGORY_ORDER = ["Category", "Text", "Bullet"] + list(CATEGORY_EMOJIS.keys())
 
 
 # â”â”â” helper: update a deployed regular-list dashboard â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”
-async def update_list_dashboard(list_name: str):
-    dash = get_dashboard_id(list_name)
+async def update_list_dashboard(list_name: str, data: list | None = None):
+    dash = await aget_dashboard_id(list_name)
     if not dash:
         return
     channel_id, message_id = dash
@@ -148,20 +157,27 @@ async def update_list_dashboard(list_name: str):
     if not channel:
         return
     try:
-        msg = await channel.fetch_message(message_id)
-        embed = build_embed(list_name)
-        await msg.edit(embed=embed)
+        if data is None:
+            data = await aload_list(list_name)
+        embed = build_embed(list_name, data)
+        new_id = await edit_dashboard(channel, message_id, embed=embed, source="lists")
+        if new_id != message_id:
+            await asave_dashboard_id(list_name, channel.id, new_id)
     except discord.HTTPException:
         pass
     except Exception:
         pass
 
 
+# Commands queue their list; a burst of edits becomes one dashboard edit, and the command
+# (and the list's transaction) doesn't wait for it.
+LIST_REFRESH = RefreshQueue(update_list_dashboard, source="lists")
+
+
 # â”â”â” embed builder for regular lists â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”
-def build_embed(list_name: str) -> discord.Embed:
-    # Load original data and compute per-type ordinals in the ORIGINAL order,
+def build_embed(list_name: str, original: list) -> discord.Embed:
+    # Compute per-type ordinals in the ORIGINAL order (as loaded),
     # so indices match what the edit/move/assign commands expect.
-    original = load_list(list_name)
 
     cat_i = text_i = bullet_i = name_i = 0
     annotated = []
@@ -269,6 +285,14 @@ async def on_ready():
     if not bot.get_cog("LoggingCog"):
         await bot.add_cog(LoggingCog(bot))
 
+    # One-time generator schema upgrade so dashboard refreshes read documents as-is
+    try:
+        report = await amigrate_gen_lists()
+        if report["files"]:
+            print(f"[gen_lists] upgraded {report['files']} list(s), {report['items']} generator(s)")
+    except Exception as e:
+        print(f"[gen_lists] schema migration failed: {e}")
+
     await setup_gen_timers(bot)
 
     # â”€â”€ Feature flag: BattleMetrics (enable/disable via env) â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
@@ -304,26 +328,53 @@ async def on_ready():
     print(f"Logged in as {bot.user} (ID: {bot.user.id})")
 
 
+# Forget dashboards whose message or channel was deleted (looked up by reverse index).
+# A deleted gen dashboard message is left mapped: the refresh loop recreates it in place.
+async def _forget_list_dashboard(message_id: int) -> None:
+    name = await run_io(LIST_DASHBOARDS.forget_message, message_id)
+    if name:
+        print(f"[dashboards] dashboard message for list '{name}' was deleted; unmapped")
+
+
+@bot.listen()
+async def on_raw_message_delete(payload: discord.RawMessageDeleteEvent):
+    await _forget_list_dashboard(payload.message_id)
+
+
+@bot.listen()
+async def on_raw_bulk_message_delete(payload: discord.RawBulkMessageDeleteEvent):
+    for message_id in payload.message_ids:
+        await _forget_list_dashboard(message_id)
+
+
+@bot.listen()
+async def on_guild_channel_delete(channel: discord.abc.GuildChannel):
+    lists = await run_io(LIST_DASHBOARDS.forget_channel, channel.id)
+    gens = await run_io(GEN_DASHBOARDS.forget_channel, channel.id)
+    if lists or gens:
+        print(f"[dashboards] channel {channel.id} deleted; unmapped {', '.join(lists + gens)}")
+
+
 # â”â”â” List CRUD â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”
 @bot.tree.command(name="create_list", description="Create a new list")
 @app_commands.describe(name="Name of the new list")
 async def create_list_cmd(interaction: discord.Interaction, name: str):
-    if list_exists(name):
+    if await alist_exists(name):
         return await interaction.response.send_message(
             f"âš ï¸ List '{name}' already exists.", ephemeral=True
         )
-    save_list(name, [])
+    await asave_list(name, [])
     await interaction.response.send_message(f"âœ… Created list '{name}'.", ephemeral=True)
 
 
 @bot.tree.command(name="delete_list", description="Delete an existing list")
 @app_commands.describe(name="Name of the list to delete")
 async def delete_list_cmd(interaction: discord.Interaction, name: str):
-    if not list_exists(name):
+    if not await alist_exists(name):
         return await interaction.response.send_message(
             f"âŒ No list named '{name}'.", ephemeral=True
         )
-    delete_list(name)
+    await adelete_list(name)
     await interaction.response.send_message(f"âœ… Deleted list '{name}'.", ephemeral=True)
 
 
@@ -331,17 +382,16 @@ async def delete_list_cmd(interaction: discord.Interaction, name: str):
 @bot.tree.command(name="add_list_category", description="Add a category header to a list")
 @app_commands.describe(list_name="List to modify", title="Category title")
 async def add_list_category(interaction: discord.Interaction, list_name: str, title: str):
-    if not list_exists(list_name):
-        return await interaction.response.send_message(
-            f"âŒ No list named '{list_name}'.", ephemeral=True
-        )
-    data = load_list(list_name)
-    data.append({"category": "Category", "name": title})
-    save_list(list_name, data)
+    async with list_doc(list_name) as data:
+        if data is None:
+            return await interaction.response.send_message(
+                f"âŒ No list named '{list_name}'.", ephemeral=True
+            )
+        data.append({"category": "Category", "name": title})
     await interaction.response.send_message(
         f"âœ… Added category to '{list_name}': **{title}**", ephemeral=True
     )
-    await update_list_dashboard(list_name)
+    LIST_REFRESH.request(list_name)
 
 
 @bot.tree.command(name="edit_list_category", description="Edit a category header")
@@ -351,60 +401,57 @@ async def add_list_category(interaction: discord.Interaction, list_name: str, ti
 async def edit_list_category(
     interaction: discord.Interaction, list_name: str, index: int, new_title: str
 ):
-    if not list_exists(list_name):
-        return await interaction.response.send_message(
-            f"âŒ No list named '{list_name}'.", ephemeral=True
-        )
-    data = load_list(list_name)
-    idxs = [i for i, x in enumerate(data) if x["category"] == "Category"]
-    if index < 1 or index > len(idxs):
-        return await interaction.response.send_message(
-            "âŒ Invalid category index.", ephemeral=True
-        )
-    data[idxs[index - 1]]["name"] = new_title
-    save_list(list_name, data)
+    async with list_doc(list_name) as data:
+        if data is None:
+            return await interaction.response.send_message(
+                f"âŒ No list named '{list_name}'.", ephemeral=True
+            )
+        idxs = [i for i, x in enumerate(data) if x["category"] == "Category"]
+        if index < 1 or index > len(idxs):
+            return await interaction.response.send_message(
+                "âŒ Invalid category index.", ephemeral=True
+            )
+        data[idxs[index - 1]]["name"] = new_title
     await interaction.response.send_message(
         f"âœ… Updated category #{index} to **{new_title}**", ephemeral=True
     )
-    await update_list_dashboard(list_name)
+    LIST_REFRESH.request(list_name)
 
 
 @bot.tree.command(name="remove_list_category", description="Remove a category header by index")
 @app_commands.describe(list_name="List to modify", index="Category position (1-based)")
 async def remove_list_category(interaction: discord.Interaction, list_name: str, index: int):
-    if not list_exists(list_name):
-        return await interaction.response.send_message(
-            f"âŒ No list named '{list_name}'.", ephemeral=True
-        )
-    data = load_list(list_name)
-    idxs = [i for i, x in enumerate(data) if x["category"] == "Category"]
-    if index < 1 or index > len(idxs):
-        return await interaction.response.send_message(
-            "âŒ Invalid category index.", ephemeral=True
-        )
-    removed = data.pop(idxs[index - 1])
-    save_list(list_name, data)
+    async with list_doc(list_name) as data:
+        if data is None:
+            return await interaction.response.send_message(
+                f"âŒ No list named '{list_name}'.", ephemeral=True
+            )
+        idxs = [i for i, x in enumerate(data) if x["category"] == "Category"]
+        if index < 1 or index > len(idxs):
+            return await interaction.response.send_message(
+                "âŒ Invalid category index.", ephemeral=True
+            )
+        removed = data.pop(idxs[index - 1])
     await interaction.response.send_message(
         f"âœ… Removed category #{index}: **{removed['name']}**", ephemeral=True
     )
-    await update_list_dashboard(list_name)
+    LIST_REFRESH.request(list_name)
 
 
 # â”â”â” Plain text entries â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”
 @bot.tree.command(name="add_text", description="Add a plain text line to a list")
 @app_commands.describe(list_name="List to modify", text="Text line to add")
 async def add_text(interaction: discord.Interaction, list_name: str, text: str):
-    if not list_exists(list_name):
-        return await interaction.response.send_message(
-            f"âŒ No list named '{list_name}'.", ephemeral=True
-        )
-    data = load_list(list_name)
-    data.append({"category": "Text", "name": text})
-    save_list(list_name, data)
+    async with list_doc(list_name) as data:
+        if data is None:
+            return await interaction.response.send_message(
+                f"âŒ No list named '{list_name}'.", ephemeral=True
+            )
+        data.append({"category": "Text", "name": text})
     await interaction.response.send_message(
         f"âœ… Added text to '{list_name}': {text}", ephemeral=True
     )
-    await update_list_dashboard(list_name)
+    LIST_REFRESH.request(list_name)
 
 
 @bot.tree.command(name="edit_text", description="Edit a plain text line")
@@ -412,54 +459,51 @@ async def add_text(interaction: discord.Interaction, list_name: str, text: str):
     list_name="List to modify", index="Text line # (1-based)", new_text="New text"
 )
 async def edit_text(interaction: discord.Interaction, list_name: str, index: int, new_text: str):
-    if not list_exists(list_name):
-        return await interaction.response.send_message(
-            f"âŒ No list named '{list_name}'.", ephemeral=True
-        )
-    data = load_list(list_name)
-    txt_idxs = [i for i, x in enumerate(data) if x["category"] == "Text"]
-    if index < 1 or index > len(txt_idxs):
-        return await interaction.response.send_message("âŒ Invalid text index.", ephemeral=True)
-    data[txt_idxs[index - 1]]["name"] = new_text
-    save_list(list_name, data)
+    async with list_doc(list_name) as data:
+        if data is None:
+            return await interaction.response.send_message(
+                f"âŒ No list named '{list_name}'.", ephemeral=True
+            )
+        txt_idxs = [i for i, x in enumerate(data) if x["category"] == "Text"]
+        if index < 1 or index > len(txt_idxs):
+            return await interaction.response.send_message("âŒ Invalid text index.", ephemeral=True)
+        data[txt_idxs[index - 1]]["name"] = new_text
     await interaction.response.send_message(f"âœ… Updated text #{index}.", ephemeral=True)
-    await update_list_dashboard(list_name)
+    LIST_REFRESH.request(list_name)
 
 
 @bot.tree.command(name="remove_text", description="Remove a plain text line")
 @app_commands.describe(list_name="List to modify", index="Text line # (1-based)")
 async def remove_text(interaction: discord.Interaction, list_name: str, index: int):
-    if not list_exists(list_name):
-        return await interaction.response.send_message(
-            f"âŒ No list named '{list_name}'.", ephemeral=True
-        )
-    data = load_list(list_name)
-    txt_idxs = [i for i, x in enumerate(data) if x["category"] == "Text"]
-    if index < 1 or index > len(txt_idxs):
-        return await interaction.response.send_message("âŒ Invalid text index.", ephemeral=True)
-    removed = data.pop(txt_idxs[index - 1])
-    save_list(list_name, data)
+    async with list_doc(list_name) as data:
+        if data is None:
+            return await interaction.response.send_message(
+                f"âŒ No list named '{list_name}'.", ephemeral=True
+            )
+        txt_idxs = [i for i, x in enumerate(data) if x["category"] == "Text"]
+        if index < 1 or index > len(txt_idxs):
+            return await interaction.response.send_message("âŒ Invalid text index.", ephemeral=True)
+        removed = data.pop(txt_idxs[index - 1])
     await interaction.response.send_message(
         f"âœ… Removed text #{index}: {removed['name']}", ephemeral=True
     )
-    await update_list_dashboard(list_name)
+    LIST_REFRESH.request(list_name)
 
 
 # â”â”â” Bullet entries â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”
 @bot.tree.command(name="add_bullet", description="Add a bullet entry to a list")
 @app_commands.describe(list_name="List to modify", bullet="Bullet point to add")
 async def add_bullet(interaction: discord.Interaction, list_name: str, bullet: str):
-    if not list_exists(list_name):
-        return await interaction.response.send_message(
-            f"âŒ No list named '{list_name}'.", ephemeral=True
-        )
-    data = load_list(list_name)
-    data.append({"category": "Bullet", "name": bullet})
-    save_list(list_name, data)
+    async with list_doc(list_name) as data:
+        if data is None:
+            return await interaction.response.send_message(
+                f"âŒ No list named '{list_name}'.", ephemeral=True
+            )
+        data.append({"category": "Bullet", "name": bullet})
     await interaction.response.send_message(
         f"âœ… Added bullet to '{list_name}': {BULLET} {bullet}", ephemeral=True
     )
-    await update_list_dashboard(list_name)
+    LIST_REFRESH.request(list_name)
 
 
 @bot.tree.command(name="edit_bullet", description="Edit a bullet entry")
@@ -469,37 +513,39 @@ async def add_bullet(interaction: discord.Interaction, list_name: str, bullet: s
 async def edit_bullet(
     interaction: discord.Interaction, list_name: str, index: int, new_bullet: str
 ):
-    if not list_exists(list_name):
-        return await interaction.response.send_message(
-            f"âŒ No list named '{list_name}'.", ephemeral=True
-        )
-    data = load_list(list_name)
-    bul_idxs = [i for i, x in enumerate(data) if x["category"] == "Bullet"]
-    if index < 1 or index > len(bul_idxs):
-        return await interaction.response.send_message("âŒ Invalid bullet index.", ephemeral=True)
-    data[bul_idxs[index - 1]]["name"] = new_bullet
-    save_list(list_name, data)
+    async with list_doc(list_name) as data:
+        if data is None:
+            return await interaction.response.send_message(
+                f"âŒ No list named '{list_name}'.", ephemeral=True
+            )
+        bul_idxs = [i for i, x in enumerate(data) if x["category"] == "Bullet"]
+        if index < 1 or index > len(bul_idxs):
+            return await interaction.response.send_message(
+                "âŒ Invalid bullet index.", ephemeral=True
+            )
+        data[bul_idxs[index - 1]]["name"] = new_bullet
     await interaction.response.send_message(f"âœ… Updated bullet #{index}.", ephemeral=True)
-    await update_list_dashboard(list_name)
+    LIST_REFRESH.request(list_name)
 
 
 @bot.tree.command(name="remove_bullet", description="Remove a bullet entry")
 @app_commands.describe(list_name="List to modify", index="Bullet # (1-based)")
 async def remove_bullet(interaction: discord.Interaction, list_name: str, index: int):
-    if not list_exists(list_name):
-        return await interaction.response.send_message(
-            f"âŒ No list named '{list_name}'.", ephemeral=True
-        )
-    data = load_list(list_name)
-    bul_idxs = [i for i, x in enumerate(data) if x["category"] == "Bullet"]
-    if index < 1 or index > len(bul_idxs):
-        return await interaction.response.send_message("âŒ Invalid bullet index.", ephemeral=True)
-    removed = data.pop(bul_idxs[index - 1])
-    save_list(list_name, data)
+    async with list_doc(list_name) as data:
+        if data is None:
+            return await interaction.response.send_message(
+                f"âŒ No list named '{list_name}'.", ephemeral=True
+            )
+        bul_idxs = [i for i, x in enumerate(data) if x["category"] == "Bullet"]
+        if index < 1 or index > len(bul_idxs):
+            return await interaction.response.send_message(
+                "âŒ Invalid bullet index.", ephemeral=True
+            )
+        removed = data.pop(bul_idxs[index - 1])
     await interaction.response.send_message(
         f"âœ… Removed bullet #{index}: {removed['name']}", ephemeral=True
     )
-    await update_list_dashboard(list_name)
+    LIST_REFRESH.request(list_name)
 
 
 # â”â”â” Entries CRUD with dropdowns â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”
@@ -514,50 +560,40 @@ async def add_name(
     entry_name: str,
     category: app_commands.Choice[str],
 ):
-    if not list_exists(list_name):
-        return await interaction.response.send_message(
-            f"âŒ No list named '{list_name}'.", ephemeral=True
-        )
-    data = load_list(list_name)
-    if any(
-        e["name"].lower() == entry_name.lower()
-        and e["category"] not in ("Category", "Text", "Bullet")
-        for e in data
-    ):
-        return await interaction.response.send_message(
-            f"âŒ `{entry_name}` already exists in `{list_name}`.", ephemeral=True
-        )
-    data.append({"category": category.value, "name": entry_name})
-    save_list(list_name, data)
+    async with list_doc(list_name) as data:
+        if data is None:
+            return await interaction.response.send_message(
+                f"âŒ No list named '{list_name}'.", ephemeral=True
+            )
+        if await alist_entry_index(list_name, entry_name) is not None:
+            return await interaction.response.send_message(
+                f"âŒ `{entry_name}` already exists in `{list_name}`.", ephemeral=True
+            )
+        data.append({"category": category.value, "name": entry_name})
     await interaction.response.send_message(
         f"âœ… Added {CATEGORY_EMOJIS[category.value]} **{entry_name}** as {category.value}",
         ephemeral=True,
     )
-    await update_list_dashboard(list_name)
+    LIST_REFRESH.request(list_name)
 
 
 @bot.tree.command(name="remove_name", description="Remove an entry")
 @app_commands.describe(list_name="List to modify", entry_name="Entry to remove")
 async def remove_name(interaction: discord.Interaction, list_name: str, entry_name: str):
-    if not list_exists(list_name):
+    async with list_doc(list_name) as data:
+        if data is None:
+            return await interaction.response.send_message(
+                f"âŒ No list named '{list_name}'.", ephemeral=True
+            )
+        i = await alist_entry_index(list_name, entry_name)
+        if i is not None:
+            data.pop(i)
+    if i is None:
         return await interaction.response.send_message(
-            f"âŒ No list named '{list_name}'.", ephemeral=True
+            f"âŒ Entry '{entry_name}' not found.", ephemeral=True
         )
-    data = load_list(list_name)
-    for i, it in enumerate(data):
-        if it["name"].lower() == entry_name.lower() and it["category"] not in (
-            "Category",
-            "Text",
-            "Bullet",
-        ):
-            data.pop(i)
-            save_list(list_name, data)
-            await interaction.response.send_message(
-                f"âœ… Removed **{entry_name}**.", ephemeral=True
-            )
-            await update_list_dashboard(list_name)
-            return
-    await interaction.response.send_message(f"âŒ Entry '{entry_name}' not found.", ephemeral=True)
+    await interaction.response.send_message(f"âœ… Removed **{entry_name}**.", ephemeral=True)
+    LIST_REFRESH.request(list_name)
 
 
 @bot.tree.command(name="edit_name", description="Rename an entry & change category")
@@ -575,23 +611,24 @@ async def edit_name(
     new_name: str,
     category: app_commands.Choice[str],
 ):
-    if not list_exists(list_name):
+    async with list_doc(list_name) as data:
+        if data is None:
+            return await interaction.response.send_message(
+                f"âŒ No list named '{list_name}'.", ephemeral=True
+            )
+        i = await alist_entry_index(list_name, old_name)
+        if i is not None:
+            data[i]["name"] = new_name
+            data[i]["category"] = category.value
+    if i is None:
         return await interaction.response.send_message(
-            f"âŒ No list named '{list_name}'.", ephemeral=True
+            f"âŒ Entry '{old_name}' not found.", ephemeral=True
         )
-    data = load_list(list_name)
-    for it in data:
-        if it["name"] == old_name and it["category"] not in ("Category", "Text", "Bullet"):
-            it["name"] = new_name
-            it["category"] = category.value
-            save_list(list_name, data)
-            await interaction.response.send_message(
-                f"âœ… Renamed **{old_name}** {RIGHT_ARROW} **{new_name}** & set category to {category.value}",
-                ephemeral=True,
-            )
-            await update_list_dashboard(list_name)
-            return
-    await interaction.response.send_message(f"âŒ Entry '{old_name}' not found.", ephemeral=True)
+    await interaction.response.send_message(
+        f"âœ… Renamed **{old_name}** {RIGHT_ARROW} **{new_name}** & set category to {category.value}",
+        ephemeral=True,
+    )
+    LIST_REFRESH.request(list_name)
 
 
 @bot.tree.command(name="move_name", description="Move an entry")
@@ -601,49 +638,46 @@ async def edit_name(
 async def move_name(
     interaction: discord.Interaction, list_name: str, entry_name: str, position: int
 ):
-    if not list_exists(list_name):
-        return await interaction.response.send_message(
-            f"âŒ No list named '{list_name}'.", ephemeral=True
-        )
-    data = load_list(list_name)
-    for idx, it in enumerate(data):
-        if it["name"] == entry_name and it["category"] not in ("Category", "Text", "Bullet"):
-            entry = data.pop(idx)
-            break
-    else:
-        return await interaction.response.send_message(
-            f"âŒ Entry '{entry_name}' not found.", ephemeral=True
-        )
-    pos = max(1, min(position, len(data) + 1))
-    data.insert(pos - 1, entry)
-    save_list(list_name, data)
+    async with list_doc(list_name) as data:
+        if data is None:
+            return await interaction.response.send_message(
+                f"âŒ No list named '{list_name}'.", ephemeral=True
+            )
+        idx = await alist_entry_index(list_name, entry_name)
+        if idx is None:
+            return await interaction.response.send_message(
+                f"âŒ Entry '{entry_name}' not found.", ephemeral=True
+            )
+        entry = data.pop(idx)
+        pos = max(1, min(position, len(data) + 1))
+        data.insert(pos - 1, entry)
     await interaction.response.send_message(
         f"âœ… Moved **{entry_name}** to position {pos}.", ephemeral=True
     )
-    await update_list_dashboard(list_name)
+    LIST_REFRESH.request(list_name)
 
 
 @bot.tree.command(name="sort_list", description="Sort by category priority then name")
 @app_commands.describe(list_name="List to sort")
 async def sort_list(interaction: discord.Interaction, list_name: str):
-    if not list_exists(list_name):
-        return await interaction.response.send_message(
-            f"âŒ No list named '{list_name}'.", ephemeral=True
-        )
-    data = load_list(list_name)
-    categories = [it for it in data if it["category"] == "Category"]
-    texts = [it for it in data if it["category"] == "Text"]
-    bullets = [it for it in data if it["category"] == "Bullet"]
-    entries = [it for it in data if it["category"] not in ("Category", "Text", "Bullet")]
-    sorted_entries = []
-    for cat in CATEGORY_EMOJIS.keys():
-        grp = [it for it in entries if it["category"] == cat]
-        grp.sort(key=lambda x: x["name"].lower())
-        sorted_entries.extend(grp)
-    new_data = categories + texts + bullets + sorted_entries
-    save_list(list_name, new_data)
+    async with list_doc(list_name) as data:
+        if data is None:
+            return await interaction.response.send_message(
+                f"âŒ No list named '{list_name}'.", ephemeral=True
+            )
+        categories = [it for it in data if it["category"] == "Category"]
+        texts = [it for it in data if it["category"] == "Text"]
+        bullets = [it for it in data if it["category"] == "Bullet"]
+        entries = [it for it in data if it["category"] not in ("Category", "Text", "Bullet")]
+        sorted_entries = []
+        for cat in CATEGORY_EMOJIS.keys():
+            grp = [it for it in entries if it["category"] == cat]
+            grp.sort(key=lambda x: x["name"].lower())
+            sorted_entries.extend(grp)
+        new_data = categories + texts + bullets + sorted_entries
+        data[:] = new_data
     await interaction.response.send_message(f"âœ… Sorted items in '{list_name}'.", ephemeral=True)
-    await update_list_dashboard(list_name)
+    LIST_REFRESH.request(list_name)
 
 
 # â”â”â” Comments â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”
@@ -655,21 +689,22 @@ async def sort_list(interaction: discord.Interaction, list_name: str):
 async def add_comment(
     interaction: discord.Interaction, list_name: str, entry_name: str, comment: str
 ):
-    if not list_exists(list_name):
+    async with list_doc(list_name) as data:
+        if data is None:
+            return await interaction.response.send_message(
+                f"âŒ No list named '{list_name}'.", ephemeral=True
+            )
+        i = await alist_entry_index(list_name, entry_name)
+        if i is not None:
+            data[i]["comment"] = comment
+    if i is None:
         return await interaction.response.send_message(
-            f"âŒ No list named '{list_name}'.", ephemeral=True
+            f"âŒ Entry '{entry_name}' not found.", ephemeral=True
         )
-    data = load_list(list_name)
-    for it in data:
-        if it["name"] == entry_name and it["category"] not in ("Category", "Text", "Bullet"):
-            it["comment"] = comment
-            save_list(list_name, data)
-            await interaction.response.send_message(
-                f"âœ… Comment added to **{entry_name}**.", ephemeral=True
-            )
-            await update_list_dashboard(list_name)
-            return
-    await interaction.response.send_message(f"âŒ Entry '{entry_name}' not found.", ephemeral=True)
+    await interaction.response.send_message(
+        f"âœ… Comment added to **{entry_name}**.", ephemeral=True
+    )
+    LIST_REFRESH.request(list_name)
 
 
 @bot.tree.command(name="edit_comment", description="Edit a comment")
@@ -679,41 +714,45 @@ async def add_comment(
 async def edit_comment(
     interaction: discord.Interaction, list_name: str, entry_name: str, new_comment: str
 ):
-    if not list_exists(list_name):
+    async with list_doc(list_name) as data:
+        if data is None:
+            return await interaction.response.send_message(
+                f"âŒ No list named '{list_name}'.", ephemeral=True
+            )
+        i = await alist_entry_index(list_name, entry_name)
+        found = i is not None and "comment" in data[i]
+        if found:
+            data[i]["comment"] = new_comment
+    if not found:
         return await interaction.response.send_message(
-            f"âŒ No list named '{list_name}'.", ephemeral=True
+            f"âŒ No comment on '{entry_name}'.", ephemeral=True
         )
-    data = load_list(list_name)
-    for it in data:
-        if it["name"] == entry_name and "comment" in it:
-            it["comment"] = new_comment
-            save_list(list_name, data)
-            await interaction.response.send_message(
-                f"âœ… Comment updated for **{entry_name}**.", ephemeral=True
-            )
-            await update_list_dashboard(list_name)
-            return
-    await interaction.response.send_message(f"âŒ No comment on '{entry_name}'.", ephemeral=True)
+    await interaction.response.send_message(
+        f"âœ… Comment updated for **{entry_name}**.", ephemeral=True
+    )
+    LIST_REFRESH.request(list_name)
 
 
 @bot.tree.command(name="remove_comment", description="Remove a comment")
 @app_commands.describe(list_name="List to modify", entry_name="Entry whose comment to remove")
 async def remove_comment(interaction: discord.Interaction, list_name: str, entry_name: str):
-    if not list_exists(list_name):
+    async with list_doc(list_name) as data:
+        if data is None:
+            return await interaction.response.send_message(
+                f"âŒ No list named '{list_name}'.", ephemeral=True
+            )
+        i = await alist_entry_index(list_name, entry_name)
+        found = i is not None and "comment" in data[i]
+        if found:
+            del data[i]["comment"]
+    if not found:
         return await interaction.response.send_message(
-            f"âŒ No list named '{list_name}'.", ephemeral=True
+            f"âŒ Entry '{entry_name}' not found.", ephemeral=True
         )
-    data = load_list(list_name)
-    for it in data:
-        if it["name"] == entry_name and "comment" in it:
-            del it["comment"]
-            save_list(list_name, data)
-            await interaction.response.send_message(
-                f"âœ… Removed comment from **{entry_name}**.", ephemeral=True
-            )
-            await update_list_dashboard(list_name)
-            return
-    await interaction.response.send_message(f"âŒ Entry '{entry_name}' not found.", ephemeral=True)
+    await interaction.response.send_message(
+        f"âœ… Removed comment from **{entry_name}**.", ephemeral=True
+    )
+    LIST_REFRESH.request(list_name)
 
 
 # â”â”â” Assign to Category â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”
@@ -738,47 +777,48 @@ async def assign_to_category(
     entry_type: app_commands.Choice[str],
     entry_index: int,
 ):
-    if not list_exists(list_name):
-        return await interaction.response.send_message(
-            f"âŒ No list named '{list_name}'.", ephemeral=True
-        )
-    data = load_list(list_name)
-    cat_idxs = [i for i, v in enumerate(data) if v["category"] == "Category"]
-    if not cat_idxs:
-        return await interaction.response.send_message(
-            "âŒ No categories in this list.", ephemeral=True
-        )
-    if category_index < 1 or category_index > len(cat_idxs):
-        return await interaction.response.send_message(
-            "âŒ Invalid category index.", ephemeral=True
-        )
-    et = entry_type.value
-    if et == "Text":
-        pos_list = [i for i, v in enumerate(data) if v["category"] == "Text"]
-    elif et == "Bullet":
-        pos_list = [i for i, v in enumerate(data) if v["category"] == "Bullet"]
-    else:  # Name
-        pos_list = [
-            i for i, v in enumerate(data) if v["category"] not in ("Category", "Text", "Bullet")
-        ]
-    if entry_index < 1 or entry_index > len(pos_list):
-        return await interaction.response.send_message(f"âŒ Invalid {et} index.", ephemeral=True)
-    entry = data.pop(pos_list[entry_index - 1])
-    # recompute category positions after removal
-    new_cat_idxs = [i for i, v in enumerate(data) if v["category"] == "Category"]
-    insert_at = new_cat_idxs[category_index - 1] + 1
-    data.insert(insert_at, entry)
-    save_list(list_name, data)
+    async with list_doc(list_name) as data:
+        if data is None:
+            return await interaction.response.send_message(
+                f"âŒ No list named '{list_name}'.", ephemeral=True
+            )
+        cat_idxs = [i for i, v in enumerate(data) if v["category"] == "Category"]
+        if not cat_idxs:
+            return await interaction.response.send_message(
+                "âŒ No categories in this list.", ephemeral=True
+            )
+        if category_index < 1 or category_index > len(cat_idxs):
+            return await interaction.response.send_message(
+                "âŒ Invalid category index.", ephemeral=True
+            )
+        et = entry_type.value
+        if et == "Text":
+            pos_list = [i for i, v in enumerate(data) if v["category"] == "Text"]
+        elif et == "Bullet":
+            pos_list = [i for i, v in enumerate(data) if v["category"] == "Bullet"]
+        else:  # Name
+            pos_list = [
+                i for i, v in enumerate(data) if v["category"] not in ("Category", "Text", "Bullet")
+            ]
+        if entry_index < 1 or entry_index > len(pos_list):
+            return await interaction.response.send_message(
+                f"âŒ Invalid {et} index.", ephemeral=True
+            )
+        entry = data.pop(pos_list[entry_index - 1])
+        # recompute category positions after removal
+        new_cat_idxs = [i for i, v in enumerate(data) if v["category"] == "Category"]
+        insert_at = new_cat_idxs[category_index - 1] + 1
+        data.insert(insert_at, entry)
     await interaction.response.send_message(
         f"âœ… Moved {et} #{entry_index} under category #{category_index}.", ephemeral=True
     )
-    await update_list_dashboard(list_name)
+    LIST_REFRESH.request(list_name)
 
 
 # â”â”â” Viewing & Deploy â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”â”
 @bot.tree.command(name="view_lists", description="List all your lists")
 async def view_lists_cmd(interaction: discord.Interaction):
-    names = get_all_list_names()
+    names = await aget_all_list_names()
     if not names:
         return await interaction.response.send_message("âš ï¸ No lists found.", ephemeral=True)
     await interaction.response.send_message(
@@ -788,7 +828,7 @@ async def view_lists_cmd(interaction: discord.Interaction):
 
 @bot.tree.command(name="view_gen_lists", description="List all your generator lists")
 async def view_gen_lists_cmd(interaction: discord.Interaction):
-    names = get_all_gen_list_names()
+    names = await aget_all_gen_list_names()
     if not names:
         return await interaction.response.send_message("âš ï¸ No gen lists found.", ephemeral=True)
     await interaction.response.send_message(
@@ -800,11 +840,11 @@ async def view_gen_lists_cmd(interaction: discord.Interaction):
 @bot.tree.command(name="deploy_list", description="Deploy/update a regular list")
 @app_commands.describe(name="Name of the list")
 async def deploy_list_cmd(interaction: discord.Interaction, name: str):
-    if list_exists(name):
-        embed = build_embed(name)
+    if await alist_exists(name):
+        embed = build_embed(name, await aload_list(name))
         await interaction.response.send_message(embed=embed)
         sent = await interaction.original_response()
-        save_dashboard_id(name, sent.channel.id, sent.id)
+        await asave_dashboard_id(name, sent.channel.id, sent.id)
     else:
         await interaction.response.send_message(f"âŒ No list named '{name}'.", ephemeral=True)
 
@@ -812,11 +852,14 @@ async def deploy_list_cmd(interaction: discord.Interaction, name: str):
 @bot.tree.command(name="deploy_gen_list", description="Deploy/update a generator dashboard")
 @app_commands.describe(name="Name of the generator list")
 async def deploy_gen_list_cmd(interaction: discord.Interaction, name: str):
-    if gen_list_exists(name):
-        embed = build_gen_timetable_embed(name)
-        await interaction.response.send_message(embed=embed)
+    if await agen_list_exists(name):
+        pages = build_gen_pages(name, await aload_gen_list(name), await aget_gen_list_role(name))
+        await interaction.response.send_message(embeds=pages[0])
         sent = await interaction.original_response()
-        save_gen_dashboard_id(name, sent.channel.id, sent.id)
+        ids = [sent.id]
+        for embeds in pages[1:]:  # long lists continue in follow-up messages
+            ids.append((await interaction.channel.send(embeds=embeds)).id)
+        await asave_gen_dashboard_pages(name, sent.channel.id, ids)
     else:
         await interaction.response.send_message(
             f"âŒ No generator list named '{name}'.", ephemeral=True
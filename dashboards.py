@@ -0,0 +1,209 @@
+# dashboards.py
+# Shared helper for editing deployed dashboard messages (list and generator dashboards,
+# timer embeds, Ark Status / BattleMetrics widgets).
+#
+# Edits go straight to PATCH by message ID through channel.get_partial_message(), with no
+# fetch_message() GET in front, so every update costs one REST call and one rate-limit
+# bucket hit instead of two. Only when Discord answers NotFound (the message was deleted)
+# is the content sent again, and the caller re-points its stored mapping to the new ID.
+#
+# Message edits are rate limited per channel, so a 429 cools down only the channel it
+# came from (ChannelBackoff) instead of every dashboard the bot owns.
+#
+# Commands don't edit dashboards themselves: they hand the list name to a RefreshQueue,
+# which waits for the burst of edits to settle and then refreshes the dashboard once.
+import asyncio
+import os
+import time
+from typing import Awaitable, Callable, Dict, Optional, Set, Tuple
+
+import discord
+
+# source -> {"edits": PATCHes sent, "resent": messages re-created, "saved": GETs avoided}
+EDIT_STATS: Dict[str, Dict[str, int]] = {}
+
+
+def _stats(source: str) -> Dict[str, int]:
+    return EDIT_STATS.setdefault(source, {"edits": 0, "resent": 0, "saved": 0})
+
+
+async def edit_dashboard(
+    channel: discord.abc.Messageable,
+    message_id: Optional[int],
+    *,
+    source: str,
+    resend: bool = True,
+    **fields,
+) -> Optional[int]:
+    """Edit a dashboard message in place (fields as for Message.edit, e.g. embed=...).
+
+    Returns the ID of the message now showing the content: `message_id` after an edit, a
+    new ID when the message was missing (or `message_id` is None) and was sent again, or
+    None if it was missing and `resend` is False. Errors other than NotFound propagate.
+    """
+    st = _stats(source)
+    if message_id:
+        try:
+            await channel.get_partial_message(int(message_id)).edit(**fields)
+            st["edits"] += 1
+            st["saved"] += 1
+            return int(message_id)
+        except discord.NotFound:
+            if not resend:
+                return None
+    elif not resend:
+        return None
+    sent = await channel.send(**fields)
+    st["resent"] += 1
+    return sent.id
+
+
+def edit_stats() -> Dict[str, Dict[str, int]]:
+    """Copy of the per-source counters (for /diag dashboards and loop summaries)."""
+    return {source: dict(st) for source, st in EDIT_STATS.items()}
+
+
+def retry_after(exc: Exception) -> Optional[float]:
+    """Seconds Discord asked us to wait, from a 429 exception, if it said."""
+    value = getattr(exc, "retry_after", None)
+    if value is None:
+        headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+        value = headers.get("Retry-After")
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class ChannelBackoff:
+    """Cooldown per channel after a 429.
+
+    The first 429 waits what Discord asked for (retry_after, else `default` seconds). A
+    channel hit again within `window` seconds of its previous 429 waits twice as long as
+    last time, up to `cap`; after a quiet window it starts over.
+    """
+
+    def __init__(self, cap: float, window: float = 600.0, default: float = 5.0):
+        self.cap = cap
+        self.window = window
+        self.default = default
+        self._until: Dict[int, float] = {}
+        self._strikes: Dict[int, Tuple[int, float]] = {}  # channel -> (strikes, last 429)
+
+    def remaining(self, channel_id: int) -> float:
+        """Seconds this channel is still cooling down (0 when it may be used)."""
+        until = self._until.get(channel_id)
+        if until is None:
+            return 0.0
+        left = until - time.time()
+        if left <= 0:
+            del self._until[channel_id]
+            return 0.0
+        return left
+
+    def hit(self, channel_id: int, retry_after: Optional[float] = None) -> float:
+        """Record a 429 for this channel. Returns the cooldown applied."""
+        now = time.time()
+        strikes, last = self._strikes.get(channel_id, (0, 0.0))
+        strikes = strikes + 1 if now - last <= self.window else 1
+        self._strikes[channel_id] = (strikes, now)
+        base = retry_after if retry_after and retry_after > 0 else self.default
+        delay = min(self.cap, base * 2 ** (strikes - 1))
+        self._until[channel_id] = max(self._until.get(channel_id, 0.0), now + delay)
+        return delay
+
+    def cooling(self) -> Dict[int, float]:
+        """{channel_id: seconds left} for every channel currently cooling down."""
+        return {ch: left for ch in list(self._until) if (left := self.remaining(ch)) > 0}
+
+
+# Quiet time after the last request before a dashboard is refreshed, and the longest a
+# refresh is put off while requests keep coming in
+DEBOUNCE_SEC = float(os.getenv("DASHBOARD_DEBOUNCE_SEC", "1.5"))
+DEBOUNCE_MAX_SEC = float(os.getenv("DASHBOARD_DEBOUNCE_MAX_SEC", "10"))
+
+# source -> RefreshQueue, for /diag dashboards
+REFRESH_QUEUES: Dict[str, "RefreshQueue"] = {}
+
+
+class RefreshQueue:
+    """Debounced dashboard refreshes, coalesced per key (list name).
+
+    request(key) returns at once. `refresh(key)` runs `delay` seconds after the latest
+    request for that key, or `max_delay` after the first one if requests keep coming, so
+    fifteen refuels in a row cost one dashboard edit. Requests made while a refresh is
+    running schedule one more run after it. refresh() loads the current data itself, so
+    a request made inside a transaction sees the committed document.
+    """
+
+    def __init__(
+        self,
+        refresh: Callable[[str], Awaitable[None]],
+        *,
+        source: str,
+        delay: float = DEBOUNCE_SEC,
+        max_delay: float = DEBOUNCE_MAX_SEC,
+    ):
+        self.refresh = refresh
+        self.source = source
+        self.delay = delay
+        self.max_delay = max(max_delay, delay)
+        self.stats = {"requests": 0, "refreshes": 0, "errors": 0}
+        self._first: Dict[str, float] = {}  # key -> time of its first pending request
+        self._run_at: Dict[str, float] = {}  # key -> when its refresh is due
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._running: Set[str] = set()
+        REFRESH_QUEUES[source] = self
+
+    def request(self, key: str) -> None:
+        """Refresh `key`'s dashboard soon; coalesced with other requests for it."""
+        now = time.monotonic()
+        first = self._first.setdefault(key, now)
+        self._run_at[key] = min(now + self.delay, first + self.max_delay)
+        self.stats["requests"] += 1
+        if key not in self._tasks:
+            self._tasks[key] = asyncio.get_running_loop().create_task(self._worker(key))
+
+    def pending(self, key: str) -> bool:
+        """Whether a refresh of `key` is queued or running."""
+        return key in self._run_at or key in self._running
+
+    async def _worker(self, key: str) -> None:
+        try:
+            while key in self._run_at:
+                wait = self._run_at[key] - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                    continue
+                del self._run_at[key]
+                del self._first[key]
+                self._running.add(key)
+                try:
+                    await self.refresh(key)
+                    self.stats["refreshes"] += 1
+                except Exception as e:
+                    self.stats["errors"] += 1
+                    print(f"[dashboards] {self.source} refresh of {key!r} failed: {e}")
+                finally:
+                    self._running.discard(key)
+        finally:
+            self._tasks.pop(key, None)
+
+    def discard(self, key: str) -> None:
+        """Forget a queued refresh of `key` (e.g. its list was deleted); one already
+        running finishes."""
+        self._run_at.pop(key, None)
+        self._first.pop(key, None)
+
+    def cancel(self) -> None:
+        """Drop everything queued."""
+        for task in list(self._tasks.values()):
+            task.cancel()
+        self._tasks.clear()
+        self._run_at.clear()
+        self._first.clear()
+
+
+def queue_stats() -> Dict[str, Dict[str, int]]:
+    """{source: {"requests", "refreshes", "errors", "queued"}} for every RefreshQueue."""
+    return {source: dict(q.stats, queued=len(q._run_at)) for source, q in REFRESH_QUEUES.items()}
@@ -1,7 +1,32 @@
 import os
-import json
 import time
-from typing import Any, Dict, List, Optional, Tuple
+import atexit
+import asyncio
+import contextlib
+import functools
+import itertools
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from storage import (
+    KIND_AUTOPRUNE,
+    KIND_DASHBOARDS,
+    KIND_GEN,
+    KIND_GEN_DASHBOARDS,
+    KIND_LIST,
+    KIND_TIMERS,
+    NAMED_KINDS,
+    MISSING,
+    JsonFileBackend,
+    get_serializer,
+    StorageBackend,
+    _ensure_dir,
+    _safe_read_doc,
+    _safe_write_doc,
+    json_line,
+)
 
 # ───────────────────────────── Storage paths ─────────────────────────────
 BASE_DATA = os.getenv("DATABASE_PATH", "./data.json")
@@ -16,35 +41,392 @@ GEN_DASHBOARDS_PATH = os.getenv("GEN_DASHBOARDS_PATH") or os.path.join(
 )
 
 TIMERS_PATH = os.path.join(BASE_DIR, "timers.json")
+# Expired timers leave timers.json for this append-only JSON-lines archive (see
+# archive_expired_timers), optionally counted per guild per day in TIMER_STATS_PATH
+TIMERS_ARCHIVE_PATH = os.getenv("TIMERS_ARCHIVE_PATH") or os.path.join(
+    BASE_DIR, "timers.archive.jsonl"
+)
+TIMER_STATS_PATH = os.getenv("TIMER_STATS_PATH") or os.path.join(BASE_DIR, "timer_stats.json")
 
 AUTOPRUNE_PATH = os.getenv("AUTOPRUNE_PATH") or os.path.join(BASE_DIR, "autoprune.json")
 
+# Seconds between background flushes of dirty documents. 0 = write-through (flush on every save).
+FLUSH_INTERVAL_SEC = float(os.getenv("DATA_FLUSH_INTERVAL_SEC", "5"))
+
+# On-disk encoding: json (compact, default), json-pretty, orjson or msgpack. Files in any
+# of these formats are read regardless of the setting (see storage.decode).
+DATA_FORMAT = (os.getenv("DATA_FORMAT", "json") or "json").strip().lower()
+
+# Generator lists and the dashboard mappings are saved as appended changes
+# (<name>.journal.jsonl) on the JSON backend; the journal is folded into <name>.json once
+# it reaches this many bytes.
+GEN_JOURNAL = os.getenv("DATA_GEN_JOURNAL", "1") == "1"
+JOURNAL_COMPACT_BYTES = int(os.getenv("DATA_JOURNAL_COMPACT_BYTES", str(64 * 1024)))
+
+# Worker threads used by the async facade (aload_list, asave_gen_list, ...)
+IO_WORKERS = max(1, int(os.getenv("DATA_IO_WORKERS", "4")))
+
+
+# ───────────────────────────── Storage backend ────────────────────────────
+# json   = one file per list under LISTS_DIR/GEN_LISTS_DIR + the mapping files above
+# sqlite = single WAL-mode database at SQLITE_PATH (imported from the JSON files on first run)
+STORAGE_BACKEND = (os.getenv("STORAGE_BACKEND", "json") or "json").strip().lower()
+SQLITE_PATH = os.getenv("SQLITE_PATH") or os.path.join(BASE_DIR, "gravity.db")
+
+
+# ───────────────────────────── Document cache ─────────────────────────────
+# Every document is loaded once and then served from memory. Saves replace the cached
+# copy and mark it dirty; a background thread persists dirty documents every
+# FLUSH_INTERVAL_SEC (and once more at exit), so a burst of saves to the same document
+# costs a single write. Callers always get their own copy, so mutating a loaded list
+# without saving it never leaks into the cache.
+#
+# Point updates (one generator, one dashboard id, one timer) are recorded as changes
+# (see storage.apply_changes) so backends that support it can persist just those rows.
+_DocKey = Tuple[str, str]  # (kind, key)
+_MAX_PENDING_CHANGES = 256  # past this, a full rewrite is cheaper than replaying changes
+REWRITE = object()  # returned by a _cache_mutate fn: persist the whole document
+
+_cache: Dict[_DocKey, Any] = {}
+# Bumped on every write/mutate/delete of a document, never reused (a deleted and
+# re-created list gets a new number). 0 = not changed since it was loaded.
+_revisions: Dict[_DocKey, int] = {}
+_revision_counter = itertools.count(1)
+# dirty docs -> changes since last flush, or None when the whole doc must be rewritten
+_pending: Dict[_DocKey, Optional[List[Dict[str, Any]]]] = {}
+_cache_lock = threading.RLock()
+# dk -> lock held while that doc is read from the backend on a cache miss, so the read
+# runs outside _cache_lock and concurrent misses of the same doc read it once
+_load_locks: Dict[_DocKey, threading.Lock] = {}
+_flush_lock = threading.Lock()
+_flusher: Optional[threading.Thread] = None
+_flusher_stop = threading.Event()
+
+
+def _clone(obj: Any) -> Any:
+    """Cheap deep copy for JSON-shaped data (dicts, lists, scalars)."""
+    if isinstance(obj, dict):
+        return {k: _clone(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_clone(v) for v in obj]
+    return obj
+
+
+def _cache_load(dk: _DocKey) -> Any:
+    """The cached doc `dk`, read from the backend on a miss (MISSING if it doesn't exist).
+
+    Call without holding _cache_lock: the read happens outside it, so a cold read (journal
+    replay, a sqlite query) never holds up cache hits or loads of other documents.
+    """
+    with _cache_lock:
+        doc = _cache.get(dk, MISSING)
+        if doc is not MISSING:
+            return doc
+        load_lock = _load_locks.setdefault(dk, threading.Lock())
+    with load_lock:
+        while True:
+            with _cache_lock:
+                doc = _cache.get(dk, MISSING)
+                if doc is not MISSING:
+                    return doc  # loaded or written meanwhile
+                revision = _revisions.get(dk, 0)
+            doc = BACKEND.read(*dk)
+            with _cache_lock:
+                if dk in _cache:
+                    return _cache[dk]
+                if _revisions.get(dk, 0) != revision:
+                    continue  # deleted or replaced while we read; read again
+                if doc is not MISSING:
+                    _cache[dk] = doc
+                return doc
+
+
+def _cache_peek_locked(dk: _DocKey) -> Any:
+    """The cached doc `dk` (caller holds _cache_lock and loaded it with _cache_load)."""
+    return _cache.get(dk, MISSING)
+
+
+def doc_revision(kind: str, key: str) -> int:
+    """Changes whenever the document changes (for caches of things derived from it)."""
+    with _cache_lock:
+        return _revisions.get((kind, key), 0)
+
+
+def _cache_read(kind: str, key: str, default: Any) -> Any:
+    # Cached docs are never mutated in place, so copying outside the lock is safe
+    doc = _cache_load((kind, key))
+    return default if doc is MISSING else _clone(doc)
+
+
+def _schedule_flush() -> None:
+    if FLUSH_INTERVAL_SEC <= 0:
+        flush()
+    else:
+        _start_flusher()
+
+
+def _cache_write(kind: str, key: str, data: Any) -> None:
+    with _cache_lock:
+        _cache[(kind, key)] = _clone(data)
+        _revisions[(kind, key)] = next(_revision_counter)
+        _pending[(kind, key)] = None
+        _name_index.pop((kind, key), None)
+    _schedule_flush()
+    _notify_change(kind, key)
+
+
+def _cache_mutate(kind: str, key: str, default: Any, fn) -> Any:
+    """Atomically run fn(doc) on a copy of the cached doc.
+
+    fn returns the list of changes it made (committed as a point update), REWRITE to
+    persist the whole document, or None to abort without writing. Returns whatever fn
+    returned.
+    """
+    dk = (kind, key)
+    _cache_load(dk)
+    with _cache_lock:
+        old = _cache_peek_locked(dk)  # MISSING: not stored (or deleted since the load)
+        doc = _clone(default) if old is MISSING else _clone(old)
+        changes = fn(doc)
+        if changes is None:
+            return None
+        _carry_name_index(dk, _cache.get(dk), doc, changes)
+        _cache[dk] = doc
+        _revisions[dk] = next(_revision_counter)
+        if changes is REWRITE:
+            _pending[dk] = None
+        elif dk in _pending and _pending[dk] is None:
+            pass  # already scheduled for a full rewrite
+        elif dk not in _pending and old is MISSING:
+            _pending[dk] = None  # first write creates the doc
+        else:
+            merged = (_pending.get(dk) or []) + list(changes)
+            _pending[dk] = merged if len(merged) <= _MAX_PENDING_CHANGES else None
+    _schedule_flush()
+    _notify_change(kind, key)
+    return changes
+
+
+# Change listeners: fn(kind, key) after a document changed or was deleted. They run on
+# whichever thread made the change (usually an I/O worker), so they must be quick and
+# hand off to their own event loop (loop.call_soon_threadsafe) for anything more.
+_change_listeners: List[Callable[[str, str], None]] = []
+
+
+def add_change_listener(fn: Callable[[str, str], None]) -> None:
+    _change_listeners.append(fn)
+
 
-# ───────────────────────────── I/O helpers ──────────────────────────────
-def _ensure_dir(path: str) -> None:
-    """Ensure the directory for a file (or the directory itself) exists."""
-    is_file = os.path.splitext(path)[1] != ""
-    directory = (os.path.dirname(path) or ".") if is_file else path
-    if not os.path.exists(directory):
-        os.makedirs(directory, exist_ok=True)
+def remove_change_listener(fn: Callable[[str, str], None]) -> None:
+    if fn in _change_listeners:
+        _change_listeners.remove(fn)
 
 
-def _safe_read_json(path: str, default: Any) -> Any:
+def _notify_change(kind: str, key: str) -> None:
+    for fn in list(_change_listeners):
+        try:
+            fn(kind, key)
+        except Exception as e:
+            print(f"[data_manager] change listener failed for {kind}:{key}: {e}")
+
+
+def _cache_has(kind: str, key: str) -> bool:
+    with _cache_lock:
+        if (kind, key) in _cache:
+            return True
+    return BACKEND.exists(kind, key)
+
+
+def _cache_delete(kind: str, key: str) -> None:
+    # Hold the flush lock so an in-flight flush can't resurrect the doc after removal.
+    with _flush_lock:
+        with _cache_lock:
+            _cache.pop((kind, key), None)
+            _revisions[(kind, key)] = next(_revision_counter)
+            _pending.pop((kind, key), None)
+            _name_index.pop((kind, key), None)
+        BACKEND.delete(kind, key)
+        with _cache_lock:
+            # A cold load that started before the file was gone must not cache it again
+            _revisions[(kind, key)] = next(_revision_counter)
+    _notify_change(kind, key)
+
+
+def _cache_keys(kind: str) -> List[str]:
+    """Stored keys of `kind` plus cached (possibly unflushed) ones."""
+    with _cache_lock:
+        names = {k for (kd, k) in _cache if kd == kind}
+    names.update(BACKEND.keys(kind))
+    return sorted(names)
+
+
+def flush() -> int:
+    """Persist every dirty document. Returns the number of documents written."""
+    with _flush_lock:
+        with _cache_lock:
+            batch = [(dk, _cache[dk], ch) for dk, ch in _pending.items() if dk in _cache]
+            _pending.clear()
+        written = 0
+        for dk, doc, changes in batch:
+            # Cached documents are never mutated in place, so serializing outside the
+            # cache lock is safe even if a newer version replaces it meanwhile.
+            try:
+                if changes is None:
+                    BACKEND.write(dk[0], dk[1], doc)
+                else:
+                    BACKEND.apply(dk[0], dk[1], doc, changes)
+                written += 1
+            except Exception as e:
+                with _cache_lock:
+                    _pending[dk] = None  # retry as a full rewrite next pass
+                print(f"[data_manager] flush failed for {dk[0]}:{dk[1]}: {e}")
+        return written
+
+
+def compact_journals() -> int:
+    """Flush, then fold every journal into its snapshot (e.g. before copying the data
+    directory). Returns the number of journals compacted."""
+    flush()
+    if not isinstance(BACKEND, JsonFileBackend):
+        return 0
+    with _flush_lock:
+        return sum(
+            BACKEND.compact(kind, key)
+            for kind in sorted(BACKEND.journal_kinds)
+            for key in BACKEND.keys(kind)
+        )
+
+
+def dirty_count() -> int:
+    with _cache_lock:
+        return len(_pending)
+
+
+def _flusher_loop() -> None:
+    while not _flusher_stop.wait(FLUSH_INTERVAL_SEC):
+        _timed(flush)
+
+
+def _start_flusher() -> None:
+    global _flusher
+    if _flusher is not None:
+        return
+    with _cache_lock:
+        if _flusher is None:
+            _flusher = threading.Thread(target=_flusher_loop, name="data-flusher", daemon=True)
+            _flusher.start()
+
+
+def shutdown() -> None:
+    """Stop the background flusher and write any pending changes."""
+    _flusher_stop.set()
+    _io_executor.shutdown(wait=True)
+    flush()
+
+
+# ───────────────────────────── Name index ───────────────────────────────
+# Casefolded item name -> position for cached list and generator documents, so lookups
+# and duplicate checks don't rescan every item. An index belongs to one cached doc object:
+# point updates that can't move or rename items carry it over to the new doc, anything
+# else (full saves, removals, moves, renames) drops it and the next lookup rebuilds it.
+# Names are matched case-insensitively everywhere; the first of duplicate names wins.
+_name_index: Dict[_DocKey, Tuple[Any, Dict[str, int]]] = {}  # dk -> (doc, index)
+_UNNAMED_CATEGORIES = ("Category", "Text", "Bullet")  # list headers, not entries
+_INDEX_SAFE_OPS = ("put", "delete", "set_meta")
+
+
+def name_key(name: Any) -> str:
+    """The form item names are compared in."""
+    return str(name).casefold()
+
+
+def _indexed_items(kind: str, doc: Any) -> List[Any]:
+    if kind == KIND_GEN:
+        return doc.get("items", []) if isinstance(doc, dict) else []
+    return doc if isinstance(doc, list) else []
+
+
+def _index_item(kind: str, index: Dict[str, int], pos: int, item: Any) -> None:
+    if not isinstance(item, dict) or "name" not in item:
+        return
+    if kind == KIND_LIST and item.get("category") in _UNNAMED_CATEGORIES:
+        return
+    index.setdefault(name_key(item["name"]), pos)
+
+
+def _name_index_locked(dk: _DocKey) -> Dict[str, int]:
+    """Index of the cached doc `dk` (caller holds _cache_lock and loaded it); empty if it
+    doesn't exist."""
+    doc = _cache_peek_locked(dk)
+    if doc is MISSING:
+        return {}
+    entry = _name_index.get(dk)
+    if entry is None or entry[0] is not doc:
+        index: Dict[str, int] = {}
+        for pos, item in enumerate(_indexed_items(dk[0], doc)):
+            _index_item(dk[0], index, pos, item)
+        entry = _name_index[dk] = (doc, index)
+    return entry[1]
+
+
+def _carry_name_index(dk: _DocKey, old: Any, new: Any, changes: Any) -> None:
+    """Move the index of `old` onto `new` if `changes` kept every indexed position valid."""
+    entry = _name_index.pop(dk, None)
+    if entry is None or entry[0] is not old or changes is REWRITE:
+        return
+    index = entry[1]
+    count = len(_indexed_items(dk[0], old))
+    for ch in changes:
+        op = ch.get("op")
+        if op == "set_field" and ch.get("field") not in ("name", "category"):
+            continue
+        if op == "add_item" and ch.get("index") == count:
+            _index_item(dk[0], index, count, ch.get("item"))
+            count += 1
+            continue
+        if op not in _INDEX_SAFE_OPS:
+            return
+    _name_index[dk] = (new, index)
+
+
+# ───────────────────────────── I/O timing ───────────────────────────────
+_io_stats: Dict[str, List[float]] = {}  # fn name -> [calls, total_sec, max_sec]
+_io_stats_lock = threading.Lock()
+
+
+def _timed(fn: Callable, *args, **kwargs) -> Any:
+    t0 = time.perf_counter()
     try:
-        if not os.path.exists(path):
-            return default
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
-        return default
+        return fn(*args, **kwargs)
+    finally:
+        dt = time.perf_counter() - t0
+        with _io_stats_lock:
+            st = _io_stats.setdefault(fn.__name__, [0, 0.0, 0.0])
+            st[0] += 1
+            st[1] += dt
+            st[2] = max(st[2], dt)
+
+
+def get_io_stats() -> Dict[str, Dict[str, float]]:
+    """Per-function storage timings: calls, total_ms, avg_ms, max_ms."""
+    with _io_stats_lock:
+        return {
+            name: {
+                "calls": int(calls),
+                "total_ms": total * 1000,
+                "avg_ms": (total / calls) * 1000 if calls else 0.0,
+                "max_ms": mx * 1000,
+            }
+            for name, (calls, total, mx) in sorted(_io_stats.items())
+        }
+
 
+def reset_io_stats() -> None:
+    with _io_stats_lock:
+        _io_stats.clear()
 
-def _safe_write_json(path: str, data: Any) -> None:
-    _ensure_dir(path)
-    tmp = f"{path}.tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
-    os.replace(tmp, path)
+
+atexit.register(shutdown)
 
 
 # --- One-time migration from old nested layout (safe & idempotent) ---
@@ -91,54 +473,237 @@ def _migrate_old_layout() -> None:
 _migrate_old_layout()
 
 
+def _make_backend() -> StorageBackend:
+    if STORAGE_BACKEND == "sqlite":
+        from storage_sqlite import SqliteBackend
+
+        backend = SqliteBackend(SQLITE_PATH, serializer=SERIALIZER)
+        backend.import_once(JSON_BACKEND)
+        return backend
+    return JSON_BACKEND
+
+
+SERIALIZER = get_serializer(DATA_FORMAT)
+JSON_BACKEND = JsonFileBackend(
+    dirs={KIND_LIST: LISTS_DIR, KIND_GEN: GEN_LISTS_DIR},
+    files={
+        KIND_DASHBOARDS: DASHBOARDS_PATH,
+        KIND_GEN_DASHBOARDS: GEN_DASHBOARDS_PATH,
+        KIND_TIMERS: TIMERS_PATH,
+        KIND_AUTOPRUNE: AUTOPRUNE_PATH,
+    },
+    journal_kinds=(
+        (KIND_GEN, KIND_DASHBOARDS, KIND_GEN_DASHBOARDS, KIND_TIMERS) if GEN_JOURNAL else ()
+    ),
+    compact_bytes=JOURNAL_COMPACT_BYTES,
+    serializer=SERIALIZER,
+)
+BACKEND = _make_backend()
+
+
 # ───────────────────────── Regular lists (non-gen) ──────────────────────
 def list_path(name: str) -> str:
     return os.path.join(LISTS_DIR, f"{name}.json")
 
 
 def list_exists(name: str) -> bool:
-    return os.path.exists(list_path(name))
+    return _cache_has(KIND_LIST, name)
 
 
 def load_list(name: str) -> List[Dict[str, Any]]:
-    return _safe_read_json(list_path(name), default=[])
+    return _cache_read(KIND_LIST, name, default=[])
 
 
 def save_list(name: str, data: List[Dict[str, Any]]) -> None:
-    _safe_write_json(list_path(name), data)
+    _cache_write(KIND_LIST, name, data)
 
 
 def delete_list(name: str) -> None:
-    p = list_path(name)
-    if os.path.exists(p):
-        os.remove(p)
+    _cache_delete(KIND_LIST, name)
 
 
 def get_all_list_names() -> List[str]:
-    _ensure_dir(LISTS_DIR)
-    names: List[str] = []
-    for fname in os.listdir(LISTS_DIR):
-        if fname.endswith(".json"):
-            names.append(fname[:-5])
-    return sorted(names)
+    return _cache_keys(KIND_LIST)
 
 
-# Regular list dashboards
-def get_dashboard_id(list_name: str) -> Optional[Tuple[int, int]]:
-    data = _safe_read_json(DASHBOARDS_PATH, default={})
-    v = data.get(list_name)
-    if isinstance(v, list) and len(v) == 2:
+# Mapping docs (dashboards, timers): single-entry updates are recorded as point changes
+def _map_put(kind: str, key: str, value: Any) -> None:
+    def _put(doc: Dict[str, Any]) -> List[Dict[str, Any]]:
+        doc[key] = value
+        return [{"op": "put", "key": key, "value": value}]
+
+    _cache_mutate(kind, "", {}, _put)
+
+
+def _map_delete(kind: str, key: str) -> bool:
+    def _delete(doc: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        if key not in doc:
+            return None
+        del doc[key]
+        return [{"op": "delete", "key": key}]
+
+    return _cache_mutate(kind, "", {}, _delete) is not None
+
+
+def _map_delete_many(kind: str, keys: List[str]) -> int:
+    """Delete several keys in one commit. Returns how many existed."""
+
+    def _delete(doc: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        gone = [key for key in keys if doc.pop(key, MISSING) is not MISSING]
+        return [{"op": "delete", "key": key} for key in gone] or None
+
+    changes = _cache_mutate(kind, "", {}, _delete)
+    return len(changes) if changes else 0
+
+
+# ──────────────────────────── Dashboard registry ─────────────────────────
+DashboardRef = Tuple[int, int]  # (channel_id, message_id)
+# (channel_id, message ids in page order); a generator dashboard can span several messages
+DashboardPages = Tuple[int, Tuple[int, ...]]
+
+
+def _dashboard_pages(v: Any) -> Optional[DashboardPages]:
+    # Stored as [channel_id, message_id, ...more pages]; one page is the original pair
+    if isinstance(v, list) and len(v) >= 2:
         try:
-            return int(v[0]), int(v[1])
+            return int(v[0]), tuple(int(m) for m in v[1:])
         except Exception:
             return None
     return None
 
 
+class DashboardRegistry:
+    """Deployed dashboards of one kind: list name -> (channel_id, message_id), plus any
+    further pages of the same dashboard (pages()).
+
+    The mapping is read from storage once and kept in memory together with reverse
+    indexes by channel and by message, so lookups never touch the document. Each change
+    is persisted as a single put/delete of the mapping (journaled on the JSON backend).
+    """
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        self._lock = threading.Lock()
+        self._by_name: Optional[Dict[str, DashboardPages]] = None
+        self._by_channel: Dict[int, Set[str]] = {}
+        self._by_message: Dict[int, str] = {}
+
+    def _load_locked(self) -> Dict[str, DashboardPages]:
+        if self._by_name is None:
+            self._by_name = {}
+            for name, v in _cache_read(self.kind, "", default={}).items():
+                ref = _dashboard_pages(v)
+                if ref is not None:
+                    self._link(name, ref)
+        return self._by_name
+
+    def _link(self, name: str, ref: DashboardPages) -> None:
+        self._by_name[name] = ref
+        self._by_channel.setdefault(ref[0], set()).add(name)
+        for message_id in ref[1]:
+            self._by_message[message_id] = name
+
+    def _unlink(self, name: str) -> Optional[DashboardPages]:
+        ref = self._by_name.pop(name, None)
+        if ref is None:
+            return None
+        names = self._by_channel.get(ref[0])
+        if names is not None:
+            names.discard(name)
+            if not names:
+                del self._by_channel[ref[0]]
+        for message_id in ref[1]:
+            if self._by_message.get(message_id) == name:
+                del self._by_message[message_id]
+        return ref
+
+    def get(self, name: str) -> Optional[DashboardRef]:
+        """(channel_id, first message_id) of the dashboard."""
+        with self._lock:
+            ref = self._load_locked().get(name)
+        return (ref[0], ref[1][0]) if ref is not None else None
+
+    def pages(self, name: str) -> Optional[DashboardPages]:
+        """(channel_id, every page's message_id in order) of the dashboard."""
+        with self._lock:
+            return self._load_locked().get(name)
+
+    def set(self, name: str, channel_id: int, message_id: int) -> None:
+        self.set_pages(name, channel_id, [message_id])
+
+    def set_pages(self, name: str, channel_id: int, message_ids: List[int]) -> None:
+        if not message_ids:
+            raise ValueError("a dashboard needs at least one message")
+        ref = (int(channel_id), tuple(int(m) for m in message_ids))
+        with self._lock:
+            by_name = self._load_locked()
+            if by_name.get(name) == ref:
+                return
+            self._unlink(name)
+            for message_id in ref[1]:
+                stale = self._by_message.get(message_id)
+                if stale is not None:
+                    self._unlink(stale)  # a message backs at most one dashboard
+                    _map_delete(self.kind, stale)
+            self._link(name, ref)
+            _map_put(self.kind, name, [ref[0], *ref[1]])
+
+    def remove(self, name: str) -> bool:
+        with self._lock:
+            self._load_locked()
+            if self._unlink(name) is None:
+                return False
+            _map_delete(self.kind, name)
+            return True
+
+    def items(self) -> List[Tuple[str, DashboardRef]]:
+        with self._lock:
+            return sorted((n, (ref[0], ref[1][0])) for n, ref in self._load_locked().items())
+
+    def by_message(self, message_id: int) -> Optional[str]:
+        """The list whose dashboard is (or has a page in) this message, if any."""
+        with self._lock:
+            self._load_locked()
+            return self._by_message.get(int(message_id))
+
+    def in_channel(self, channel_id: int) -> List[str]:
+        """Lists with a dashboard in this channel."""
+        with self._lock:
+            self._load_locked()
+            return sorted(self._by_channel.get(int(channel_id), ()))
+
+    def forget_message(self, message_id: int) -> Optional[str]:
+        """Drop the dashboard backed by a deleted message. Returns its list name."""
+        with self._lock:
+            self._load_locked()
+            name = self._by_message.get(int(message_id))
+            if name is not None:
+                self._unlink(name)
+                _map_delete(self.kind, name)
+            return name
+
+    def forget_channel(self, channel_id: int) -> List[str]:
+        """Drop every dashboard in a deleted channel. Returns their list names."""
+        with self._lock:
+            self._load_locked()
+            names = sorted(self._by_channel.get(int(channel_id), ()))
+            for name in names:
+                self._unlink(name)
+                _map_delete(self.kind, name)
+            return names
+
+
+LIST_DASHBOARDS = DashboardRegistry(KIND_DASHBOARDS)
+GEN_DASHBOARDS = DashboardRegistry(KIND_GEN_DASHBOARDS)
+
+
+# Regular list dashboards
+def get_dashboard_id(list_name: str) -> Optional[DashboardRef]:
+    return LIST_DASHBOARDS.get(list_name)
+
+
 def save_dashboard_id(list_name: str, channel_id: int, message_id: int) -> None:
-    data = _safe_read_json(DASHBOARDS_PATH, default={})
-    data[list_name] = [int(channel_id), int(message_id)]
-    _safe_write_json(DASHBOARDS_PATH, data)
+    LIST_DASHBOARDS.set(list_name, channel_id, message_id)
 
 
 # ───────────────────────────── Generator lists ──────────────────────────
@@ -147,11 +712,26 @@ def gen_path(name: str) -> str:
 
 
 def gen_list_exists(name: str) -> bool:
-    return os.path.exists(gen_path(name))
+    return _cache_has(KIND_GEN, name)
+
+
+# Generator documents carry a schema_version. Anything older is upgraded once (at startup
+# via migrate_gen_lists(), or on first touch) and from then on is read as-is.
+GEN_SCHEMA_VERSION = 2
+
+# Keys every generator item must have (older files predate the Electrical fields)
+_GEN_ITEM_DEFAULTS = {
+    "type": "Tek",
+    "name": "Unknown",
+    "element": 0,
+    "shards": 0,
+    "gas": 0,
+    "imbued": 0,
+}
 
 
 def _default_gen_doc() -> Dict[str, Any]:
-    return {"role_id": None, "items": []}
+    return {"schema_version": GEN_SCHEMA_VERSION, "role_id": None, "items": []}
 
 
 def _wrap_legacy(raw: Any) -> Dict[str, Any]:
@@ -165,15 +745,15 @@ def _wrap_legacy(raw: Any) -> Dict[str, Any]:
     return _default_gen_doc()
 
 
-def _normalize_gen_items(doc: Dict[str, Any]) -> bool:
-    """Ensure all items have the latest schema keys. Returns True if doc was changed."""
-    items = doc.get("items", [])
-    changed = False
+def _normalize_gen_items(doc: Dict[str, Any]) -> int:
+    """Ensure all items have the latest schema keys. Returns the number of items upgraded."""
+    upgraded = 0
 
     # Only keep items that are dict-like; ignore garbage gracefully
     normalized_items: List[Dict[str, Any]] = []
 
-    for it in items:
+    for it in doc.get("items", []):
+        changed = False
         if not isinstance(it, dict):
             # best-effort upgrade if it looks like [name, type, a, b]
             try:
@@ -186,61 +766,71 @@ def _normalize_gen_items(doc: Dict[str, Any]) -> bool:
                 changed = True
             except Exception:
                 # skip unknown list shapes
+                upgraded += 1
                 continue
 
         # required keys with defaults
-        if "type" not in it:
-            it["type"] = "Tek"
-            changed = True
-
-        if "name" not in it:
-            it["name"] = "Unknown"
-            changed = True
-
-        # Tek fields
-        if "element" not in it:
-            it["element"] = 0
-            changed = True
-
-        if "shards" not in it:
-            it["shards"] = 0
-            changed = True
-
-        # Electrical fields
-        if "gas" not in it:
-            it["gas"] = 0
-            changed = True
-
-        if "imbued" not in it:
-            it["imbued"] = 0
-            changed = True
+        for key, default in _GEN_ITEM_DEFAULTS.items():
+            if key not in it:
+                it[key] = default
+                changed = True
 
+        if changed:
+            upgraded += 1
         normalized_items.append(it)
 
-    # replace with normalized list
-    if normalized_items != items:
-        doc["items"] = normalized_items
-        changed = True
+    doc["items"] = normalized_items
 
     # role_id shape
     if not isinstance(doc.get("role_id", None), (int, type(None))):
         doc["role_id"] = None
-        changed = True
 
-    return changed
+    return upgraded
 
 
-def _load_gen_doc(name: str) -> Dict[str, Any]:
-    raw = _safe_read_json(gen_path(name), default=_default_gen_doc())
+def _is_current_gen_doc(raw: Any) -> bool:
+    return isinstance(raw, dict) and raw.get("schema_version", 1) >= GEN_SCHEMA_VERSION
+
+
+def _upgrade_gen_doc(raw: Any) -> Tuple[Dict[str, Any], int]:
+    """Wrap/normalize an older generator document. Returns (doc, items upgraded)."""
     doc = _wrap_legacy(raw)
-    # Normalize / migrate items so older files pick up new fields
-    if _normalize_gen_items(doc):
-        _safe_write_json(gen_path(name), doc)
+    upgraded = _normalize_gen_items(doc)
+    doc["schema_version"] = GEN_SCHEMA_VERSION
+    return doc, upgraded
+
+
+def _load_gen_doc(name: str) -> Dict[str, Any]:
+    raw = _cache_read(KIND_GEN, name, default=MISSING)
+    if raw is MISSING:
+        return _default_gen_doc()
+    if _is_current_gen_doc(raw):
+        return raw
+    # Older document: upgrade once and persist so later reads skip this path
+    doc, _ = _upgrade_gen_doc(raw)
+    _cache_write(KIND_GEN, name, doc)
     return doc
 
 
+def migrate_gen_lists() -> Dict[str, int]:
+    """Upgrade every stored generator list to GEN_SCHEMA_VERSION.
+
+    Returns {"files": lists upgraded, "items": generator entries upgraded}.
+    """
+    files = items = 0
+    for name in get_all_gen_list_names():
+        raw = _cache_read(KIND_GEN, name, default=MISSING)
+        if raw is MISSING or _is_current_gen_doc(raw):
+            continue
+        doc, upgraded = _upgrade_gen_doc(raw)
+        _cache_write(KIND_GEN, name, doc)
+        files += 1
+        items += upgraded
+    return {"files": files, "items": items}
+
+
 def _save_gen_doc(name: str, doc: Dict[str, Any]) -> None:
-    _safe_write_json(gen_path(name), doc)
+    _cache_write(KIND_GEN, name, doc)
 
 
 def load_gen_list(name: str) -> List[Dict[str, Any]]:
@@ -249,28 +839,80 @@ def load_gen_list(name: str) -> List[Dict[str, Any]]:
 
 
 def save_gen_list(name: str, items: List[Dict[str, Any]]) -> None:
-    doc = _load_gen_doc(name)
-    doc["items"] = items
-    _save_gen_doc(name, doc)
+    """Replace a list's items, persisting only what changed when the diff is simple."""
+    new_items = _clone(items)
+    exists = gen_list_exists(name)
+    _ensure_current_gen_doc(name)
+
+    def _save(doc: Dict[str, Any]) -> Any:
+        if not exists:
+            doc["items"] = new_items
+            return REWRITE
+        changes = _gen_item_changes(doc.get("items", []), new_items)
+        if changes == []:
+            return None  # nothing to write
+        doc["items"] = new_items
+        return REWRITE if changes is None else changes
+
+    _cache_mutate(KIND_GEN, name, _default_gen_doc(), _save)
+
+
+def _gen_item_changes(
+    old: List[Dict[str, Any]], new: List[Dict[str, Any]]
+) -> Optional[List[Dict[str, Any]]]:
+    """Changes turning `old` into `new` (see storage.apply_changes), or None if a full
+    rewrite is simpler. Covers what the commands do: field edits, append, remove, move."""
+    n_old, n_new = len(old), len(new)
+    if n_new > n_old and old == new[:n_old]:
+        return [{"op": "add_item", "index": i, "item": new[i]} for i in range(n_old, n_new)]
+    if n_new == n_old - 1:
+        i = next((i for i in range(n_new) if old[i] != new[i]), n_new)
+        return [{"op": "remove_item", "index": i}] if old[i + 1 :] == new[i:] else None
+    if n_new != n_old:
+        return None
+
+    touched = [i for i in range(n_new) if old[i] != new[i]]
+    if len(touched) > 1:
+        order = _gen_item_permutation(old, new)
+        if order is not None:
+            return [{"op": "reorder", "order": order}]
+
+    changes: List[Dict[str, Any]] = []
+    for i in touched:
+        a, b = old[i], new[i]
+        if a.keys() != b.keys():
+            changes.append({"op": "set_item", "index": i, "item": b})
+            continue
+        changes.extend(
+            {"op": "set_field", "index": i, "field": f, "value": v}
+            for f, v in b.items()
+            if a[f] != v
+        )
+    return changes if len(changes) <= 2 * max(n_new, 1) else None
+
+
+def _gen_item_permutation(
+    old: List[Dict[str, Any]], new: List[Dict[str, Any]]
+) -> Optional[List[int]]:
+    """Old indices in their new order if `new` is a reordering of `old`."""
+    unused = list(range(len(old)))
+    order = []
+    for b in new:
+        j = next((j for j in unused if old[j] == b), None)
+        if j is None:
+            return None
+        unused.remove(j)
+        order.append(j)
+    return order
 
 
 def delete_gen_list(name: str) -> None:
-    p = gen_path(name)
-    if os.path.exists(p):
-        os.remove(p)
-    data = _safe_read_json(GEN_DASHBOARDS_PATH, default={})
-    if name in data:
-        del data[name]
-        _safe_write_json(GEN_DASHBOARDS_PATH, data)
+    _cache_delete(KIND_GEN, name)
+    GEN_DASHBOARDS.remove(name)
 
 
 def get_all_gen_list_names() -> List[str]:
-    _ensure_dir(GEN_LISTS_DIR)
-    names: List[str] = []
-    for fname in os.listdir(GEN_LISTS_DIR):
-        if fname.endswith(".json"):
-            names.append(fname[:-5])
-    return sorted(names)
+    return _cache_keys(KIND_GEN)
 
 
 def add_to_gen_list(
@@ -283,8 +925,15 @@ def add_to_gen_list(
     imbued: int,
 ) -> None:
     """Add a generator entry; initialize timestamp and alert flags."""
-    doc = _load_gen_doc(list_name)
-    items = doc.get("items", [])
+    items = load_gen_list(list_name)
+    items.append(new_gen_item(gen_name, gtype, element, shards, gas, imbued))
+    save_gen_list(list_name, items)
+
+
+def new_gen_item(
+    gen_name: str, gtype: str, element: int, shards: int, gas: int, imbued: int
+) -> Dict[str, Any]:
+    """A fresh generator entry (fueled now, alerts cleared)."""
     now = time.time()
 
     if gtype == "Tek":
@@ -315,21 +964,19 @@ def add_to_gen_list(
             "alerts_muted": False,
             "notes": "",
         }
-
-    items.append(item)
-    doc["items"] = items
-    _save_gen_doc(list_name, doc)
+    return item
 
 
 def set_gen_list_role(list_name: str, role_id: int) -> None:
-    doc = _load_gen_doc(list_name)
-    doc["role_id"] = int(role_id)
-    _save_gen_doc(list_name, doc)
+    _set_gen_meta(list_name, "role_id", int(role_id))
 
 
 def get_gen_list_role(list_name: str) -> Optional[int]:
-    doc = _load_gen_doc(list_name)
-    rid = doc.get("role_id")
+    doc = _current_gen_doc(list_name)
+    return None if doc is MISSING else _role_id(doc.get("role_id"))
+
+
+def _role_id(rid: Any) -> Optional[int]:
     try:
         return int(rid) if rid is not None else None
     except Exception:
@@ -337,99 +984,531 @@ def get_gen_list_role(list_name: str) -> Optional[int]:
 
 
 # Generator dashboards (message/channel mapping for gen dashboards)
-def get_gen_dashboard_id(list_name: str) -> Optional[Tuple[int, int]]:
-    data = _safe_read_json(GEN_DASHBOARDS_PATH, default={})
-    v = data.get(list_name)
-    if isinstance(v, list) and len(v) == 2:
-        try:
-            return int(v[0]), int(v[1])
-        except Exception:
-            return None
-    return None
+def get_gen_dashboard_id(list_name: str) -> Optional[DashboardRef]:
+    return GEN_DASHBOARDS.get(list_name)
 
 
 def save_gen_dashboard_id(list_name: str, channel_id: int, message_id: int) -> None:
-    data = _safe_read_json(GEN_DASHBOARDS_PATH, default={})
-    data[list_name] = [int(channel_id), int(message_id)]
-    _safe_write_json(GEN_DASHBOARDS_PATH, data)
+    GEN_DASHBOARDS.set(list_name, channel_id, message_id)
+
+
+def get_gen_dashboard_pages(list_name: str) -> Optional[DashboardPages]:
+    return GEN_DASHBOARDS.pages(list_name)
+
+
+def save_gen_dashboard_pages(list_name: str, channel_id: int, message_ids: List[int]) -> None:
+    GEN_DASHBOARDS.set_pages(list_name, channel_id, message_ids)
 
 
 # ─────────────────────────── Per-item helpers ────────────────────────────
+def _ensure_current_gen_doc(list_name: str) -> None:
+    """Load the doc, upgrading it first if it predates GEN_SCHEMA_VERSION (items may move)."""
+    _current_gen_doc(list_name)
+
+
+def _current_gen_doc(list_name: str) -> Any:
+    """The cached doc at GEN_SCHEMA_VERSION (read-only), or MISSING."""
+    raw = _cache_load((KIND_GEN, list_name))
+    if raw is MISSING or _is_current_gen_doc(raw):
+        return raw
+    _load_gen_doc(list_name)
+    return _cache_load((KIND_GEN, list_name))
+
+
+def gen_item_index(list_name: str, gen_name: str) -> Optional[int]:
+    """Position of a generator by name (case-insensitive), or None.
+
+    Valid for the items as currently stored, e.g. at the top of a gen_doc() transaction.
+    """
+    _ensure_current_gen_doc(list_name)
+    with _cache_lock:
+        return _name_index_locked((KIND_GEN, list_name)).get(name_key(gen_name))
+
+
+def list_entry_index(list_name: str, entry_name: str) -> Optional[int]:
+    """Position of a named entry (not a Category/Text/Bullet line) by name, or None.
+
+    Valid for the entries as currently stored, e.g. at the top of a list_doc() transaction.
+    """
+    _cache_load((KIND_LIST, list_name))
+    with _cache_lock:
+        return _name_index_locked((KIND_LIST, list_name)).get(name_key(entry_name))
+
+
 def _find_gen_item(
-    doc: Dict[str, Any], gen_name: str
+    list_name: str, doc: Dict[str, Any], gen_name: str
 ) -> Tuple[Optional[int], Optional[Dict[str, Any]]]:
-    items = doc.get("items", [])
-    for idx, it in enumerate(items):
-        if it.get("name", "").lower() == gen_name.lower():
-            return idx, it
-    return None, None
+    """Look up a generator in `doc`, the cached doc or a copy of it (caller holds _cache_lock)."""
+    idx = _name_index_locked((KIND_GEN, list_name)).get(name_key(gen_name))
+    if idx is None:
+        return None, None
+    return idx, doc["items"][idx]
+
+
+def _get_gen_item_field(list_name: str, gen_name: str, field: str, default: Any) -> Any:
+    """A generator's field, or MISSING if there is no such generator."""
+    _ensure_current_gen_doc(list_name)
+    with _cache_lock:
+        doc = _cache_peek_locked((KIND_GEN, list_name))
+        if doc is MISSING:
+            return MISSING
+        _, it = _find_gen_item(list_name, doc, gen_name)
+        return MISSING if it is None else _clone(it.get(field, default))
 
 
 def get_gen_item_notes(list_name: str, gen_name: str) -> Optional[str]:
-    doc = _load_gen_doc(list_name)
-    _, it = _find_gen_item(doc, gen_name)
-    return None if it is None else it.get("notes", "")
+    notes = _get_gen_item_field(list_name, gen_name, "notes", "")
+    return None if notes is MISSING else notes
+
+
+def _set_gen_item_field(list_name: str, gen_name: str, field: str, value: Any) -> bool:
+    """Point update of one generator; persisted as a single-item change."""
+    _ensure_current_gen_doc(list_name)
+
+    def _set(doc: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        idx, it = _find_gen_item(list_name, doc, gen_name)
+        if it is None:
+            return None
+        it[field] = value
+        return [{"op": "set_field", "index": idx, "field": field, "value": value}]
+
+    return _cache_mutate(KIND_GEN, list_name, _default_gen_doc(), _set) is not None
+
+
+def _set_gen_meta(list_name: str, field: str, value: Any) -> None:
+    _ensure_current_gen_doc(list_name)
+
+    def _set(doc: Dict[str, Any]) -> List[Dict[str, Any]]:
+        doc[field] = value
+        return [{"op": "set_meta", "field": field, "value": value}]
+
+    _cache_mutate(KIND_GEN, list_name, _default_gen_doc(), _set)
 
 
 def set_gen_item_notes(list_name: str, gen_name: str, notes: str) -> bool:
-    doc = _load_gen_doc(list_name)
-    idx, it = _find_gen_item(doc, gen_name)
-    if it is None:
-        return False
-    it["notes"] = str(notes)
-    doc["items"][idx] = it
-    _save_gen_doc(list_name, doc)
-    return True
+    return _set_gen_item_field(list_name, gen_name, "notes", str(notes))
 
 
 def get_gen_item_alerts_muted(list_name: str, gen_name: str) -> Optional[bool]:
-    doc = _load_gen_doc(list_name)
-    _, it = _find_gen_item(doc, gen_name)
-    return None if it is None else bool(it.get("alerts_muted", False))
+    muted = _get_gen_item_field(list_name, gen_name, "alerts_muted", False)
+    return None if muted is MISSING else bool(muted)
 
 
 def set_gen_item_alerts_muted(list_name: str, gen_name: str, muted: bool) -> bool:
-    doc = _load_gen_doc(list_name)
-    idx, it = _find_gen_item(doc, gen_name)
-    if it is None:
-        return False
-    it["alerts_muted"] = bool(muted)
-    doc["items"][idx] = it
-    _save_gen_doc(list_name, doc)
-    return True
+    return _set_gen_item_field(list_name, gen_name, "alerts_muted", bool(muted))
+
+
+# ──────────────────────────── Generator snapshot ─────────────────────────
+# Everything the refresh loop needs for every generator list, in one pass. An entry is
+# copied out of the cached document once and handed out again on later passes until that
+# list is saved (each save replaces the cached doc object), so a quiet tick copies
+# nothing. Entries are shared between passes: treat them as read-only.
+_gen_snapshot: Dict[str, Tuple[Any, Dict[str, Any]]] = {}  # name -> (cached doc, entry)
+
+
+def load_gen_snapshot(name: str) -> Optional[Dict[str, Any]]:
+    """One list's load_all_gen_docs() entry, or None if the list doesn't exist."""
+    _ensure_current_gen_doc(name)
+    with _cache_lock:
+        doc = _cache_peek_locked((KIND_GEN, name))
+        if doc is MISSING:
+            _gen_snapshot.pop(name, None)
+            return None
+        prev = _gen_snapshot.get(name)
+        if prev is not None and prev[0] is doc:
+            entry = prev[1]
+        else:
+            entry = {
+                "items": _clone(doc.get("items", [])),
+                "role_id": _role_id(doc.get("role_id")),
+                "revision": _revisions.get((KIND_GEN, name), 0),
+            }
+            _gen_snapshot[name] = (doc, entry)
+    return dict(entry, dashboard=GEN_DASHBOARDS.get(name), pages=GEN_DASHBOARDS.pages(name))
+
+
+def load_all_gen_docs() -> Dict[str, Dict[str, Any]]:
+    """{list name: {"items": [...], "role_id": int | None, "revision": int,
+    "dashboard": (channel_id, message_id) | None, "pages": (channel_id, (message_id,
+    ...)) | None}} for every generator list.
+
+    "revision" is doc_revision() of the list: equal revisions mean equal items and role.
+    """
+    snapshot: Dict[str, Dict[str, Any]] = {}
+    for name in get_all_gen_list_names():
+        entry = load_gen_snapshot(name)
+        if entry is not None:
+            snapshot[name] = entry
+    with _cache_lock:
+        for name in set(_gen_snapshot) - set(snapshot):
+            del _gen_snapshot[name]  # list was deleted
+    return snapshot
 
 
 # ─────────────────────────────── Timers API ─────────────────────────────
 def load_timers() -> Dict[str, Any]:
-    return _safe_read_json(TIMERS_PATH, default={})
+    return _cache_read(KIND_TIMERS, "", default={})
 
 
 def save_timers(data: Dict[str, Any]) -> None:
-    _safe_write_json(TIMERS_PATH, data)
+    _cache_write(KIND_TIMERS, "", data)
+    TIMERS.reset()
 
 
 def add_timer(timer_id: str, timer_data: Dict[str, Any]) -> None:
-    timers = load_timers()
-    timers[timer_id] = timer_data
-    save_timers(timers)
+    TIMERS.put(timer_id, timer_data)
 
 
 def remove_timer(timer_id: str) -> None:
-    timers = load_timers()
-    if timer_id in timers:
-        del timers[timer_id]
-        save_timers(timers)
+    TIMERS.remove(timer_id)
+
+
+TimerMatch = Callable[[Dict[str, Any]], bool]
+
+
+def timer_scope(guild_id: Optional[int]) -> int:
+    """Timers are named per guild; 0 holds DM timers and ones saved before guild_id was."""
+    return int(guild_id or 0)
+
+
+class TimerStore:
+    """Timers by id, indexed by (guild, casefolded name), by channel and by owner.
+
+    Like DashboardRegistry, the mapping is read once and kept in memory with its indexes,
+    so name lookups and autocomplete never scan every timer, and each change is persisted
+    as a single put/delete of one timer. Lookups in a guild also see the unscoped (0)
+    timers. Returned timers are copies; change them through put()/update().
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_id: Optional[Dict[str, Dict[str, Any]]] = None
+        self._by_name: Dict[Tuple[int, str], Dict[str, None]] = {}  # ordered set of ids
+        self._by_channel: Dict[int, Set[str]] = {}
+        self._by_owner: Dict[int, Set[str]] = {}
+        self._expired: Set[str] = set()
+
+    def reset(self) -> None:
+        """Forget the indexes (the whole mapping was replaced); rebuilt on next use."""
+        with self._lock:
+            self._by_id = None
+            self._by_name, self._by_channel, self._by_owner = {}, {}, {}
+            self._expired = set()
+
+    def _load_locked(self) -> Dict[str, Dict[str, Any]]:
+        if self._by_id is None:
+            self._by_id = {}
+            for tid, data in _cache_read(KIND_TIMERS, "", default={}).items():
+                if isinstance(data, dict):
+                    self._link(tid, data)
+        return self._by_id
+
+    def _link(self, tid: str, data: Dict[str, Any]) -> None:
+        self._by_id[tid] = data
+        key = (timer_scope(data.get("guild_id")), name_key(data.get("name", "")))
+        self._by_name.setdefault(key, {})[tid] = None
+        if data.get("channel_id"):
+            self._by_channel.setdefault(int(data["channel_id"]), set()).add(tid)
+        if data.get("owner_id"):
+            self._by_owner.setdefault(int(data["owner_id"]), set()).add(tid)
+        if data.get("expired"):
+            self._expired.add(tid)
+
+    def _unlink(self, tid: str) -> Optional[Dict[str, Any]]:
+        data = self._by_id.pop(tid, None)
+        if data is None:
+            return None
+        self._expired.discard(tid)
+        key = (timer_scope(data.get("guild_id")), name_key(data.get("name", "")))
+        for index, k in (
+            (self._by_name, key),
+            (self._by_channel, int(data.get("channel_id") or 0)),
+            (self._by_owner, int(data.get("owner_id") or 0)),
+        ):
+            ids = index.get(k)
+            if ids is not None:
+                if isinstance(ids, set):
+                    ids.discard(tid)
+                else:
+                    ids.pop(tid, None)
+                if not ids:
+                    del index[k]
+        return data
+
+    def _named_locked(self, guild_id: Optional[int], name: str) -> List[str]:
+        self._load_locked()
+        ids = list(self._by_name.get((timer_scope(guild_id), name_key(name)), ()))
+        if timer_scope(guild_id):
+            ids += self._by_name.get((0, name_key(name)), ())
+        return ids
+
+    def get(self, tid: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            data = self._load_locked().get(tid)
+            return _clone(data) if data is not None else None
+
+    def find(
+        self, guild_id: Optional[int], name: str, match: Optional[TimerMatch] = None
+    ) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """First timer with this name (case-insensitive) in the guild that `match` accepts."""
+        with self._lock:
+            for tid in self._named_locked(guild_id, name):
+                data = self._by_id[tid]
+                if match is None or match(data):
+                    return tid, _clone(data)
+        return None
+
+    def put(self, tid: str, data: Dict[str, Any]) -> None:
+        data = _clone(data)
+        with self._lock:
+            self._load_locked()
+            self._unlink(tid)
+            self._link(tid, data)
+            _map_put(KIND_TIMERS, tid, data)
+
+    def update(self, tid: str, fn: Callable[[Dict[str, Any]], Any]) -> Optional[Dict[str, Any]]:
+        """Apply fn to a copy of the timer and store it, unless fn returns False.
+        Returns the stored timer, or None if there is no such timer or fn declined."""
+        with self._lock:
+            data = self._load_locked().get(tid)
+            return None if data is None else self._update_locked(tid, data, fn)
+
+    def _update_locked(
+        self, tid: str, data: Dict[str, Any], fn: Callable[[Dict[str, Any]], Any]
+    ) -> Optional[Dict[str, Any]]:
+        data = _clone(data)
+        if fn(data) is False:
+            return None
+        self._unlink(tid)
+        self._link(tid, data)
+        _map_put(KIND_TIMERS, tid, data)
+        return _clone(data)
+
+    def update_named(
+        self,
+        guild_id: Optional[int],
+        name: str,
+        fn: Callable[[Dict[str, Any]], Any],
+        match: Optional[TimerMatch] = None,
+    ) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """find() and update() in one step. Returns (timer id, stored timer) or None."""
+        with self._lock:
+            for tid in self._named_locked(guild_id, name):
+                data = self._by_id[tid]
+                if match is None or match(data):
+                    data = self._update_locked(tid, data, fn)
+                    return (tid, data) if data is not None else None
+        return None
+
+    def remove(self, tid: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._load_locked()
+            data = self._unlink(tid)
+            if data is not None:
+                _map_delete(KIND_TIMERS, tid)
+            return data
+
+    def remove_named(
+        self, guild_id: Optional[int], name: str, match: Optional[TimerMatch] = None
+    ) -> Optional[Tuple[str, Dict[str, Any]]]:
+        with self._lock:
+            for tid in self._named_locked(guild_id, name):
+                if match is None or match(self._by_id[tid]):
+                    data = self._unlink(tid)
+                    _map_delete(KIND_TIMERS, tid)
+                    return tid, data
+        return None
+
+    def names(
+        self,
+        guild_id: Optional[int],
+        prefix: str = "",
+        owner_id: Optional[int] = None,
+        limit: int = 25,
+    ) -> List[str]:
+        """Distinct timer names in the guild starting with `prefix` (case-insensitive),
+        `owner_id`'s own timers first, for autocomplete."""
+        scopes = {0, timer_scope(guild_id)}
+        prefix = name_key(prefix)
+        with self._lock:
+            self._load_locked()
+            mine = self._by_owner.get(int(owner_id or 0), set())
+            found: Dict[str, Tuple[bool, str]] = {}
+            for (scope, key), ids in self._by_name.items():
+                if scope in scopes and key.startswith(prefix):
+                    own = any(tid in mine for tid in ids)
+                    name = self._by_id[next(iter(ids))].get("name", "")
+                    if key not in found or own:
+                        found[key] = (not own, name)
+        return [name for _, name in sorted(found.values())[:limit]]
+
+    def in_channel(self, channel_id: int) -> List[str]:
+        with self._lock:
+            self._load_locked()
+            return sorted(self._by_channel.get(int(channel_id), ()))
+
+    def of_owner(self, owner_id: int) -> List[str]:
+        with self._lock:
+            self._load_locked()
+            return sorted(self._by_owner.get(int(owner_id), ()))
+
+    def expired_count(self) -> int:
+        with self._lock:
+            self._load_locked()
+            return len(self._expired)
+
+    def expired_before(self, before: float, keep: int) -> List[Tuple[str, Dict[str, Any]]]:
+        """Expired timers that ended before `before`, plus the oldest expired ones beyond
+        the newest `keep`, oldest first."""
+        with self._lock:
+            self._load_locked()
+            ended = sorted(
+                (float(self._by_id[tid].get("end_time", 0)), tid) for tid in self._expired
+            )
+            cut = max(len(ended) - max(keep, 0), 0)
+            return [
+                (tid, _clone(self._by_id[tid]))
+                for i, (end, tid) in enumerate(ended)
+                if i < cut or end < before
+            ]
+
+    def remove_expired(self, tids: List[str]) -> List[Tuple[str, Dict[str, Any]]]:
+        """Drop these timers in one write, skipping any that are no longer expired (e.g.
+        re-armed meanwhile). Returns the (id, timer) pairs actually removed."""
+        with self._lock:
+            self._load_locked()
+            gone = [(tid, self._unlink(tid)) for tid in tids if tid in self._expired]
+            if gone:
+                _map_delete_many(KIND_TIMERS, [tid for tid, _ in gone])
+            return gone
+
+    def remove_channel(self, channel_id: int) -> List[str]:
+        """Drop every timer posted in a deleted channel. Returns their ids."""
+        with self._lock:
+            self._load_locked()
+            tids = sorted(self._by_channel.get(int(channel_id), ()))
+            for tid in tids:
+                self._unlink(tid)
+                _map_delete(KIND_TIMERS, tid)
+            return tids
+
+
+TIMERS = TimerStore()
+
+
+def get_timer(timer_id: str) -> Optional[Dict[str, Any]]:
+    return TIMERS.get(timer_id)
+
+
+def find_timer(
+    guild_id: Optional[int], name: str, match: Optional[TimerMatch] = None
+) -> Optional[Tuple[str, Dict[str, Any]]]:
+    return TIMERS.find(guild_id, name, match)
+
+
+def put_timer(timer_id: str, timer_data: Dict[str, Any]) -> None:
+    TIMERS.put(timer_id, timer_data)
+
+
+def update_timer(timer_id: str, fn: Callable[[Dict[str, Any]], Any]) -> Optional[Dict[str, Any]]:
+    return TIMERS.update(timer_id, fn)
+
+
+def update_named_timer(
+    guild_id: Optional[int],
+    name: str,
+    fn: Callable[[Dict[str, Any]], Any],
+    match: Optional[TimerMatch] = None,
+) -> Optional[Tuple[str, Dict[str, Any]]]:
+    return TIMERS.update_named(guild_id, name, fn, match)
+
+
+def remove_named_timer(
+    guild_id: Optional[int], name: str, match: Optional[TimerMatch] = None
+) -> Optional[Tuple[str, Dict[str, Any]]]:
+    return TIMERS.remove_named(guild_id, name, match)
+
+
+def timer_names(
+    guild_id: Optional[int], prefix: str = "", owner_id: Optional[int] = None, limit: int = 25
+) -> List[str]:
+    return TIMERS.names(guild_id, prefix, owner_id, limit)
+
+
+def remove_channel_timers(channel_id: int) -> List[str]:
+    return TIMERS.remove_channel(channel_id)
+
+
+def count_expired_timers() -> int:
+    return TIMERS.expired_count()
+
+
+# ─────────────────────────────── Timer archive ─────────────────────────────
+_archive_lock = threading.Lock()
+
+
+def _stat_day(ts: Any) -> Optional[str]:
+    try:
+        return time.strftime("%Y-%m-%d", time.gmtime(float(ts)))
+    except (TypeError, ValueError):
+        return None
+
+
+def archive_expired_timers(
+    grace_sec: float, keep_expired: int, stats: bool = True, now: Optional[float] = None
+) -> int:
+    """Move expired timers out of the hot mapping into TIMERS_ARCHIVE_PATH.
+
+    A timer goes once it ended more than `grace_sec` ago, or earlier when more than
+    `keep_expired` expired timers are held (oldest first). Timers are removed first and
+    only those actually removed (still expired) are appended, one line each, as
+    {"id", "archived_at", **timer}. With `stats`, archived timers are counted in
+    TIMER_STATS_PATH as {guild: {UTC day: {"created", "expired"}}}.
+    Returns how many timers were moved.
+    """
+    now = time.time() if now is None else now
+    with _archive_lock:
+        due = TIMERS.expired_before(now - grace_sec, keep_expired)
+        moved = TIMERS.remove_expired([tid for tid, _ in due]) if due else []
+        if not moved:
+            return 0
+        _ensure_dir(TIMERS_ARCHIVE_PATH)
+        with open(TIMERS_ARCHIVE_PATH, "a", encoding="utf-8") as f:
+            f.writelines(
+                json_line({"id": tid, "archived_at": int(now), **data}) + "\n"
+                for tid, data in moved
+            )
+        if stats:
+            doc = _safe_read_doc(TIMER_STATS_PATH, {})
+            for _, data in moved:
+                guild = doc.setdefault(str(timer_scope(data.get("guild_id"))), {})
+                for field, ts in (
+                    ("created", data.get("created_at")),
+                    ("expired", data.get("end_time")),
+                ):
+                    day = _stat_day(ts)
+                    if day is not None:
+                        counts = guild.setdefault(day, {"created": 0, "expired": 0})
+                        counts[field] += 1
+            _safe_write_doc(TIMER_STATS_PATH, doc)
+        return len(moved)
+
+
+def load_timer_stats() -> Dict[str, Dict[str, Dict[str, int]]]:
+    """{guild id: {UTC day: {"created": n, "expired": n}}} of archived timers."""
+    with _archive_lock:
+        return _safe_read_doc(TIMER_STATS_PATH, {})
 
 
 # ─────────────────────────────── Auto-prune API ────────────────────────────
 # Stores per-guild channel settings for scheduled pruning that keeps only the
 # latest N messages (optionally excluding pinned messages).
 def load_autoprune() -> Dict[str, Any]:
-    return _safe_read_json(AUTOPRUNE_PATH, default={"guilds": {}})
+    return _cache_read(KIND_AUTOPRUNE, "", default={"guilds": {}})
 
 
 def save_autoprune(data: Dict[str, Any]) -> None:
-    _safe_write_json(AUTOPRUNE_PATH, data)
+    _cache_write(KIND_AUTOPRUNE, "", data)
 
 
 def get_autoprune_channels(guild_id: int) -> Dict[str, Any]:
@@ -473,3 +1552,156 @@ def remove_autoprune_channel(guild_id: int, channel_id: int) -> bool:
         save_autoprune(doc)
         return True
     return False
+
+
+# ───────────────────────────── Async facade ─────────────────────────────
+# Coroutine twins of the functions above for use from cogs. Each call runs on a
+# bounded thread pool so a slow volume never blocks the event loop (and with it the
+# gateway heartbeat), and its duration is recorded in get_io_stats().
+_io_executor = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="data-io")
+
+
+async def run_io(fn: Callable, *args, **kwargs) -> Any:
+    """Run a blocking storage call on the I/O pool and time it."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_io_executor, functools.partial(_timed, fn, *args, **kwargs))
+
+
+def _async_twin(fn: Callable, lock_kind: Optional[str] = None) -> Callable:
+    """Awaitable version of fn. Mutators pass lock_kind so they wait for open transactions
+    on the same document (named kinds: the first argument is the document key)."""
+    if lock_kind is None:
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            return await run_io(fn, *args, **kwargs)
+
+    else:
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            key = args[0] if lock_kind in NAMED_KINDS else ""
+            async with doc_lock(lock_kind, key):
+                return await run_io(fn, *args, **kwargs)
+
+    wrapper.__name__ = wrapper.__qualname__ = f"a{fn.__name__}"
+    return wrapper
+
+
+# Regular lists
+alist_exists = _async_twin(list_exists)
+aload_list = _async_twin(load_list)
+asave_list = _async_twin(save_list, KIND_LIST)
+adelete_list = _async_twin(delete_list, KIND_LIST)
+aget_all_list_names = _async_twin(get_all_list_names)
+aget_dashboard_id = _async_twin(get_dashboard_id)
+alist_entry_index = _async_twin(list_entry_index)
+asave_dashboard_id = _async_twin(save_dashboard_id)
+
+# Generator lists
+agen_list_exists = _async_twin(gen_list_exists)
+agen_item_index = _async_twin(gen_item_index)
+aload_gen_list = _async_twin(load_gen_list)
+asave_gen_list = _async_twin(save_gen_list, KIND_GEN)
+adelete_gen_list = _async_twin(delete_gen_list, KIND_GEN)
+aget_all_gen_list_names = _async_twin(get_all_gen_list_names)
+aadd_to_gen_list = _async_twin(add_to_gen_list, KIND_GEN)
+aset_gen_list_role = _async_twin(set_gen_list_role, KIND_GEN)
+aget_gen_list_role = _async_twin(get_gen_list_role)
+aget_gen_dashboard_id = _async_twin(get_gen_dashboard_id)
+aload_all_gen_docs = _async_twin(load_all_gen_docs)
+aload_gen_snapshot = _async_twin(load_gen_snapshot)
+asave_gen_dashboard_id = _async_twin(save_gen_dashboard_id)
+aget_gen_dashboard_pages = _async_twin(get_gen_dashboard_pages)
+asave_gen_dashboard_pages = _async_twin(save_gen_dashboard_pages)
+aset_gen_item_notes = _async_twin(set_gen_item_notes, KIND_GEN)
+aset_gen_item_alerts_muted = _async_twin(set_gen_item_alerts_muted, KIND_GEN)
+amigrate_gen_lists = _async_twin(migrate_gen_lists)
+
+# Timers
+aload_timers = _async_twin(load_timers)
+asave_timers = _async_twin(save_timers, KIND_TIMERS)
+aadd_timer = _async_twin(add_timer, KIND_TIMERS)
+aremove_timer = _async_twin(remove_timer, KIND_TIMERS)
+aget_timer = _async_twin(get_timer)
+afind_timer = _async_twin(find_timer)
+aput_timer = _async_twin(put_timer, KIND_TIMERS)
+aupdate_timer = _async_twin(update_timer, KIND_TIMERS)
+aupdate_named_timer = _async_twin(update_named_timer, KIND_TIMERS)
+aremove_named_timer = _async_twin(remove_named_timer, KIND_TIMERS)
+atimer_names = _async_twin(timer_names)
+aremove_channel_timers = _async_twin(remove_channel_timers, KIND_TIMERS)
+acount_expired_timers = _async_twin(count_expired_timers)
+aarchive_expired_timers = _async_twin(archive_expired_timers, KIND_TIMERS)
+aload_timer_stats = _async_twin(load_timer_stats)
+
+# Auto-prune
+aget_autoprune_channels = _async_twin(get_autoprune_channels)
+aset_autoprune_channel = _async_twin(set_autoprune_channel, KIND_AUTOPRUNE)
+aremove_autoprune_channel = _async_twin(remove_autoprune_channel, KIND_AUTOPRUNE)
+
+# Flush
+aflush = _async_twin(flush)
+acompact_journals = _async_twin(compact_journals)
+
+
+# ───────────────────────────── Transactions ─────────────────────────────
+# Read-modify-write of one document under that document's asyncio.Lock:
+#
+#     async with data_manager.gen_doc(name) as items:
+#         if items is None:
+#             ...  # list does not exist
+#         items[0]["alerted_low"] = True
+#
+# The block gets a private copy; it is saved on normal exit if it changed and dropped if
+# the block raises. Locks are per document, so other lists are never held up. The locked
+# async twins (asave_gen_list, aset_gen_item_alerts_muted, ...) take the same lock; they
+# must not be awaited for the same document inside its transaction (locks aren't re-entrant).
+# agen_item_index()/alist_entry_index() answer for the stored items, so await them before
+# moving anything in the block. They take no document lock, so they are safe inside it;
+# like every twin they run on the I/O pool, since the cache lock they need is also held
+# by workers doing disk I/O.
+_doc_locks: "weakref.WeakValueDictionary[_DocKey, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+
+def doc_lock(kind: str, key: str = "") -> asyncio.Lock:
+    """The event-loop lock guarding one document (created on demand, dropped when unused)."""
+    dk = (kind, key)
+    lock = _doc_locks.get(dk)
+    if lock is None:
+        lock = asyncio.Lock()
+        _doc_locks[dk] = lock
+    return lock
+
+
+def _load_list_if_exists(name: str) -> Optional[List[Dict[str, Any]]]:
+    return load_list(name) if list_exists(name) else None
+
+
+def _load_gen_list_if_exists(name: str) -> Optional[List[Dict[str, Any]]]:
+    return load_gen_list(name) if gen_list_exists(name) else None
+
+
+@contextlib.asynccontextmanager
+async def _transaction(kind: str, key: str, load: Callable, save: Callable, *args):
+    async with doc_lock(kind, key):
+        data = await run_io(load, *args)
+        before = _clone(data)
+        yield data
+        if data is not None and data != before:
+            await run_io(save, *args, data)
+
+
+def list_doc(name: str):
+    """Transaction over a regular list's entries (None if the list doesn't exist)."""
+    return _transaction(KIND_LIST, name, _load_list_if_exists, save_list, name)
+
+
+def gen_doc(name: str):
+    """Transaction over a generator list's items (None if the list doesn't exist)."""
+    return _transaction(KIND_GEN, name, _load_gen_list_if_exists, save_gen_list, name)
+
+
+def timers_doc():
+    """Transaction over the timers mapping {timer_id: timer}."""
+    return _transaction(KIND_TIMERS, "", load_timers, save_timers)
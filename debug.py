@@ -263,6 +263,13 @@ def register_sigterm() -> None:
     def _handle(*_: object) -> None:
         STATE.record_shutdown("redeploy", DEPLOYMENT_ID, GIT_SHA, GIT_BRANCH)
         STATE.push_event("shutdown", "SIGTERM (planned redeploy) received")
+        # Persist any write-back cached list/timer changes before the container goes away
+        try:
+            from data_manager import flush
+
+            flush()
+        except Exception:
+            pass
 
     try:
         signal.signal(signal.SIGTERM, _handle)
@@ -404,6 +411,95 @@ class DebugCog(commands.Cog):
         content = "```\n" + "\n".join(tail) + "\n```"
         await interaction.response.send_message(content, ephemeral=True)
 
+    @diag.command(
+        name="storage", description="Show storage backend, pending writes and I/O timings"
+    )
+    async def storage(self, interaction: discord.Interaction):
+        try:
+            import data_manager as dm
+        except Exception as e:
+            await interaction.response.send_message(
+                f"data_manager unavailable: {e}", ephemeral=True
+            )
+            return
+
+        lines = [
+            f"**Backend**: `{dm.BACKEND.name}` — dirty docs: **{dm.dirty_count()}**",
+            f"**Flush interval**: {dm.FLUSH_INTERVAL_SEC:g}s — I/O workers: {dm.IO_WORKERS}",
+        ]
+        if getattr(dm.BACKEND, "journal_kinds", None):
+            lines.append(
+                f"**Journal**: {dm.BACKEND.bytes_written / 1024:.1f} KiB written, "
+                f"{dm.BACKEND.compactions} compaction(s) since start"
+            )
+        stats = dm.get_io_stats()
+        if stats:
+            rows = [f"{'call':<26}{'n':>7}{'avg ms':>9}{'max ms':>9}"]
+            for name, st in sorted(stats.items(), key=lambda kv: -kv[1]["total_ms"])[:20]:
+                rows.append(f"{name:<26}{st['calls']:>7}{st['avg_ms']:>9.2f}{st['max_ms']:>9.2f}")
+            lines.append("```\n" + "\n".join(rows) + "\n```")
+        else:
+            lines.append("No storage I/O recorded yet.")
+        await interaction.response.send_message("\n".join(lines), ephemeral=True)
+
+    @diag.command(
+        name="dashboards", description="Show dashboard edits sent, skipped and API calls saved"
+    )
+    async def dashboards(self, interaction: discord.Interaction):
+        try:
+            from dashboards import edit_stats, queue_stats
+            from gen_timers import (
+                CHANNEL_BACKOFF,
+                DASHBOARD_EDIT_STATS,
+                REFRESH_STATS,
+                RENDER_STATS,
+            )
+        except Exception as e:
+            await interaction.response.send_message(
+                f"dashboard stats unavailable: {e}", ephemeral=True
+            )
+            return
+
+        sent, skipped = DASHBOARD_EDIT_STATS["sent"], DASHBOARD_EDIT_STATS["skipped"]
+        total = sent + skipped
+        share = f" ({skipped / total:.0%} skipped)" if total else ""
+        lines = [
+            f"**Gen dashboards** since start — edits sent: **{sent}**, "
+            f"unchanged & skipped: **{skipped}**{share}",
+            f"**Scheduled refreshes**: {REFRESH_STATS['refreshes']} over "
+            f"{REFRESH_STATS['lists']} list slots ({REFRESH_STATS['rebalances']} rebalances), "
+            f"latest slot {REFRESH_STATS['max_late_sec']:.1f}s late, "
+            f"lists skipped while in flight: {REFRESH_STATS['skipped_in_flight']}",
+            f"**Gen renders**: {RENDER_STATS['hits']} cached, {RENDER_STATS['misses']} rebuilt — "
+            f"lines reused {RENDER_STATS['lines_reused']} / built {RENDER_STATS['lines_built']}, "
+            f"chunks reused {RENDER_STATS['chunks_reused']} / built {RENDER_STATS['chunks_built']}",
+        ]
+        stats = edit_stats()
+        if stats:
+            rows = [f"{'loop':<12}{'edits':>8}{'resent':>8}{'saved':>8}"]
+            for source, st in sorted(stats.items()):
+                rows.append(f"{source:<12}{st['edits']:>8}{st['resent']:>8}{st['saved']:>8}")
+            lines.append("```\n" + "\n".join(rows) + "\n```")
+            lines.append("_saved = fetch_message calls avoided by editing by ID_")
+        queues = queue_stats()
+        if queues:
+            lines.append(
+                "**Queued refreshes**: "
+                + ", ".join(
+                    f"{source} {q['requests']} requested → {q['refreshes']} edits"
+                    + (f", {q['queued']} waiting" if q["queued"] else "")
+                    + (f", {q['errors']} failed" if q["errors"] else "")
+                    for source, q in sorted(queues.items())
+                )
+            )
+        cooling = CHANNEL_BACKOFF.cooling()
+        if cooling:
+            lines.append(
+                "**Rate-limited channels**: "
+                + ", ".join(f"<#{ch}> {left:.0f}s" for ch, left in sorted(cooling.items()))
+            )
+        await interaction.response.send_message("\n".join(lines), ephemeral=True)
+
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(DebugCog(bot))
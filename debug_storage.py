@@ -15,9 +15,20 @@ from data_manager import (
     DASHBOARDS_PATH,
     GEN_DASHBOARDS_PATH,
     TIMERS_PATH,
+    TIMERS_ARCHIVE_PATH,
+    TIMER_STATS_PATH,
+    STORAGE_BACKEND,
+    SQLITE_PATH,
+    acompact_journals,
 )
 
-RESERVED_JSON = {"dashboards.json", "generator_dashboards.json", "timers.json", "data.json"}
+RESERVED_JSON = {
+    "dashboards.json",
+    "generator_dashboards.json",
+    "timers.json",
+    "timer_stats.json",
+    "data.json",
+}
 
 
 def _ls_json(dirpath: str):
@@ -53,6 +64,9 @@ class DebugStorageCog(commands.Cog):
         lines = []
         lines.append(f"DATABASE_PATH: {BASE_DATA}")
         lines.append(f"BASE_DIR: {BASE_DIR}")
+        lines.append(f"STORAGE_BACKEND: {STORAGE_BACKEND}")
+        if STORAGE_BACKEND == "sqlite":
+            lines.append(f"SQLITE_PATH: {SQLITE_PATH}")
         lines.append(f"LISTS_DIR: {LISTS_DIR} ({len(lists)} file(s))")
         lines += [f"  - {n}" for n in lists]
         lines.append(f"GEN_LISTS_DIR: {GEN_LISTS_DIR} ({len(gen_lists)} file(s))")
@@ -60,6 +74,8 @@ class DebugStorageCog(commands.Cog):
         lines.append(f"DASHBOARDS_PATH: {DASHBOARDS_PATH}")
         lines.append(f"GEN_DASHBOARDS_PATH: {GEN_DASHBOARDS_PATH}")
         lines.append(f"TIMERS_PATH: {TIMERS_PATH}")
+        lines.append(f"TIMERS_ARCHIVE_PATH: {TIMERS_ARCHIVE_PATH}")
+        lines.append(f"TIMER_STATS_PATH: {TIMER_STATS_PATH}")
 
         body = _clip("\n".join(lines))
         await interaction.response.send_message(f"```\n{body}\n```", ephemeral=True)
@@ -124,6 +140,7 @@ class DebugStorageCog(commands.Cog):
         src_dir = GEN_LISTS_DIR
         dst_dir = target_dir
         os.makedirs(dst_dir, exist_ok=True)
+        await acompact_journals()  # pending generator edits live in *.journal.jsonl until compacted
 
         moved = []
         try:
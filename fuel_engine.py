@@ -0,0 +1,195 @@
+# fuel_engine.py
+# Batched fuel projections for generators.
+#
+# A generator burns its fuels one after another (Tek: shards, then element; Electrical:
+# gas, then imbued gas), each unit lasting a fixed number of seconds, starting from the
+# timestamp of its last refuel. Everything about it is therefore closed-form: the time
+# left, the units left of each fuel, and the moments it crosses the LOW threshold and
+# runs EMPTY. This module computes those for many generators at once, column by column
+# (timestamps, one count column per fuel), instead of one item dict at a time.
+#
+# Generator types are data (FUEL_TYPES): a new type is one register_fuel_type() call
+# with its fuels in burn order, not another hand-written calculator. The columns are
+# crunched with NumPy when it is installed and the batch is large enough to pay for the
+# array conversion; otherwise a plain Python loop computes the same integers.
+import os
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+try:
+    import numpy
+except ImportError:  # optional: pip install numpy for large batches
+    numpy = None
+
+# Batches smaller than this use the Python kernel even when NumPy is available
+NUMPY_MIN_BATCH = int(os.getenv("FUEL_NUMPY_MIN_BATCH", "256"))
+
+# ─── Burn durations ────────────────────────────────────────────────────────────
+# Tek
+SHARD_DURATION = 648  # seconds per shard burn
+ELEMENT_DURATION = 64800  # seconds per element burn
+# Electrical
+GAS_DURATION = 3600  # seconds per gas burn (1h)
+IMBUED_DURATION = 14400  # seconds per imbued gas burn (4h)
+
+
+# ─── Fuel types ────────────────────────────────────────────────────────────────
+class FuelType(NamedTuple):
+    name: str
+    fuels: Tuple[Tuple[str, int], ...]  # (item field, seconds per unit), in burn order
+
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        return tuple(field for field, _ in self.fuels)
+
+
+FUEL_TYPES: Dict[str, FuelType] = {}
+
+
+def register_fuel_type(name: str, fuels: Sequence[Tuple[str, int]]) -> FuelType:
+    """Add (or replace) a generator type: item["type"] == name burns these fuels in order."""
+    ftype = FuelType(name, tuple((str(field), int(sec)) for field, sec in fuels))
+    if not ftype.fuels or any(sec <= 0 for _, sec in ftype.fuels):
+        raise ValueError(f"fuel type {name!r} needs at least one fuel with a positive duration")
+    FUEL_TYPES[name] = ftype
+    return ftype
+
+
+register_fuel_type("Tek", (("shards", SHARD_DURATION), ("element", ELEMENT_DURATION)))
+register_fuel_type("Electrical", (("gas", GAS_DURATION), ("imbued", IMBUED_DURATION)))
+
+
+# ─── Results ───────────────────────────────────────────────────────────────────
+class Projection(NamedTuple):
+    """Columns aligned with the projected items; None where an item's type is unknown.
+
+    remaining  whole seconds of fuel left
+    units      units left of each fuel, in the type's burn order
+    low_at     when the time left reaches the LOW threshold
+    empty_at   when it reaches zero
+    """
+
+    remaining: List[Optional[int]]
+    units: List[Optional[Tuple[int, ...]]]
+    low_at: List[Optional[float]]
+    empty_at: List[Optional[float]]
+
+    def slice(self, start: int, stop: int) -> "Projection":
+        return Projection(*(col[start:stop] for col in self))
+
+
+# ─── Kernels ───────────────────────────────────────────────────────────────────
+# Both take one fuel type's columns and return (remaining, units left per generator,
+# total burn seconds). A fuel is only burnt once every fuel before it is gone, so with
+# `start` the seconds of fuel ahead of it, units used = ⌊clamp(elapsed - start, 0, seg) / dur⌋.
+def _kernel_python(
+    durations: Sequence[int], ts: List[float], counts: List[List[int]], now: float
+) -> Tuple[List[int], List[Tuple[int, ...]], List[int]]:
+    remaining: List[int] = []
+    units: List[Tuple[int, ...]] = []
+    totals: List[int] = []
+    for t, row in zip(ts, zip(*counts)):
+        elapsed = now - t if now > t else 0
+        start = 0
+        left = []
+        for count, dur in zip(row, durations):
+            seg = count * dur
+            burnt = elapsed - start
+            if burnt < 0:
+                burnt = 0
+            if burnt > seg:
+                burnt = seg
+            used = int(burnt // dur)
+            left.append(count - used if count > used else 0)
+            start += seg
+        units.append(tuple(left))
+        totals.append(start)
+        remaining.append(int(start - elapsed) if start > elapsed else 0)
+    return remaining, units, totals
+
+
+def _kernel_numpy(
+    durations: Sequence[int], ts: List[float], counts: List[List[int]], now: float
+) -> Tuple[List[int], List[Tuple[int, ...]], List[int]]:
+    elapsed = numpy.maximum(now - numpy.asarray(ts, dtype=numpy.float64), 0.0)
+    start = numpy.zeros(len(ts), dtype=numpy.int64)
+    units = []
+    for count, dur in zip(counts, durations):
+        count = numpy.asarray(count, dtype=numpy.int64)
+        seg = count * dur
+        used = (numpy.minimum(numpy.maximum(elapsed - start, 0.0), seg) // dur).astype(numpy.int64)
+        units.append(numpy.maximum(count - used, 0).tolist())
+        start += seg
+    remaining = numpy.maximum(start - elapsed, 0.0).astype(numpy.int64)
+    return remaining.tolist(), list(zip(*units)), start.tolist()
+
+
+def project_columns(
+    ftype: FuelType,
+    ts: List[float],
+    counts: List[List[int]],
+    now: float,
+    low_threshold: float,
+    use_numpy: Optional[bool] = None,
+) -> Projection:
+    """Project one fuel type's generators given as columns: refuel timestamps and one
+    list of unit counts per fuel (in ftype's burn order)."""
+    if use_numpy is None:
+        use_numpy = numpy is not None and len(ts) >= NUMPY_MIN_BATCH
+    kernel = _kernel_numpy if use_numpy and numpy is not None else _kernel_python
+    remaining, units, totals = kernel([dur for _, dur in ftype.fuels], ts, counts, now)
+    empty_at = [t + total for t, total in zip(ts, totals)]
+    return Projection(remaining, units, [e - low_threshold for e in empty_at], empty_at)
+
+
+# ─── Item-level entry points ───────────────────────────────────────────────────
+def project_items(
+    items: Sequence[dict],
+    now: float,
+    low_threshold: float,
+    default_type: Optional[str] = None,
+    use_numpy: Optional[bool] = None,
+) -> Projection:
+    """Project a list of generator items in one pass per fuel type.
+
+    Items without a type count as `default_type`; items of an unknown type get None.
+    A missing refuel timestamp counts as `now`, missing fuel counts as 0.
+    """
+    n = len(items)
+    out = Projection([None] * n, [None] * n, [None] * n, [None] * n)
+    groups: Dict[str, List[int]] = {}
+    for i, item in enumerate(items):
+        gtype = item.get("type", default_type)
+        if gtype in FUEL_TYPES:
+            groups.setdefault(gtype, []).append(i)
+
+    for gtype, rows in groups.items():
+        ftype = FUEL_TYPES[gtype]
+        picked = [items[i] for i in rows] if len(rows) < n else items
+        ts = [float(item.get("timestamp", now)) for item in picked]
+        counts = [[int(item.get(field, 0)) for item in picked] for field in ftype.fields]
+        proj = project_columns(ftype, ts, counts, now, low_threshold, use_numpy)
+        if len(rows) == n:
+            return proj  # a single type: columns already line up with the items
+        for col, values in zip(out, proj):
+            for i, value in zip(rows, values):
+                col[i] = value
+    return out
+
+
+def project_lists(
+    docs: Dict[str, Sequence[dict]],
+    now: float,
+    low_threshold: float,
+    default_type: Optional[str] = None,
+    use_numpy: Optional[bool] = None,
+) -> Dict[str, Projection]:
+    """project_items over several lists ({list name: items}) as one batch."""
+    names = list(docs)
+    flat: List[dict] = []
+    bounds: List[Tuple[int, int]] = []
+    for name in names:
+        start = len(flat)
+        flat.extend(docs[name])
+        bounds.append((start, len(flat)))
+    proj = project_items(flat, now, low_threshold, default_type, use_numpy)
+    return {name: proj.slice(a, b) for name, (a, b) in zip(names, bounds)}
@@ -1,24 +1,39 @@
 import os
+import json
 import time
 import asyncio
+import hashlib
+import heapq
+import zlib
+from bisect import bisect_right
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 from discord import app_commands
 from discord.app_commands import CommandAlreadyRegistered
 
+from dashboards import ChannelBackoff, RefreshQueue, edit_dashboard, retry_after
 from data_manager import (
-    load_gen_list,
-    save_gen_list,
-    gen_list_exists,
-    delete_gen_list,
-    get_all_gen_list_names,
-    add_to_gen_list,
-    set_gen_list_role,
-    get_gen_list_role,
-    save_gen_dashboard_id,
-    get_gen_dashboard_id,
-    set_gen_item_alerts_muted,  # for mute/unmute commands
+    asave_gen_list,
+    agen_list_exists,
+    adelete_gen_list,
+    aload_all_gen_docs,
+    aload_gen_snapshot,
+    add_change_listener,
+    remove_change_listener,
+    KIND_GEN,
+    KIND_GEN_DASHBOARDS,
+    run_io,
+    GEN_DASHBOARDS,
+    aset_gen_list_role,
+    aget_gen_list_role,
+    asave_gen_dashboard_pages,
+    aget_gen_dashboard_id,
+    aset_gen_item_alerts_muted,  # for mute/unmute commands
+    gen_doc,
+    agen_item_index,
+    new_gen_item,
 )
+from fuel_engine import FUEL_TYPES, Projection, project_items, project_lists
 
 # ─── Configuration ──────────────────────
 TEK_THUMBNAIL = (
@@ -28,12 +43,22 @@ TEK_COLOR = 0x0099FF
 ELEC_COLOR = 0xFFC300
 GEN_EMOJIS = {"Tek": "⚡", "Electrical": "🔌"}
 
-BACKOFF_SECONDS = 10 * 60  # pause updates for 10 minutes on 429
+BACKOFF_SECONDS = 10 * 60  # longest cooldown for a channel that keeps hitting 429s
 LOW_THRESHOLD = 12 * 3600  # 12 hours in seconds
+# A list whose alert could not be delivered (send failed, channel gone) is retried after this
+ALERT_RETRY_SEC = float(os.getenv("GEN_ALERT_RETRY_SEC", "60"))
+# Every deployed dashboard is refreshed once per period, each list at its own slot in it
+REFRESH_PERIOD_SEC = max(1.0, float(os.getenv("GEN_REFRESH_PERIOD_SEC", "120")))
+# Dashboard refreshes allowed to run at once; each channel is still paced on its own
+REFRESH_WORKERS = max(1, int(os.getenv("GEN_REFRESH_WORKERS", "4")))
+# Pause between message edits in one channel (dashboards, and pages of one dashboard)
+PER_LIST_DELAY = float(os.getenv("GEN_REFRESH_PER_LIST_DELAY_SEC", "0.8"))
 
 # Discord embed limits
 EMBED_FIELD_VALUE_MAX = 1024
-MAX_GENERATOR_FIELDS = 24  # keep 1 slot for the signature/timestamp field at the bottom
+EMBED_FIELDS_MAX = 25
+MESSAGE_EMBEDS_MAX = 10  # embeds per message
+MESSAGE_CHARS_MAX = 6000  # titles, descriptions and fields across all of a message's embeds
 
 
 # ─── Utility: log to a configured channel ───────────────────────────────────────
@@ -49,56 +74,16 @@ async def log_to_channel(bot: commands.Bot, message: str):
             pass
 
 
-# ─── Burn durations ────────────────────────────────────────────────────────────
-# Tek
-SHARD_DURATION = 648  # seconds per shard burn
-ELEMENT_DURATION = 64800  # seconds per element burn
-# Electrical
-GAS_DURATION = 3600  # seconds per gas burn (1h)
-IMBUED_DURATION = 14400  # seconds per imbued gas burn (4h)
+# ─── Remaining fuel ────────────────────────────────────────────────────────────
+# Burn durations and per-type fuels live in fuel_engine (FUEL_TYPES); a list is projected
+# in one batched pass instead of one calculator call per generator.
+def project_gens(items: list[dict], now: float, default_type: str | None = None) -> Projection:
+    return project_items(items, now, LOW_THRESHOLD, default_type)
 
 
-# ─── Remaining fuel calculators ────────────────────────────────────────────────
-def compute_tek_remaining(item: dict, now: float) -> tuple[int, int, int]:
-    initial_elements = int(item.get("element", 0))
-    initial_shards = int(item.get("shards", 0))
-    ts = float(item.get("timestamp", now))
-    elapsed = max(now - ts, 0)
-
-    total_shard_time = initial_shards * SHARD_DURATION
-    total_element_time = initial_elements * ELEMENT_DURATION
-    total_fuel_time = total_shard_time + total_element_time
-    remaining_time = max(total_fuel_time - elapsed, 0)
-
-    shards_used = int(min(elapsed, total_shard_time) // SHARD_DURATION)
-    rem_shards = max(initial_shards - shards_used, 0)
-
-    elapsed_after_shards = max(elapsed - total_shard_time, 0)
-    elems_used = int(min(elapsed_after_shards, total_element_time) // ELEMENT_DURATION)
-    rem_elements = max(initial_elements - elems_used, 0)
-
-    return int(remaining_time), int(rem_shards), int(rem_elements)
-
-
-def compute_elec_remaining(item: dict, now: float) -> tuple[int, int, int]:
-    initial_gas = int(item.get("gas", 0))
-    initial_imbued = int(item.get("imbued", 0))
-    ts = float(item.get("timestamp", now))
-    elapsed = max(now - ts, 0)
-
-    total_gas_time = initial_gas * GAS_DURATION
-    total_imbued_time = initial_imbued * IMBUED_DURATION
-    total_fuel_time = total_gas_time + total_imbued_time
-    remaining_time = max(total_fuel_time - elapsed, 0)
-
-    gas_used = int(min(elapsed, total_gas_time) // GAS_DURATION)
-    rem_gas = max(initial_gas - gas_used, 0)
-
-    elapsed_after_gas = max(elapsed - total_gas_time, 0)
-    imbued_used = int(min(elapsed_after_gas, total_imbued_time) // IMBUED_DURATION)
-    rem_imbued = max(initial_imbued - imbued_used, 0)
-
-    return int(remaining_time), int(rem_gas), int(rem_imbued)
+def fuel_units_text(gtype: str, units: tuple[int, ...], sep: str = ", ") -> str:
+    """e.g. "12 shards, 3 element" in the type's burn order."""
+    return sep.join(f"{n} {field}" for n, field in zip(units, FUEL_TYPES[gtype].fields))
 
 
 def fmt_remaining(seconds: int) -> str:
@@ -115,300 +100,844 @@ def fmt_remaining(seconds: int) -> str:
 
 
 # ─── Embed building helpers ────────────────────────────────────────────────────
-def _add_chunked_fields(embed: discord.Embed, lines: list[str], base_name: str = "Generators"):
-    """
-    Split generator lines into field-sized chunks (≤1024 chars each), add them to the embed,
-    and ensure we never exceed Discord’s 25-field limit overall by reserving 1 slot for the
-    signature/timestamp field. If there would be more than 24 generator fields, the remainder
-    is compressed into a single final field (also ≤1024).
+def _chunk_lines(
+    lines: list[str],
+    prev: dict[tuple[int, int], str] | None = None,
+    changed: list[bool] | None = None,
+) -> tuple[list[str], dict[tuple[int, int], str]]:
+    """Pack lines into field-sized chunks (≤1024 chars, a blank line between entries).
+
+    Returns the chunk texts and {(first line, end line): text}. Given the previous call's
+    spans and which lines changed since, a chunk covering the same unchanged lines reuses
+    its old text instead of being joined again.
     """
-    if not lines:
-        embed.add_field(
-            name=base_name,
-            value="_No generators yet. Use `/add_gen_tek` or `/add_gen_electrical`._",
-            inline=False,
-        )
-        return
-
-    # Build value chunks with a blank line between entries
+    spans: list[tuple[int, int]] = []
+    start, size = 0, 0
+    for i, line in enumerate(lines):
+        extra = len(line) + (2 if i > start else 0)  # two newlines between entries
+        if size + extra > EMBED_FIELD_VALUE_MAX:
+            spans.append((start, i))
+            start, size = i, len(line)
+        else:
+            size += extra
+    if start < len(lines):
+        spans.append((start, len(lines)))
+
+    dirty = [0]  # dirty[i] = how many lines before i changed
+    for flag in changed or ():
+        dirty.append(dirty[-1] + flag)
+    texts: dict[tuple[int, int], str] = {}
     chunks = []
-    current = ""
-    for line in lines:
-        extra = len(line) + (2 if current else 0)  # two newlines between entries
-        if len(current) + extra > EMBED_FIELD_VALUE_MAX:
-            chunks.append(current)
-            current = line
+    for first, end in spans:
+        text = None
+        if prev and changed is not None and dirty[end] == dirty[first]:
+            text = prev.get((first, end))
+        if text is None:
+            text = "\n\n".join(lines[first:end])
+            RENDER_STATS["chunks_built"] += 1
         else:
-            current = f"{current}\n\n{line}" if current else line
-    if current:
-        chunks.append(current)
+            RENDER_STATS["chunks_reused"] += 1
+        texts[(first, end)] = text
+        chunks.append(text)
+    return chunks, texts
+
+
+# ─── Dashboard pages ───────────────────────────────────────────────────────────
+# A dashboard is as many messages ("pages") as its chunks need. A page is laid out as
+# (title, description, fields of each embed); the signature/timestamp field goes on the
+# last page, and every page leaves room for it so any page can be the last.
+_EMPTY_LIST_TEXT = "_No generators yet. Use `/add_gen_tek` or `/add_gen_electrical`._"
+_SIGNATURE_CHARS = 64
+
 
+def _paginate(list_name: str, description: str | None, chunks: list[str]) -> list[tuple]:
+    """Lay chunks out as fields over ≤MESSAGE_EMBEDS_MAX embeds (≤EMBED_FIELDS_MAX fields
+    each) and ≤MESSAGE_CHARS_MAX characters per page, starting a new page when full."""
     total = len(chunks)
-    if total == 1:
-        embed.add_field(name=base_name, value=chunks[0], inline=False)
-        return
+    if not total:
+        fields = [("Generators", _EMPTY_LIST_TEXT)]
+    else:
+        fields = [
+            ("Generators" if total == 1 else f"Generators ({i}/{total})", chunk)
+            for i, chunk in enumerate(chunks, start=1)
+        ]
+
+    pages: list[tuple] = []
+    title, desc = list_name, description
+    embeds: list[tuple] = []
+    current: list[tuple[str, str]] = []
+    used = len(title) + len(desc or "") + _SIGNATURE_CHARS
+    for name, value in fields:
+        cost = len(name) + len(value)
+        embed_full = len(current) == EMBED_FIELDS_MAX - 1  # one slot kept for the signature
+        if current and (
+            used + cost > MESSAGE_CHARS_MAX
+            or (embed_full and len(embeds) == MESSAGE_EMBEDS_MAX - 1)
+        ):
+            pages.append((title, desc, (*embeds, tuple(current))))
+            title, desc, embeds, current = f"{list_name} (continued)", None, [], []
+            used = len(title) + _SIGNATURE_CHARS
+        elif embed_full:
+            embeds.append(tuple(current))
+            current = []
+        current.append((name, value))
+        used += cost
+    pages.append((title, desc, (*embeds, tuple(current))))
+    return pages
+
+
+def _page_digest(page: tuple, color: int, last: bool) -> str:
+    payload = json.dumps([page, color, last], ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _page_embeds(
+    page: tuple, color: int, first: bool, last: bool, now: float
+) -> list[discord.Embed]:
+    title, desc, embed_fields = page
+    embeds = []
+    for fields in embed_fields:
+        embed = discord.Embed(title=None if embeds else title, color=color)
+        if not embeds:
+            if first:
+                embed.set_thumbnail(url=TEK_THUMBNAIL)
+            # Keep role mention at the top (if set); signature/timestamp go to the bottom.
+            embed.description = desc
+        for name, value in fields:
+            embed.add_field(name=name, value=value, inline=False)
+        embeds.append(embed)
+    if last:
+        # Signature + local-time update at the BOTTOM
+        embeds[-1].add_field(
+            name="​", value=f"*Powered by AZX*\nUpdated <t:{int(now)}:f>", inline=False
+        )
+    return embeds
 
-    if total <= MAX_GENERATOR_FIELDS:
-        for i, chunk in enumerate(chunks, start=1):
-            embed.add_field(name=f"{base_name} ({i}/{total})", value=chunk, inline=False)
-        return
 
-    # Too many chunks: add first (MAX_GENERATOR_FIELDS - 1), then compress the rest into one final field.
-    head = chunks[: MAX_GENERATOR_FIELDS - 1]
-    tail = chunks[MAX_GENERATOR_FIELDS - 1 :]
-
-    for i, chunk in enumerate(head, start=1):
-        embed.add_field(name=f"{base_name} ({i}/{total})", value=chunk, inline=False)
-
-    remaining_count = len(tail)
-    squashed = "\n\n".join(tail)
-    if len(squashed) > EMBED_FIELD_VALUE_MAX:
-        # leave some space for the notice
-        squashed = squashed[: EMBED_FIELD_VALUE_MAX - 50] + "\n\n…(truncated)"
-    embed.add_field(
-        name=f"{base_name} (compressed, {remaining_count}/{total})",
-        value=squashed + "\n\n_…plus more items compressed to stay within Discord’s embed limits_",
-        inline=False,
-    )
+# ─── Dashboard edit diffing ────────────────────────────────────────────────────
+# Each page remembers a digest of what its message last showed, and its PATCH is skipped
+# when a refresh lays out the same thing. The "Updated <t:…:f>" stamp is not part of
+# the digest: it changes on every render, so it would defeat the comparison.
+_dashboard_hashes: dict[str, dict[int, str]] = {}  # list name -> {message id: digest}
+DASHBOARD_EDIT_STATS = {"sent": 0, "skipped": 0}
+
+
+def forget_dashboard_hash(list_name: str, message_id: int | None = None) -> None:
+    """Make the next refresh of this dashboard edit the page (default: every page)
+    regardless of content."""
+    if message_id is None:
+        _dashboard_hashes.pop(list_name, None)
+    else:
+        _dashboard_hashes.get(list_name, {}).pop(message_id, None)
 
 
 # ─── Self-healing dashboard refresh ────────────────────────────────────────────
-async def refresh_dashboard(bot: commands.Bot, list_name: str):
-    dash = get_gen_dashboard_id(list_name)
-    if not dash:
-        return  # not deployed yet
-    ch_id, msg_id = dash
-    ch = bot.get_channel(ch_id)
-    if not ch:
-        return
+# A 429 pauses edits and pings in that channel only; other dashboards carry on.
+CHANNEL_BACKOFF = ChannelBackoff(cap=BACKOFF_SECONDS)
+_refreshing: dict[str, int] = {}  # list name -> refreshes in flight (running or waiting)
+_refresh_locks: dict[str, asyncio.Lock] = {}  # one refresh of a list at a time
+REFRESH_STATS = {
+    "lists": 0,
+    "refreshes": 0,
+    "skipped_in_flight": 0,
+    "rebalances": 0,
+    "max_late_sec": 0.0,
+}
+
+
+async def refresh_dashboard(bot: commands.Bot, list_name: str, gen: dict | None = None):
+    """`gen` is the list's load_all_gen_docs() entry; loaded here when omitted.
+
+    Skips the edit when the rendered content matches what the message already shows.
+    Refreshes of the same list run one after another, so two of them never both resend
+    a missing page and save competing page mappings.
+    """
+    _refreshing[list_name] = _refreshing.get(list_name, 0) + 1
+    lock = _refresh_locks.setdefault(list_name, asyncio.Lock())
+    try:
+        async with lock:
+            await _refresh_dashboard(bot, list_name, gen)
+    finally:
+        _refreshing[list_name] -= 1
+        if not _refreshing[list_name]:
+            del _refreshing[list_name]
+            _refresh_locks.pop(list_name, None)
 
-    embed = build_gen_embed(list_name)
+
+async def _delete_page(ch, message_id: int) -> None:
     try:
-        msg = await ch.fetch_message(msg_id)
-        await msg.edit(embed=embed)
-    except discord.NotFound:
-        sent = await ch.send(embed=embed)
-        save_gen_dashboard_id(list_name, ch.id, sent.id)
-        await log_to_channel(
-            bot, f"ℹ️ Recreated missing gen dashboard for `{list_name}` in <#{ch_id}>."
-        )
+        await ch.get_partial_message(message_id).delete()
+    except discord.HTTPException:
+        pass  # already gone, or not ours to delete any more
+
+
+async def _refresh_dashboard(bot: commands.Bot, list_name: str, gen: dict | None):
+    pages = gen["pages"] if gen is not None else None
+    if gen is None:
+        gen = await aload_gen_snapshot(list_name)
+        pages = gen["pages"] if gen is not None else None
+    if not pages:
+        return  # not deployed yet (or the list is gone)
+    ch_id, old_ids = pages
+    ch = bot.get_channel(ch_id)
+    if not ch or CHANNEL_BACKOFF.remaining(ch_id):
+        return  # gone, or cooling down after a 429 (its next slot catches up)
+
+    rendered = render_gen_pages(list_name, gen["items"], gen["role_id"], gen["revision"])
+    shown = _dashboard_hashes.setdefault(list_name, {})
+    new_ids: list[int] = []
+    edits = 0
+    resent = False  # once a page is sent again, the pages after it follow to keep the order
+    recreated = False
+    try:
+        for i, (embeds, digest) in enumerate(rendered):
+            old_id = old_ids[i] if i < len(old_ids) else None
+            if old_id is not None and not resent and shown.get(old_id) == digest:
+                DASHBOARD_EDIT_STATS["skipped"] += 1
+                new_ids.append(old_id)
+                continue
+            if edits:
+                await asyncio.sleep(PER_LIST_DELAY)
+            edits += 1
+            if resent and old_id is not None:
+                await _delete_page(ch, old_id)
+                old_id = None
+            new_id = await edit_dashboard(ch, old_id, embeds=embeds, source="gen")
+            DASHBOARD_EDIT_STATS["sent"] += 1
+            if new_id != old_id:
+                resent = True
+                recreated = recreated or i < len(old_ids)
+            shown.pop(old_id, None)
+            shown[new_id] = digest
+            new_ids.append(new_id)
+        for old_id in old_ids[len(rendered) :]:
+            await _delete_page(ch, old_id)  # the list got shorter
+            shown.pop(old_id, None)
     except discord.Forbidden:
         await log_to_channel(
             bot, f"❌ Missing permissions to edit gen dashboard for `{list_name}` in <#{ch_id}>."
         )
     except discord.HTTPException as e:
-        await log_to_channel(bot, f"⚠️ Failed to update gen dashboard `{list_name}`: {e}")
+        if e.status == 429:
+            delay = CHANNEL_BACKOFF.hit(ch_id, retry_after(e))
+            await log_to_channel(
+                bot, f"⚠️ Rate limited in <#{ch_id}> (`{list_name}`), pausing it for {delay:.0f}s."
+            )
+        else:
+            await log_to_channel(bot, f"⚠️ Failed to update gen dashboard `{list_name}`: {e}")
+    finally:
+        if len(new_ids) < len(rendered):
+            # Interrupted: keep the old messages for the pages not reached yet
+            new_ids += [m for m in old_ids[len(new_ids) :] if m not in new_ids]
+        if tuple(new_ids) != tuple(old_ids):
+            await asave_gen_dashboard_pages(list_name, ch_id, new_ids)
+            if recreated:
+                await log_to_channel(
+                    bot, f"ℹ️ Recreated missing gen dashboard pages for `{list_name}` in <#{ch_id}>."
+                )
 
 
 # ─── Automatic pings (LOW / EMPTY) for both Tek & Electrical ───────────────────
-async def evaluate_and_ping(bot: commands.Bot, list_name: str):
-    """Ping when a gen first goes LOW (≤12h) or EMPTY (0). Flags auto-reset when refueled."""
-    data = load_gen_list(list_name)
-    if not data:
-        return
-
-    role_id = get_gen_list_role(list_name)
+def _alert_pending(item: dict, remaining: int | None) -> bool:
+    """Whether evaluate_and_ping would ping for this item or reset one of its flags."""
+    if remaining is None or bool(item.get("alerts_muted", False)):
+        return False
+    alerted_low = bool(item.get("alerted_low", False))
+    alerted_empty = bool(item.get("alerted_empty", False))
+    if remaining > 0 and alerted_empty:
+        return True
+    if remaining > LOW_THRESHOLD:
+        return alerted_low
+    return not alerted_empty if remaining == 0 else not alerted_low
+
+
+async def evaluate_and_ping(bot: commands.Bot, list_name: str, gen: dict | None = None):
+    """Ping when a gen first goes LOW (≤12h) or EMPTY (0). Flags auto-reset when refueled.
+
+    With a load_all_gen_docs() entry, lists with nothing to ping or reset are skipped
+    without opening a transaction.
+    """
+    role_id = gen["role_id"] if gen is not None else await aget_gen_list_role(list_name)
     if not role_id:
         return
 
-    dash = get_gen_dashboard_id(list_name)
+    dash = gen["dashboard"] if gen is not None else await aget_gen_dashboard_id(list_name)
     if not dash:
         return
 
+    if gen is not None:
+        proj = project_gens(gen["items"], time.time())
+        if not any(map(_alert_pending, gen["items"], proj.remaining)):
+            return
+
     ch_id, _ = dash
     channel = bot.get_channel(ch_id)
-    if not channel:
+    if not channel or CHANNEL_BACKOFF.remaining(ch_id):
         return
 
-    now = time.time()
-    changed = False
-
-    for item in data:
-        gtype = item.get("type")
-        if gtype == "Tek":
-            remaining, rem_a, rem_b = compute_tek_remaining(item, now)  # a=shards, b=element
-            a_label, b_label, emoji = "shards", "element", GEN_EMOJIS["Tek"]
-        elif gtype == "Electrical":
-            remaining, rem_a, rem_b = compute_elec_remaining(item, now)  # a=gas, b=imbued
-            a_label, b_label, emoji = "gas", "imbued", GEN_EMOJIS["Electrical"]
-        else:
-            continue
+    # Flags are read and written inside one transaction so a refuel or mute that lands
+    # meanwhile is not overwritten by this pass. The pings themselves go out after it,
+    # so commands on this list don't wait on Discord; a ping that fails gets its flag
+    # cleared again and is retried on a later pass.
+    pings = []  # (gen name, flag, message)
+    async with gen_doc(list_name) as data:
+        if not data:
+            return
 
-        # Respect per-item mute
-        if bool(item.get("alerts_muted", False)):
-            continue
+        proj = project_gens(data, time.time())
 
-        alerted_low = bool(item.get("alerted_low", False))
-        alerted_empty = bool(item.get("alerted_empty", False))
+        for item, remaining, units in zip(data, proj.remaining, proj.units):
+            if remaining is None:
+                continue  # unknown generator type
+            gtype = item["type"]
+            emoji = GEN_EMOJIS.get(gtype, "⚙️")
 
-        # Reset flags if refueled above thresholds
-        if remaining > LOW_THRESHOLD and alerted_low:
-            item["alerted_low"] = False
-            alerted_low = False
-            changed = True
-        if remaining > 0 and alerted_empty:
-            item["alerted_empty"] = False
-            alerted_empty = False
-            changed = True
+            # Respect per-item mute
+            if bool(item.get("alerts_muted", False)):
+                continue
 
-        name = item.get("name", "Unknown")
+            alerted_low = bool(item.get("alerted_low", False))
+            alerted_empty = bool(item.get("alerted_empty", False))
 
-        # EMPTY ping
-        if remaining == 0 and not alerted_empty:
-            try:
-                await channel.send(
-                    f"<@&{role_id}> {emoji} **{name}** has **run out of fuel** (0 {a_label}, 0 {b_label})."
-                )
+            # Reset flags if refueled above thresholds
+            if remaining > LOW_THRESHOLD and alerted_low:
+                item["alerted_low"] = False
+                alerted_low = False
+            if remaining > 0 and alerted_empty:
+                item["alerted_empty"] = False
+                alerted_empty = False
+
+            name = item.get("name", "Unknown")
+
+            # EMPTY ping
+            if remaining == 0 and not alerted_empty:
                 item["alerted_empty"] = True
-                changed = True
-            except Exception:
-                pass
-            if not item.get("alerted_low", False):
+                pings.append(
+                    (
+                        name,
+                        "alerted_empty",
+                        f"<@&{role_id}> {emoji} **{name}** has **run out of fuel** "
+                        f"({fuel_units_text(gtype, (0,) * len(units))}).",
+                    )
+                )
+                if not item.get("alerted_low", False):
+                    item["alerted_low"] = True
+                continue
+
+            # LOW ping
+            if 0 < remaining <= LOW_THRESHOLD and not alerted_low:
                 item["alerted_low"] = True
-                changed = True
+                pings.append(
+                    (
+                        name,
+                        "alerted_low",
+                        f"<@&{role_id}> {emoji} **{name}** is **low on fuel** — "
+                        f"{fmt_remaining(remaining)} left "
+                        f"({fuel_units_text(gtype, units)} remaining).",
+                    )
+                )
+
+    unsent = set()
+    for name, flag, text in pings:
+        if CHANNEL_BACKOFF.remaining(ch_id):
+            unsent.add((name, flag))  # rate limited mid-pass; the scheduler comes back
             continue
+        try:
+            await channel.send(text)
+        except discord.HTTPException as e:
+            if e.status == 429:
+                CHANNEL_BACKOFF.hit(ch_id, retry_after(e))
+            unsent.add((name, flag))
+        except Exception:
+            unsent.add((name, flag))
+    if unsent:
+        async with gen_doc(list_name) as data:
+            for item in data or ():
+                for flag in ("alerted_low", "alerted_empty"):
+                    if (item.get("name", "Unknown"), flag) in unsent:
+                        item[flag] = False
+
+
+# ─── Alert scheduler ───────────────────────────────────────────────────────────
+def next_alert_times(items: list[dict], now: float, proj: Projection | None = None) -> list:
+    """Per item, when evaluate_and_ping next has something to do for it: now if it already
+    does, else the exact LOW or EMPTY crossing time; None if nothing is coming."""
+    if proj is None:
+        proj = project_gens(items, now)
+    times = []
+    for item, remaining, low_at, empty_at in zip(items, proj.remaining, proj.low_at, proj.empty_at):
+        if remaining is None or bool(item.get("alerts_muted", False)):
+            times.append(None)
+        elif _alert_pending(item, remaining):
+            times.append(now)
+        elif remaining > LOW_THRESHOLD:
+            times.append(low_at)  # not yet alerted_low (else it'd be pending)
+        elif remaining > 0 and not item.get("alerted_empty", False):
+            times.append(empty_at)
+        else:
+            times.append(None)
+    return times
+
+
+class GenAlertScheduler:
+    """Sleeps until the next LOW/EMPTY crossing of any generator and evaluates that list.
+
+    The heap holds one entry per list, keyed by the earliest crossing among its
+    generators; entries superseded by a re-plan are skipped when popped. A list is
+    re-planned whenever its document changes (data_manager change listener), so adds,
+    edits, refuels, mutes and removals take effect right away and no list is polled.
+    """
 
-        # LOW ping
-        if 0 < remaining <= LOW_THRESHOLD and not alerted_low:
-            rem_str = fmt_remaining(remaining)
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self._heap: list[tuple[float, str]] = []
+        self._due: dict[str, float] = {}  # list name -> live heap deadline
+        self._dirty: set[str] = set()
+        self._replan_all = True
+        self._wake = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        add_change_listener(self._on_change)
+        self._task = self._loop.create_task(self._run())
+
+    def stop(self) -> None:
+        remove_change_listener(self._on_change)
+        if self._task:
+            self._task.cancel()
+
+    def _on_change(self, kind: str, key: str) -> None:
+        # Called from the I/O thread that made the change
+        if kind == KIND_GEN:
+            self._loop.call_soon_threadsafe(self.touch, key)
+        elif kind == KIND_GEN_DASHBOARDS:
+            self._loop.call_soon_threadsafe(self.touch_all)
+
+    def touch(self, list_name: str) -> None:
+        """Re-plan one list on the next wakeup."""
+        self._dirty.add(list_name)
+        self._wake.set()
+
+    def touch_all(self) -> None:
+        self._replan_all = True
+        self._wake.set()
+
+    def _plan(
+        self, name: str, gen: dict | None, not_before: float = 0.0, proj: Projection | None = None
+    ) -> None:
+        due = None
+        if gen and gen["role_id"] and gen["dashboard"]:
+            now = time.time()
+            times = next_alert_times(gen["items"], now, proj)
+            # not_before only holds back alerts that are already due (i.e. undelivered)
+            times = [t if t > now else max(t, not_before) for t in times if t is not None]
+            if times:
+                due = min(times)
+        if due is None:
+            self._due.pop(name, None)
+            return
+        self._due[name] = due
+        heapq.heappush(self._heap, (due, name))
+        if len(self._heap) > 2 * len(self._due) + 64:
+            self._heap = [(d, n) for n, d in self._due.items()]
+            heapq.heapify(self._heap)
+
+    async def _run(self) -> None:
+        await self.bot.wait_until_ready()
+        while True:
             try:
-                await channel.send(
-                    f"<@&{role_id}> {emoji} **{name}** is **low on fuel** — {rem_str} left "
-                    f"({rem_a} {a_label}, {rem_b} {b_label} remaining)."
-                )
-                item["alerted_low"] = True
-                changed = True
-            except Exception:
-                pass
+                await self._step()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                await log_to_channel(self.bot, f"⚠️ gen alert scheduler error: {e}")
+                await asyncio.sleep(ALERT_RETRY_SEC)
+
+    async def _step(self) -> None:
+        if self._replan_all:
+            self._replan_all = False
+            # Every list in one snapshot pass and one batched projection
+            docs = await aload_all_gen_docs()
+            now = time.time()
+            projs = project_lists({n: g["items"] for n, g in docs.items()}, now, LOW_THRESHOLD)
+            for name in set(docs) | set(self._due):
+                self._dirty.discard(name)
+                self._plan(name, docs.get(name), proj=projs.get(name))
+        while self._dirty:
+            name = self._dirty.pop()
+            self._plan(name, await aload_gen_snapshot(name))
+
+        if self._heap and self._heap[0][0] <= time.time():
+            due, name = heapq.heappop(self._heap)
+            if self._due.get(name) != due:
+                return  # superseded
+            del self._due[name]
+            gen = await aload_gen_snapshot(name)
+            ch_id = gen["dashboard"][0] if gen and gen["dashboard"] else 0
+            if CHANNEL_BACKOFF.remaining(ch_id):
+                self._plan(name, gen, time.time() + CHANNEL_BACKOFF.remaining(ch_id))
+                return
+            try:
+                await evaluate_and_ping(self.bot, name, gen)
+            finally:
+                # Whatever is still pending right after evaluating could not be delivered
+                retry = max(ALERT_RETRY_SEC, CHANNEL_BACKOFF.remaining(ch_id))
+                self._plan(name, await aload_gen_snapshot(name), time.time() + retry)
+            return
 
-    if changed:
-        save_gen_list(list_name, data)
+        timeout = self._heap[0][0] - time.time() if self._heap else None
+        self._wake.clear()
+        if self._dirty or self._replan_all:
+            return
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
 
 
-# ─── Build the embed ───────────────────────────────────────────────────────────
-def build_gen_embed(list_name: str) -> discord.Embed:
-    data = load_gen_list(list_name)
-    now = time.time()
+# ─── Refresh scheduler ─────────────────────────────────────────────────────────
+def refresh_slots(names, period: float) -> list[tuple[float, str]]:
+    """(offset into the period, list name), evenly spaced.
 
-    # Pick a color (Tek if any, else Electrical color)
-    embed = discord.Embed(
-        title=list_name,
-        color=TEK_COLOR if any(item.get("type") == "Tek" for item in data) else ELEC_COLOR,
-    )
-    embed.set_thumbnail(url=TEK_THUMBNAIL)
+    Lists are ordered by a stable hash of their name (crc32, the same in every process),
+    so each keeps its place relative to the others; creating or deleting a list only
+    moves the rest by a fraction of a slot.
+    """
+    ordered = sorted(names, key=lambda name: (zlib.crc32(name.encode("utf-8")), name))
+    step = period / len(ordered) if ordered else period
+    return [(i * step, name) for i, name in enumerate(ordered)]
+
+
+class GenRefreshScheduler:
+    """Refreshes every deployed gen dashboard once per REFRESH_PERIOD_SEC, one list at a
+    time at its own slot (refresh_slots), so edits are spread flat over the period instead
+    of arriving as one burst per tick.
+
+    Slots are phases of the wall clock and are rebalanced whenever the dashboard mapping
+    changes (deploy, delete, repoint). Two lists of one channel are kept at least
+    PER_LIST_DELAY apart, and a channel cooling down after a 429 is skipped.
+    """
+
+    def __init__(self, bot: commands.Bot, refresh):
+        self.bot = bot
+        self.refresh = refresh  # async (list name) -> None
+        self.period = REFRESH_PERIOD_SEC
+        self._offsets: list[float] = []
+        self._slots: list[tuple[str, int]] = []  # (list name, channel id), by offset
+        self._stale = True
+        self._base = 0.0  # start of the current period
+        self._phase = -1.0  # offset of the slot fired last
+        self._channel_free: dict[int, float] = {}  # channel -> monotonic time of next edit
+        self._workers = asyncio.Semaphore(REFRESH_WORKERS)
+        self._running: set[asyncio.Task] = set()
+        self._wake = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        add_change_listener(self._on_change)
+        self._task = self._loop.create_task(self._run())
+
+    def stop(self) -> None:
+        remove_change_listener(self._on_change)
+        if self._task:
+            self._task.cancel()
+        for task in list(self._running):
+            task.cancel()
+
+    def _on_change(self, kind: str, key: str) -> None:
+        # Called from the I/O thread that made the change
+        if kind == KIND_GEN_DASHBOARDS:
+            self._loop.call_soon_threadsafe(self.rebalance)
+
+    def rebalance(self) -> None:
+        """Recompute the slots on the next wakeup."""
+        self._stale = True
+        self._wake.set()
+
+    async def _load_slots(self) -> None:
+        self._stale = False
+        dashboards = dict(await run_io(GEN_DASHBOARDS.items))
+        slots = refresh_slots(dashboards, self.period)
+        self._offsets = [offset for offset, _ in slots]
+        self._slots = [(name, dashboards[name][0]) for _, name in slots]
+        REFRESH_STATS["lists"] = len(slots)
+        REFRESH_STATS["rebalances"] += 1
+
+    async def _run(self) -> None:
+        await self.bot.wait_until_ready()
+        # small startup stagger to avoid a burst of PATCH edits right after boot
+        await asyncio.sleep(float(os.getenv("GEN_REFRESH_STARTUP_STAGGER_SEC", "2.0")))
+        now = time.time()
+        self._base, self._phase = now - now % self.period, now % self.period
+        while True:
+            try:
+                await self._step()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                await log_to_channel(self.bot, f"⚠️ gen refresh scheduler error: {e}")
+                await asyncio.sleep(PER_LIST_DELAY)
+
+    async def _step(self) -> None:
+        if self._stale:
+            await self._load_slots()
+        timeout = None
+        if self._slots:
+            i = bisect_right(self._offsets, self._phase)
+            base = self._base
+            if i == len(self._offsets):
+                i, base = 0, base + self.period
+            now = time.time()
+            due = base + self._offsets[i]
+            if due < now - self.period:
+                # Stalled for over a period (e.g. suspended): carry on from the clock
+                self._base, self._phase = now - now % self.period, now % self.period
+                return
+            if due <= now:
+                REFRESH_STATS["max_late_sec"] = max(REFRESH_STATS["max_late_sec"], now - due)
+                self._base, self._phase = base, self._offsets[i]
+                self._fire(*self._slots[i])
+                return
+            timeout = due - now
 
+        self._wake.clear()
+        if self._stale:
+            return
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def _fire(self, name: str, ch_id: int) -> None:
+        if CHANNEL_BACKOFF.remaining(ch_id):
+            return  # cooling down; its next slot catches up
+        now = time.monotonic()
+        start = max(now, self._channel_free.get(ch_id, 0.0))
+        self._channel_free[ch_id] = start + PER_LIST_DELAY
+        task = self._loop.create_task(self._refresh(name, start - now))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _refresh(self, name: str, delay: float) -> None:
+        if delay > 0:
+            await asyncio.sleep(delay)  # pace edits to avoid per-route PATCH limits
+        try:
+            async with self._workers:
+                await self.refresh(name)
+                REFRESH_STATS["refreshes"] += 1
+        except Exception as e:
+            await log_to_channel(self.bot, f"⚠️ gen dashboard refresh error on `{name}`: {e}")
+
+
+# ─── Dashboard render cache ────────────────────────────────────────────────────
+# A dashboard only shows whole minutes, so the render of one list revision (doc_revision,
+# carried by load_all_gen_docs entries) is reused until the GEN_RENDER_BUCKET_SEC bucket of
+# the clock moves on. A re-render keeps every line whose shown values (position, name,
+# minutes left, units, marker) are unchanged, and re-joins only the field chunks that
+# contain a changed line.
+RENDER_BUCKET_SEC = max(1.0, float(os.getenv("GEN_RENDER_BUCKET_SEC", "60")))
+RENDER_STATS = {
+    "hits": 0,
+    "misses": 0,
+    "lines_reused": 0,
+    "lines_built": 0,
+    "chunks_reused": 0,
+    "chunks_built": 0,
+}
+
+
+class _Render:
+    __slots__ = ("key", "color", "description", "lines", "line_memo", "spans", "chunks", "pages")
+
+    def __init__(self):
+        self.key: tuple | None = None  # (revision, role_id, time bucket); None = not reusable
+        self.color = ELEC_COLOR
+        self.description: str | None = None
+        self.lines: list[str] = []
+        self.line_memo: dict[tuple, str] = {}  # shown values -> line
+        self.spans: dict[tuple[int, int], str] = {}
+        self.chunks: list[str] = []
+        self.pages: list[tuple[tuple, bool, str]] = []  # (layout, is last page, digest)
+
+
+_renders: dict[str, _Render] = {}  # list name -> last render
+
+
+def forget_render(list_name: str) -> None:
+    _renders.pop(list_name, None)
+
+
+def _gen_line(
+    idx: int,
+    gtype: str,
+    name: str,
+    muted: bool,
+    minutes: int,
+    empty: bool,
+    low: bool,
+    units: tuple[int, ...],
+) -> str:
+    emoji = GEN_EMOJIS.get(gtype, "⚙️")
+    name_part = f"**{idx}.** {emoji} **{name}**" + (" 🔕" if muted else "")
+    status = "❌ OFFLINE" if empty else "🟢・ ONLINE"
+    marker = " **・❗ EMPTY ❗**" if empty else ("**・⚠️ LOW FUEL ⚠️**" if low else "")
+    fuel = fuel_units_text(gtype, units, sep=", ・ ")
+    # fmt_remaining only shows whole minutes
+    return f"{name_part} — {status} — ⏱️ {fmt_remaining(minutes * 60)} — ・ {fuel}{marker}"
+
+
+def _render(list_name: str, data: list, role_id: int | None, now: float, prev: _Render | None):
+    proj = project_gens(data, now, default_type="Tek")
+    memo = prev.line_memo if prev is not None else {}
+    render = _Render()
+    # Pick a color (Tek if any, else Electrical color)
+    render.color = TEK_COLOR if any(item.get("type") == "Tek" for item in data) else ELEC_COLOR
     # Keep role mention at the top (if set); signature/timestamp go to the bottom.
-    role_id = get_gen_list_role(list_name)
-    embed.description = f"<@&{role_id}>" if role_id else None
+    render.description = f"<@&{role_id}>" if role_id else None
 
-    lines: list[str] = []
     # Numbered entries + your original styling (⏱️, ・, and the EMPTY/LOW markers)
-    for idx, item in enumerate(data, start=1):
-        gtype = item.get("type", "Tek")
-        emoji = GEN_EMOJIS.get(gtype, "⚙️")
-        name = item.get("name", "Unknown")
-        muted = bool(item.get("alerts_muted", False))
-        name_part = f"**{idx}.** {emoji} **{name}**" + (" 🔕" if muted else "")
-
-        if gtype == "Tek":
-            remaining, rem_shards, rem_elements = compute_tek_remaining(item, now)
-            status = "🟢・ ONLINE" if remaining > 0 else "❌ OFFLINE"
-            marker = (
-                " **・❗ EMPTY ❗**"
-                if remaining == 0
-                else ("**・⚠️ LOW FUEL ⚠️**" if remaining <= LOW_THRESHOLD else "")
-            )
-            lines.append(
-                f"{name_part} — {status} — ⏱️ {fmt_remaining(remaining)} — "
-                f"・ {rem_shards} shards, ・ {rem_elements} element{marker}"
-            )
-        elif gtype == "Electrical":
-            remaining, rem_gas, rem_imbued = compute_elec_remaining(item, now)
-            status = "🟢・ ONLINE" if remaining > 0 else "❌ OFFLINE"
-            marker = (
-                " **・❗ EMPTY ❗**"
-                if remaining == 0
-                else ("**・⚠️ LOW FUEL ⚠️**" if remaining <= LOW_THRESHOLD else "")
-            )
-            lines.append(
-                f"{name_part} — {status} — ⏱️ {fmt_remaining(remaining)} — "
-                f"・ {rem_gas} gas, ・ {rem_imbued} imbued{marker}"
-            )
+    for idx, (item, remaining, units) in enumerate(zip(data, proj.remaining, proj.units), start=1):
+        if remaining is None:
+            continue  # unknown generator type
+        key = (
+            idx,
+            item.get("type", "Tek"),
+            item.get("name", "Unknown"),
+            bool(item.get("alerts_muted", False)),
+            remaining // 60,
+            remaining == 0,
+            remaining <= LOW_THRESHOLD,
+            units,
+        )
+        line = memo.get(key)
+        if line is None:
+            line = _gen_line(*key)
+            RENDER_STATS["lines_built"] += 1
+        else:
+            RENDER_STATS["lines_reused"] += 1
+        render.line_memo[key] = line
+        render.lines.append(line)
+
+    old = prev.lines if prev is not None else []
+    changed = [i >= len(old) or line is not old[i] for i, line in enumerate(render.lines)]
+    render.chunks, render.spans = _chunk_lines(
+        render.lines, prev.spans if prev is not None else None, changed
+    )
 
-    _add_chunked_fields(embed, lines, base_name="Generators")
+    layout = _paginate(list_name, render.description, render.chunks)
+    same_color = prev is not None and prev.color == render.color
+    digests = {(page, last): digest for page, last, digest in prev.pages} if same_color else {}
+    for i, page in enumerate(layout):
+        last = i == len(layout) - 1
+        digest = digests.get((page, last))
+        render.pages.append((page, last, digest or _page_digest(page, render.color, last)))
+    return render
+
+
+def render_gen_pages(
+    list_name: str, data: list, role_id: int | None, revision: int | None = None
+) -> list[tuple[list[discord.Embed], str]]:
+    """The dashboard's pages as (embeds of one message, content digest), served from the
+    render cache when `revision` (the list's doc_revision) and the time bucket are unchanged.
+    The digest leaves out the "Updated" stamp, so an unchanged page keeps its digest."""
+    now = time.time()
+    key = None if revision is None else (revision, role_id, int(now // RENDER_BUCKET_SEC))
+    render = _renders.get(list_name)
+    if key is not None and render is not None and render.key == key:
+        RENDER_STATS["hits"] += 1
+    else:
+        RENDER_STATS["misses"] += 1
+        render = _render(list_name, data, role_id, now, render)
+        render.key = key
+        _renders[list_name] = render
 
-    # Signature + local-time update at the BOTTOM
-    embed.add_field(
-        name="​", value=f"*Powered by AZX*\nUpdated <t:{int(time.time())}:f>", inline=False
-    )
+    return [
+        (_page_embeds(page, render.color, i == 0, last, now), digest)
+        for i, (page, last, digest) in enumerate(render.pages)
+    ]
 
-    return embed
+
+# ─── Build the embeds ──────────────────────────────────────────────────────────
+def build_gen_pages(list_name: str, data: list, role_id: int | None) -> list[list[discord.Embed]]:
+    """One list of embeds per dashboard message, in order."""
+    return [embeds for embeds, _ in render_gen_pages(list_name, data, role_id)]
 
 
 # ─── Cog ───────────────────────────────────────────────────────────────────────
 class GeneratorCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.backoff_until = 0.0
-        self.generator_list_loop.start()
+        # Commands queue their dashboard; a burst of edits to one list is one message edit
+        self.refresh_queue = RefreshQueue(self._queued_refresh, source="gen")
+        self.alerts = GenAlertScheduler(bot)
+        self.alerts.start()
+        # Periodic refreshes, spread over the period (alert pings are sent by self.alerts)
+        self.refreshes = GenRefreshScheduler(bot, self._scheduled_refresh)
+        self.refreshes.start()
 
     def cog_unload(self):
-        self.generator_list_loop.cancel()
+        self.refreshes.stop()
+        self.alerts.stop()
+        self.refresh_queue.cancel()
 
-    @tasks.loop(seconds=120)
-    async def generator_list_loop(self):
-        """Periodically refresh dashboards and evaluate alert pings."""
-        now = time.time()
-        if now < self.backoff_until:
+    async def _queued_refresh(self, name: str):
+        try:
+            await refresh_dashboard(self.bot, name)
+        except Exception as e:
+            await log_to_channel(self.bot, f"⚠️ refresh_dashboard failed for `{name}`: {e}")
+
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        # An unchanged dashboard is never edited, so a deleted one would otherwise only be
+        # noticed (and recreated) once its content changes.
+        name = await run_io(GEN_DASHBOARDS.by_message, payload.message_id)
+        if name:
+            forget_dashboard_hash(name, payload.message_id)
+
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
+        # A purge in a dashboard channel: the same for every message, in one lookup pass
+        ids = list(payload.message_ids)
+        names = await run_io(lambda: [GEN_DASHBOARDS.by_message(m) for m in ids])
+        for message_id, name in zip(ids, names):
+            if name:
+                forget_dashboard_hash(name, message_id)
+
+    async def _scheduled_refresh(self, name: str):
+        if name in _refreshing or self.refresh_queue.pending(name):
+            REFRESH_STATS["skipped_in_flight"] += 1  # a command's refresh is on its way
             return
-
-        for name in get_all_gen_list_names():
-            try:
-                await refresh_dashboard(self.bot, name)  # self-heal + update
-                await evaluate_and_ping(self.bot, name)  # alerts
-                # pace edits to avoid per-route PATCH limits
-                await asyncio.sleep(float(os.getenv("GEN_REFRESH_PER_LIST_DELAY_SEC", "0.8")))
-            except discord.HTTPException as e:
-                if getattr(e, "status", None) == 429:
-                    self.backoff_until = time.time() + BACKOFF_SECONDS
-                    await log_to_channel(
-                        self.bot,
-                        f"⚠️ Rate limit hit on `{name}`, pausing for {BACKOFF_SECONDS//60}m.",
-                    )
-            except Exception as e:
-                await log_to_channel(self.bot, f"⚠️ generator_list_loop error on `{name}`: {e}")
-
-    @generator_list_loop.before_loop
-    async def _before_generator_list_loop(self):
-        await self.bot.wait_until_ready()
-        # small startup stagger to avoid a burst of PATCH edits right after boot
-        await asyncio.sleep(float(os.getenv("GEN_REFRESH_STARTUP_STAGGER_SEC", "2.0")))
+        await refresh_dashboard(self.bot, name)  # self-heal + update
 
     @app_commands.command(name="create_gen_list", description="Create a new generator list")
     @app_commands.describe(name="Name of new generator list")
     async def create_gen_list(self, interaction: discord.Interaction, name: str):
-        if gen_list_exists(name):
+        if await agen_list_exists(name):
             return await interaction.response.send_message(
                 f"⚠️ Generator list `{name}` already exists.", ephemeral=True
             )
-        save_gen_list(name, [])
+        await asave_gen_list(name, [])
         await interaction.response.send_message(
             f"✅ Created generator list `{name}`.", ephemeral=True
         )
-        await refresh_dashboard(self.bot, name)
+        self.refresh_queue.request(name)
 
     @app_commands.command(name="delete_gen_list", description="Delete a generator list")
     @app_commands.describe(name="Name of generator list to delete")
     async def delete_gen_list_cmd(self, interaction: discord.Interaction, name: str):
-        if not gen_list_exists(name):
+        if not await agen_list_exists(name):
             return await interaction.response.send_message(
                 f"❌ `{name}` not found.", ephemeral=True
             )
-        delete_gen_list(name)
+        await adelete_gen_list(name)
+        self.refresh_queue.discard(name)  # nothing left to refresh
+        forget_dashboard_hash(name)
+        forget_render(name)
         await interaction.response.send_message(
             f"🗑️ Deleted generator list `{name}`.", ephemeral=True
         )
-        await refresh_dashboard(self.bot, name)
 
     @app_commands.command(name="add_gen_tek", description="Add a Tek generator")
     @app_commands.describe(
@@ -425,20 +954,20 @@ class GeneratorCog(commands.Cog):
         element: int = 0,
         shards: int = 0,
     ):
-        if not gen_list_exists(list_name):
-            return await interaction.response.send_message(
-                f"❌ `{list_name}` not found.", ephemeral=True
-            )
-        data = load_gen_list(list_name)
-        if any(g.get("name", "").lower() == gen_name.lower() for g in data):
-            return await interaction.response.send_message(
-                f"❌ Generator `{gen_name}` already exists.", ephemeral=True
-            )
-        add_to_gen_list(list_name, gen_name, "Tek", element, shards, 0, 0)
+        async with gen_doc(list_name) as data:
+            if data is None:
+                return await interaction.response.send_message(
+                    f"❌ `{list_name}` not found.", ephemeral=True
+                )
+            if await agen_item_index(list_name, gen_name) is not None:
+                return await interaction.response.send_message(
+                    f"❌ Generator `{gen_name}` already exists.", ephemeral=True
+                )
+            data.append(new_gen_item(gen_name, "Tek", element, shards, 0, 0))
         await interaction.response.send_message(
             f"✅ Added Tek generator `{gen_name}`.", ephemeral=True
         )
-        await refresh_dashboard(self.bot, list_name)
+        self.refresh_queue.request(list_name)
 
     @app_commands.command(name="add_gen_electrical", description="Add an Electrical generator")
     @app_commands.describe(
@@ -455,20 +984,20 @@ class GeneratorCog(commands.Cog):
         gas: int = 0,
         imbued: int = 0,
     ):
-        if not gen_list_exists(list_name):
-            return await interaction.response.send_message(
-                f"❌ `{list_name}` not found.", ephemeral=True
-            )
-        data = load_gen_list(list_name)
-        if any(g.get("name", "").lower() == gen_name.lower() for g in data):
-            return await interaction.response.send_message(
-                f"❌ Generator `{gen_name}` already exists.", ephemeral=True
-            )
-        add_to_gen_list(list_name, gen_name, "Electrical", 0, 0, gas, imbued)
+        async with gen_doc(list_name) as data:
+            if data is None:
+                return await interaction.response.send_message(
+                    f"❌ `{list_name}` not found.", ephemeral=True
+                )
+            if await agen_item_index(list_name, gen_name) is not None:
+                return await interaction.response.send_message(
+                    f"❌ Generator `{gen_name}` already exists.", ephemeral=True
+                )
+            data.append(new_gen_item(gen_name, "Electrical", 0, 0, gas, imbued))
         await interaction.response.send_message(
             f"✅ Added Electrical generator `{gen_name}`.", ephemeral=True
         )
-        await refresh_dashboard(self.bot, list_name)
+        self.refresh_queue.request(list_name)
 
     @app_commands.command(name="edit_gen_tek", description="Edit a Tek generator entry")
     @app_commands.describe(
@@ -485,32 +1014,30 @@ class GeneratorCog(commands.Cog):
         element: int,
         shards: int,
     ):
-        if not gen_list_exists(list_name):
-            return await interaction.response.send_message(
-                f"❌ `{list_name}` not found.", ephemeral=True
-            )
-        data = load_gen_list(list_name)
-        for item in data:
-            if item.get("name") == gen_name and item.get("type") == "Tek":
+        async with gen_doc(list_name) as data:
+            if data is None:
+                return await interaction.response.send_message(
+                    f"❌ `{list_name}` not found.", ephemeral=True
+                )
+            idx = await agen_item_index(list_name, gen_name)
+            item = data[idx] if idx is not None else None
+            if item is not None and item.get("type") != "Tek":
+                item = None
+            if item is not None:
                 item["element"] = int(element)
                 item["shards"] = int(shards)
                 item["timestamp"] = time.time()  # reset timer on edit (fresh refuel)
                 item["alerted_low"] = False
                 item["alerted_empty"] = False
-                save_gen_list(list_name, data)
-                await interaction.response.send_message(
-                    f"✅ Updated Tek generator `{gen_name}`.", ephemeral=True
-                )
-                try:
-                    await refresh_dashboard(self.bot, list_name)
-                except Exception as e:
-                    await log_to_channel(
-                        self.bot, f"⚠️ refresh_dashboard failed for `{list_name}` after edit: {e}"
-                    )
-                return
+
+        if item is None:
+            return await interaction.response.send_message(
+                f"❌ Tek generator `{gen_name}` not found.", ephemeral=True
+            )
         await interaction.response.send_message(
-            f"❌ Tek generator `{gen_name}` not found.", ephemeral=True
+            f"✅ Updated Tek generator `{gen_name}`.", ephemeral=True
         )
+        self.refresh_queue.request(list_name)
 
     @app_commands.command(
         name="edit_gen_electrical", description="Edit an Electrical generator entry"
@@ -529,28 +1056,30 @@ class GeneratorCog(commands.Cog):
         gas: int,
         imbued: int,
     ):
-        if not gen_list_exists(list_name):
-            return await interaction.response.send_message(
-                f"❌ `{list_name}` not found.", ephemeral=True
-            )
-        data = load_gen_list(list_name)
-        for item in data:
-            if item.get("name") == gen_name and item.get("type") == "Electrical":
+        async with gen_doc(list_name) as data:
+            if data is None:
+                return await interaction.response.send_message(
+                    f"❌ `{list_name}` not found.", ephemeral=True
+                )
+            idx = await agen_item_index(list_name, gen_name)
+            item = data[idx] if idx is not None else None
+            if item is not None and item.get("type") != "Electrical":
+                item = None
+            if item is not None:
                 item["gas"] = int(gas)
                 item["imbued"] = int(imbued)
                 item["timestamp"] = time.time()  # reset timer on edit (fresh refuel)
                 item["alerted_low"] = False
                 item["alerted_empty"] = False
-                save_gen_list(list_name, data)
-                await interaction.response.send_message(
-                    f"✅ Updated Electrical generator `{gen_name}`.", ephemeral=True
-                )
-                await refresh_dashboard(self.bot, list_name)
-                return
 
+        if item is None:
+            return await interaction.response.send_message(
+                f"❌ Electrical generator `{gen_name}` not found.", ephemeral=True
+            )
         await interaction.response.send_message(
-            f"❌ Electrical generator `{gen_name}` not found.", ephemeral=True
+            f"✅ Updated Electrical generator `{gen_name}`.", ephemeral=True
         )
+        self.refresh_queue.request(list_name)
 
     # ─── Bulk update all Tek gens in a list ─────────────────────────────────────
     @app_commands.command(
@@ -565,44 +1094,37 @@ class GeneratorCog(commands.Cog):
     async def update_all_gens_tek(
         self, interaction: discord.Interaction, list_name: str, element: int, shards: int
     ):
-        if not gen_list_exists(list_name):
-            return await interaction.response.send_message(
-                f"❌ `{list_name}` not found.", ephemeral=True
-            )
-
-        data = load_gen_list(list_name)
-        if not data:
-            return await interaction.response.send_message(
-                f"⚠️ `{list_name}` is empty.", ephemeral=True
-            )
+        async with gen_doc(list_name) as data:
+            if data is None:
+                return await interaction.response.send_message(
+                    f"❌ `{list_name}` not found.", ephemeral=True
+                )
+            if not data:
+                return await interaction.response.send_message(
+                    f"⚠️ `{list_name}` is empty.", ephemeral=True
+                )
 
-        now = time.time()
-        updated = 0
-        for item in data:
-            if item.get("type") == "Tek":
-                item["element"] = max(0, int(element))
-                item["shards"] = max(0, int(shards))
-                item["timestamp"] = now
-                item["alerted_low"] = False
-                item["alerted_empty"] = False
-                updated += 1
+            now = time.time()
+            updated = 0
+            for item in data:
+                if item.get("type") == "Tek":
+                    item["element"] = max(0, int(element))
+                    item["shards"] = max(0, int(shards))
+                    item["timestamp"] = now
+                    item["alerted_low"] = False
+                    item["alerted_empty"] = False
+                    updated += 1
 
         if updated == 0:
             return await interaction.response.send_message(
                 f"⚠️ No Tek generators found in `{list_name}`.", ephemeral=True
             )
 
-        save_gen_list(list_name, data)
         await interaction.response.send_message(
             f"✅ Updated **{updated}** Tek generator(s) in `{list_name}` to **{element} element / {shards} shards**.",
             ephemeral=True,
         )
-        try:
-            await refresh_dashboard(self.bot, list_name)
-        except Exception as e:
-            await log_to_channel(
-                self.bot, f"⚠️ refresh_dashboard failed for `{list_name}` after bulk Tek update: {e}"
-            )
+        self.refresh_queue.request(list_name)
 
     # ─── Bulk update all Electrical gens in a list ─────────────────────────────
     @app_commands.command(
@@ -617,45 +1139,43 @@ class GeneratorCog(commands.Cog):
     async def update_all_gens_electrical(
         self, interaction: discord.Interaction, list_name: str, gas: int = -1, imbued: int = -1
     ):
-        if not gen_list_exists(list_name):
-            return await interaction.response.send_message(
-                f"❌ `{list_name}` not found.", ephemeral=True
-            )
-
         if gas < 0 and imbued < 0:
             return await interaction.response.send_message(
                 "⚠️ Provide at least one of `gas` or `imbued` (≥ 0) to update.", ephemeral=True
             )
 
-        data = load_gen_list(list_name)
-        if not data:
-            return await interaction.response.send_message(
-                f"⚠️ `{list_name}` is empty.", ephemeral=True
-            )
+        async with gen_doc(list_name) as data:
+            if data is None:
+                return await interaction.response.send_message(
+                    f"❌ `{list_name}` not found.", ephemeral=True
+                )
+            if not data:
+                return await interaction.response.send_message(
+                    f"⚠️ `{list_name}` is empty.", ephemeral=True
+                )
 
-        now = time.time()
-        updated = 0
-        for item in data:
-            if item.get("type") == "Electrical":
-                changed = False
-                if gas >= 0:
-                    item["gas"] = int(gas)
-                    changed = True
-                if imbued >= 0:
-                    item["imbued"] = int(imbued)
-                    changed = True
-                if changed:
-                    item["timestamp"] = now
-                    item["alerted_low"] = False
-                    item["alerted_empty"] = False
-                    updated += 1
+            now = time.time()
+            updated = 0
+            for item in data:
+                if item.get("type") == "Electrical":
+                    changed = False
+                    if gas >= 0:
+                        item["gas"] = int(gas)
+                        changed = True
+                    if imbued >= 0:
+                        item["imbued"] = int(imbued)
+                        changed = True
+                    if changed:
+                        item["timestamp"] = now
+                        item["alerted_low"] = False
+                        item["alerted_empty"] = False
+                        updated += 1
 
         if updated == 0:
             return await interaction.response.send_message(
                 f"⚠️ No Electrical generators updated in `{list_name}`.", ephemeral=True
             )
 
-        save_gen_list(list_name, data)
         summary_parts: list[str] = []
         if gas >= 0:
             summary_parts.append(f"**{gas} gas**")
@@ -666,30 +1186,24 @@ class GeneratorCog(commands.Cog):
             f"✅ Updated **{updated}** Electrical generator(s) in `{list_name}` to {summary}.",
             ephemeral=True,
         )
-        try:
-            await refresh_dashboard(self.bot, list_name)
-        except Exception as e:
-            await log_to_channel(
-                self.bot,
-                f"⚠️ refresh_dashboard failed for `{list_name}` after bulk Elec update: {e}",
-            )
+        self.refresh_queue.request(list_name)
 
     @app_commands.command(name="remove_gen", description="Remove a generator entry")
     @app_commands.describe(list_name="Generator list", gen_name="Generator to remove")
     async def remove_gen(self, interaction: discord.Interaction, list_name: str, gen_name: str):
-        if not gen_list_exists(list_name):
-            return await interaction.response.send_message(
-                f"❌ `{list_name}` not found.", ephemeral=True
-            )
-        data = load_gen_list(list_name)
-        new_data = [i for i in data if i.get("name") != gen_name]
-        if len(new_data) == len(data):
-            return await interaction.response.send_message(
-                f"❌ Generator `{gen_name}` not found.", ephemeral=True
-            )
-        save_gen_list(list_name, new_data)
+        async with gen_doc(list_name) as data:
+            if data is None:
+                return await interaction.response.send_message(
+                    f"❌ `{list_name}` not found.", ephemeral=True
+                )
+            idx = await agen_item_index(list_name, gen_name)
+            if idx is None:
+                return await interaction.response.send_message(
+                    f"❌ Generator `{gen_name}` not found.", ephemeral=True
+                )
+            data.pop(idx)
         await interaction.response.send_message(f"🗑️ Removed `{gen_name}`.", ephemeral=True)
-        await refresh_dashboard(self.bot, list_name)
+        self.refresh_queue.request(list_name)
 
     @app_commands.command(name="reorder_gen", description="Reorder generator entries by index")
     @app_commands.describe(
@@ -700,20 +1214,21 @@ class GeneratorCog(commands.Cog):
     async def reorder_gen(
         self, interaction: discord.Interaction, list_name: str, from_index: int, to_index: int
     ):
-        if not gen_list_exists(list_name):
-            return await interaction.response.send_message(
-                f"❌ `{list_name}` not found.", ephemeral=True
-            )
-        data = load_gen_list(list_name)
-        if not (1 <= from_index <= len(data)) or not (1 <= to_index <= len(data)):
-            return await interaction.response.send_message("❌ Index out of range.", ephemeral=True)
-        item = data.pop(from_index - 1)
-        data.insert(to_index - 1, item)
-        save_gen_list(list_name, data)
+        async with gen_doc(list_name) as data:
+            if data is None:
+                return await interaction.response.send_message(
+                    f"❌ `{list_name}` not found.", ephemeral=True
+                )
+            if not (1 <= from_index <= len(data)) or not (1 <= to_index <= len(data)):
+                return await interaction.response.send_message(
+                    "❌ Index out of range.", ephemeral=True
+                )
+            item = data.pop(from_index - 1)
+            data.insert(to_index - 1, item)
         await interaction.response.send_message(
             f"✅ Moved `{item.get('name','?')}` from {from_index} → {to_index}.", ephemeral=True
         )
-        await refresh_dashboard(self.bot, list_name)
+        self.refresh_queue.request(list_name)
 
     @app_commands.command(
         name="set_gen_role", description="Set a role to ping when low or expiring soon"
@@ -722,11 +1237,11 @@ class GeneratorCog(commands.Cog):
     async def set_gen_role(
         self, interaction: discord.Interaction, list_name: str, role: discord.Role
     ):
-        if not gen_list_exists(list_name):
+        if not await agen_list_exists(list_name):
             return await interaction.response.send_message(
                 f"❌ `{list_name}` not found.", ephemeral=True
             )
-        set_gen_list_role(list_name, role.id)
+        await aset_gen_list_role(list_name, role.id)
         await interaction.response.send_message(
             f"✅ Ping role set for `{list_name}`.", ephemeral=True
         )
@@ -739,11 +1254,11 @@ class GeneratorCog(commands.Cog):
     async def mute_gen_alerts(
         self, interaction: discord.Interaction, list_name: str, gen_name: str
     ):
-        if not gen_list_exists(list_name):
+        if not await agen_list_exists(list_name):
             return await interaction.response.send_message(
                 f"❌ `{list_name}` not found.", ephemeral=True
             )
-        ok = set_gen_item_alerts_muted(list_name, gen_name, True)
+        ok = await aset_gen_item_alerts_muted(list_name, gen_name, True)
         if not ok:
             return await interaction.response.send_message(
                 f"❌ Generator `{gen_name}` not found.", ephemeral=True
@@ -751,7 +1266,7 @@ class GeneratorCog(commands.Cog):
         await interaction.response.send_message(
             f"🔕 Alerts muted for `{gen_name}`.", ephemeral=True
         )
-        await refresh_dashboard(self.bot, list_name)
+        self.refresh_queue.request(list_name)
 
     @app_commands.command(
         name="unmute_gen_alerts", description="Unmute LOW/EMPTY alert pings for a generator"
@@ -760,11 +1275,11 @@ class GeneratorCog(commands.Cog):
     async def unmute_gen_alerts(
         self, interaction: discord.Interaction, list_name: str, gen_name: str
     ):
-        if not gen_list_exists(list_name):
+        if not await agen_list_exists(list_name):
             return await interaction.response.send_message(
                 f"❌ `{list_name}` not found.", ephemeral=True
             )
-        ok = set_gen_item_alerts_muted(list_name, gen_name, False)
+        ok = await aset_gen_item_alerts_muted(list_name, gen_name, False)
         if not ok:
             return await interaction.response.send_message(
                 f"❌ Generator `{gen_name}` not found.", ephemeral=True
@@ -772,7 +1287,7 @@ class GeneratorCog(commands.Cog):
         await interaction.response.send_message(
             f"🔔 Alerts unmuted for `{gen_name}`.", ephemeral=True
         )
-        await refresh_dashboard(self.bot, list_name)
+        self.refresh_queue.request(list_name)
 
 
 # ─── Cog setup for compatibility ───────────────────────────────────────────────
@@ -789,7 +1304,3 @@ async def setup(bot: commands.Bot):
         await bot.add_cog(GeneratorCog(bot))
     except CommandAlreadyRegistered:
         pass
-
-
-# alias for import compatibility (legacy)
-build_gen_timetable_embed = build_gen_embed
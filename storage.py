@@ -0,0 +1,376 @@
+# storage.py
+# Storage backends used by data_manager's write-back cache.
+#
+# A backend stores "documents" addressed by (kind, key):
+#   - per-name kinds (KIND_LIST, KIND_GEN): one document per list name
+#   - singleton kinds (dashboards, timers, autoprune): one document, key ""
+#
+# data_manager hands backends either a full document (write) or the document plus
+# the list of changes made since the last flush (apply). Backends that can persist
+# changes cheaply (e.g. SQLite: one row per item) override apply. The JSON file
+# backend rewrites the file, except for journaled kinds (generator lists), where
+# changes are appended to a per-document JSON-lines journal and folded back into the
+# snapshot once the journal grows past a size threshold.
+import os
+import json
+import hashlib
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # optional: DATA_FORMAT=orjson
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # optional: DATA_FORMAT=msgpack
+    msgpack = None
+
+KIND_LIST = "list"
+KIND_GEN = "gen"
+KIND_DASHBOARDS = "dashboards"
+KIND_GEN_DASHBOARDS = "gen_dashboards"
+KIND_TIMERS = "timers"
+KIND_AUTOPRUNE = "autoprune"
+
+NAMED_KINDS = (KIND_LIST, KIND_GEN)
+SINGLETON_KINDS = (KIND_DASHBOARDS, KIND_GEN_DASHBOARDS, KIND_TIMERS, KIND_AUTOPRUNE)
+
+# Returned by read() when a document does not exist
+MISSING = object()
+
+
+# ───────────────────────────── Serializers ──────────────────────────────
+# How documents are encoded on disk (DATA_FORMAT):
+#   json         compact stdlib JSON (default)
+#   json-pretty  indent=2, the original hand-editable layout
+#   orjson       compact JSON via orjson (pip install orjson)
+#   msgpack      MessagePack (pip install msgpack); binary, but files keep their names
+# decode() detects the format from the first byte, so existing files keep loading and
+# the format can be switched at any time: documents convert as they are rewritten.
+class Serializer:
+    name = "base"
+    binary = False  # True if dumps() output is not UTF-8 text
+
+    def dumps(self, obj: Any) -> bytes:
+        raise NotImplementedError
+
+
+class JsonSerializer(Serializer):
+    def __init__(self, indent: Optional[int] = None):
+        self.indent = indent
+        self.name = "json-pretty" if indent else "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        if self.indent:
+            return json.dumps(obj, indent=self.indent).encode("utf-8")
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+class OrjsonSerializer(Serializer):
+    name = "orjson"
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+
+class MsgpackSerializer(Serializer):
+    name = "msgpack"
+    binary = True
+
+    def dumps(self, obj: Any) -> bytes:
+        return msgpack.packb(obj, use_bin_type=True)
+
+
+def get_serializer(name: str) -> Serializer:
+    """Serializer for a DATA_FORMAT value; falls back to compact JSON if unavailable."""
+    name = (name or "json").strip().lower()
+    if name == "json-pretty":
+        return JsonSerializer(indent=2)
+    if name == "orjson" and orjson is not None:
+        return OrjsonSerializer()
+    if name == "msgpack" and msgpack is not None:
+        return MsgpackSerializer()
+    if name != "json":
+        print(f"[storage] DATA_FORMAT={name!r} is unavailable; using compact json")
+    return JsonSerializer()
+
+
+def available_serializers() -> List[Serializer]:
+    out: List[Serializer] = [JsonSerializer(indent=2), JsonSerializer()]
+    if orjson is not None:
+        out.append(OrjsonSerializer())
+    if msgpack is not None:
+        out.append(MsgpackSerializer())
+    return out
+
+
+def _is_msgpack(data: bytes) -> bool:
+    # Documents are maps or arrays: fixmap/fixarray (0x80-0x9f), array/map 16/32 (0xdc-0xdf).
+    # Neither range can start a JSON text, which begins with ASCII or a UTF-8 BOM.
+    return bool(data) and (0x80 <= data[0] <= 0x9F or 0xDC <= data[0] <= 0xDF)
+
+
+def decode(data: Union[bytes, str]) -> Any:
+    """Decode a document written by any of the serializers above."""
+    if isinstance(data, bytes):
+        if _is_msgpack(data):
+            if msgpack is None:
+                raise ValueError("document is msgpack-encoded but msgpack is not installed")
+            return msgpack.unpackb(data, raw=False, strict_map_key=False)
+        if data.startswith(b"\xef\xbb\xbf"):
+            data = data[3:]
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_line(obj: Any) -> str:
+    """One compact JSON line (journal entries are always JSON, whatever DATA_FORMAT is)."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+PRETTY_JSON = JsonSerializer(indent=2)
+
+
+# ───────────────────────────── I/O helpers ──────────────────────────────
+def _ensure_dir(path: str) -> None:
+    """Ensure the directory for a file (or the directory itself) exists."""
+    is_file = os.path.splitext(path)[1] != ""
+    directory = (os.path.dirname(path) or ".") if is_file else path
+    if not os.path.exists(directory):
+        os.makedirs(directory, exist_ok=True)
+
+
+def _safe_read_doc(path: str, default: Any) -> Any:
+    try:
+        if not os.path.exists(path):
+            return default
+        with open(path, "rb") as f:
+            return decode(f.read())
+    except Exception as e:
+        print(f"[storage] could not read {path}: {e}")
+        return default
+
+
+def _safe_write_doc(path: str, data: Any, serializer: Serializer = PRETTY_JSON) -> int:
+    """Atomically replace `path` with the encoded document. Returns bytes written."""
+    _ensure_dir(path)
+    payload = serializer.dumps(data)
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(payload)
+    os.replace(tmp, path)
+    return len(payload)
+
+
+# ───────────────────────────── Changes ──────────────────────────────────
+# Changes are plain dicts so they can be logged or replayed as JSON:
+#   {"op": "put", "key": k, "value": v}          mapping docs (dashboards, timers)
+#   {"op": "delete", "key": k}                   mapping docs
+#   {"op": "set_item", "index": i, "item": {}}   generator docs: replace one item
+#   {"op": "set_field", "index": i, "field": f, "value": v}   one field of one item
+#   {"op": "add_item", "index": i, "item": {}}   generator docs: insert an item at i
+#   {"op": "remove_item", "index": i}            generator docs: drop the item at i
+#   {"op": "reorder", "order": [old indices]}    generator docs: permute items
+#   {"op": "set_meta", "field": f, "value": v}   generator docs: top-level field (role_id)
+def apply_changes(doc: Any, changes: List[Dict[str, Any]]) -> Any:
+    """Apply `changes` to `doc` in place and return it."""
+    for ch in changes:
+        op = ch.get("op")
+        if op == "put":
+            doc[ch["key"]] = ch["value"]
+        elif op == "delete":
+            doc.pop(ch["key"], None)
+        elif op == "set_item":
+            doc["items"][ch["index"]] = ch["item"]
+        elif op == "set_field":
+            doc["items"][ch["index"]][ch["field"]] = ch["value"]
+        elif op == "add_item":
+            doc["items"].insert(ch["index"], ch["item"])
+        elif op == "remove_item":
+            del doc["items"][ch["index"]]
+        elif op == "reorder":
+            items = doc["items"]
+            doc["items"] = [items[i] for i in ch["order"]]
+        elif op == "set_meta":
+            doc[ch["field"]] = ch["value"]
+        else:
+            raise ValueError(f"unknown change op: {op!r}")
+    return doc
+
+
+# ───────────────────────────── Backends ─────────────────────────────────
+class StorageBackend:
+    """Interface for document storage. Methods may be called from any thread."""
+
+    name = "base"
+
+    def read(self, kind: str, key: str) -> Any:
+        raise NotImplementedError
+
+    def write(self, kind: str, key: str, doc: Any) -> None:
+        raise NotImplementedError
+
+    def apply(self, kind: str, key: str, doc: Any, changes: List[Dict[str, Any]]) -> None:
+        """Persist `changes` (already applied to `doc`). Default: write the whole doc."""
+        self.write(kind, key, doc)
+
+    def delete(self, kind: str, key: str) -> None:
+        raise NotImplementedError
+
+    def exists(self, kind: str, key: str) -> bool:
+        return self.read(kind, key) is not MISSING
+
+    def keys(self, kind: str) -> List[str]:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+JOURNAL_SUFFIX = ".journal.jsonl"
+
+
+def _snapshot_id(path: str) -> str:
+    """Content hash of a snapshot file; survives copies/backups, unlike mtime or inode."""
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+class JsonFileBackend(StorageBackend):
+    """Original layout: one pretty-printed JSON file per list + one file per mapping.
+
+    For `journal_kinds`, apply() appends changes to <key>.journal.jsonl next to the
+    snapshot (<name>.journal.jsonl beside a singleton file). The journal's first line names the snapshot version it extends, so a
+    journal left behind by a crash mid-compaction is recognized as stale and dropped.
+    """
+
+    name = "json"
+
+    def __init__(
+        self,
+        dirs: Dict[str, str],
+        files: Dict[str, str],
+        journal_kinds: Iterable[str] = (),
+        compact_bytes: int = 64 * 1024,
+        serializer: Serializer = PRETTY_JSON,
+    ):
+        self.dirs = dirs  # kind -> directory holding <key>.json
+        self.files = files  # kind -> file path for singleton docs
+        self.journal_kinds = set(journal_kinds) & (set(dirs) | set(files))
+        self.compact_bytes = compact_bytes
+        self.serializer = serializer
+        self.compactions = 0
+        self.bytes_written = 0  # snapshots + journal appends, for diagnostics/benchmarks
+        self._listings: Dict[str, Tuple[int, List[str]]] = {}  # kind -> (dir mtime, keys)
+
+    def path(self, kind: str, key: str) -> str:
+        if kind in self.dirs:
+            return os.path.join(self.dirs[kind], f"{key}.json")
+        return self.files[kind]
+
+    def journal_path(self, kind: str, key: str) -> str:
+        if kind in self.dirs:
+            return os.path.join(self.dirs[kind], f"{key}{JOURNAL_SUFFIX}")
+        return os.path.splitext(self.files[kind])[0] + JOURNAL_SUFFIX
+
+    def read(self, kind: str, key: str) -> Any:
+        doc = _safe_read_doc(self.path(kind, key), default=MISSING)
+        if doc is not MISSING and kind in self.journal_kinds:
+            doc = self._replay(kind, key, doc)
+        return doc
+
+    def write(self, kind: str, key: str, doc: Any) -> None:
+        path = self.path(kind, key)
+        if not os.path.exists(path):
+            self._listings.pop(kind, None)
+        self.bytes_written += _safe_write_doc(path, doc, self.serializer)
+        if kind in self.journal_kinds:
+            self._drop_journal(kind, key)
+
+    def apply(self, kind: str, key: str, doc: Any, changes: List[Dict[str, Any]]) -> None:
+        path = self.path(kind, key)
+        if kind not in self.journal_kinds or not os.path.exists(path):
+            return self.write(kind, key, doc)
+        jpath = self.journal_path(kind, key)
+        lines = [json_line(ch) for ch in changes]
+        if not os.path.exists(jpath):
+            lines.insert(0, json_line({"base": _snapshot_id(path)}))
+        with open(jpath, "a", encoding="utf-8") as f:
+            start = f.tell()
+            f.write("\n".join(lines) + "\n")
+            size = f.tell()
+        self.bytes_written += size - start
+        if size >= self.compact_bytes:
+            # Compaction: `doc` is already the fully applied document
+            self.compactions += 1
+            self.write(kind, key, doc)
+
+    def _replay(self, kind: str, key: str, doc: Any) -> Any:
+        jpath = self.journal_path(kind, key)
+        if not os.path.exists(jpath):
+            return doc
+        with open(jpath, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+        try:
+            header = decode(lines[0]) if lines else {}
+        except ValueError:
+            header = {}
+        if header.get("base") != _snapshot_id(self.path(kind, key)):
+            # Stale (snapshot was rewritten after this journal) or unreadable header
+            self._drop_journal(kind, key)
+            return doc
+        torn = False
+        for line in lines[1:]:
+            try:
+                if not line.endswith("\n"):
+                    raise ValueError("incomplete line")
+                apply_changes(doc, [decode(line)])
+            except (ValueError, KeyError, IndexError, TypeError):
+                torn = True  # crash mid-append: keep everything before it
+                break
+        if torn:
+            self.write(kind, key, doc)
+        return doc
+
+    def compact(self, kind: str, key: str) -> bool:
+        """Fold a document's journal into its snapshot now. Returns True if there was one."""
+        if kind not in self.journal_kinds or not os.path.exists(self.journal_path(kind, key)):
+            return False
+        doc = self.read(kind, key)
+        if os.path.exists(self.journal_path(kind, key)):
+            self.compactions += 1
+            self.write(kind, key, doc)
+        return True
+
+    def _drop_journal(self, kind: str, key: str) -> None:
+        jpath = self.journal_path(kind, key)
+        if os.path.exists(jpath):
+            os.remove(jpath)
+
+    def delete(self, kind: str, key: str) -> None:
+        p = self.path(kind, key)
+        if os.path.exists(p):
+            os.remove(p)
+        self._listings.pop(kind, None)
+        if kind in self.journal_kinds:
+            self._drop_journal(kind, key)
+
+    def exists(self, kind: str, key: str) -> bool:
+        return os.path.exists(self.path(kind, key))
+
+    def keys(self, kind: str) -> List[str]:
+        if kind not in self.dirs:
+            return [""] if os.path.exists(self.files[kind]) else []
+        directory = self.dirs[kind]
+        _ensure_dir(directory)
+        # Our own creates/deletes drop the listing; the mtime check catches everyone else's
+        mtime = os.stat(directory).st_mtime_ns
+        cached = self._listings.get(kind)
+        if cached is None or cached[0] != mtime:
+            keys = sorted(fn[:-5] for fn in os.listdir(directory) if fn.endswith(".json"))
+            cached = self._listings[kind] = (mtime, keys)
+        return list(cached[1])
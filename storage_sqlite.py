@@ -0,0 +1,366 @@
+# storage_sqlite.py
+# SQLite storage backend (STORAGE_BACKEND=sqlite).
+#
+# One row per list item, generator, dashboard mapping, timer and auto-prune channel,
+# in a single WAL-mode database. Point updates coming from data_manager (a muted
+# generator, a new dashboard id, one timer) become a single indexed row write
+# instead of a full-file rewrite.
+#
+# One-shot import from the JSON layout:
+#   python storage_sqlite.py            (uses DATABASE_PATH / SQLITE_PATH)
+# The import also runs automatically the first time the bot starts on an empty DB.
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional, Union
+
+from storage import (
+    KIND_AUTOPRUNE,
+    KIND_DASHBOARDS,
+    KIND_GEN,
+    KIND_GEN_DASHBOARDS,
+    KIND_LIST,
+    KIND_TIMERS,
+    MISSING,
+    NAMED_KINDS,
+    SINGLETON_KINDS,
+    JsonSerializer,
+    Serializer,
+    StorageBackend,
+    _ensure_dir,
+    decode,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS lists (
+    name TEXT PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS list_items (
+    list_name TEXT NOT NULL,
+    position  INTEGER NOT NULL,
+    data      TEXT NOT NULL,
+    PRIMARY KEY (list_name, position)
+);
+CREATE TABLE IF NOT EXISTS gen_lists (
+    name TEXT PRIMARY KEY,
+    meta TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS gen_items (
+    list_name TEXT NOT NULL,
+    position  INTEGER NOT NULL,
+    name      TEXT,
+    data      TEXT NOT NULL,
+    PRIMARY KEY (list_name, position)
+);
+CREATE TABLE IF NOT EXISTS dashboards (
+    kind      TEXT NOT NULL,
+    list_name TEXT NOT NULL,
+    data      TEXT NOT NULL,
+    PRIMARY KEY (kind, list_name)
+);
+CREATE TABLE IF NOT EXISTS timers (
+    timer_id TEXT PRIMARY KEY,
+    data     TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS autoprune (
+    guild_id   TEXT NOT NULL,
+    channel_id TEXT NOT NULL,
+    data       TEXT NOT NULL,
+    PRIMARY KEY (guild_id, channel_id)
+);
+"""
+
+_IMPORT_MARKER = "imported_from_json"
+
+
+class SqliteBackend(StorageBackend):
+    name = "sqlite"
+
+    def __init__(self, path: str, serializer: Optional[Serializer] = None):
+        _ensure_dir(path)
+        self.path = path
+        # Row payloads: JSON text, or BLOBs for binary formats (msgpack). Reads accept both.
+        self.serializer = serializer or JsonSerializer()
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    def _dumps(self, obj: Any) -> Union[str, bytes]:
+        data = self.serializer.dumps(obj)
+        return data if self.serializer.binary else data.decode("utf-8")
+
+    # ── reads ───────────────────────────────────────────────────────────────
+    def read(self, kind: str, key: str) -> Any:
+        with self._lock:
+            cur = self._db.cursor()
+            if kind == KIND_LIST:
+                if not cur.execute("SELECT 1 FROM lists WHERE name=?", (key,)).fetchone():
+                    return MISSING
+                rows = cur.execute(
+                    "SELECT data FROM list_items WHERE list_name=? ORDER BY position", (key,)
+                ).fetchall()
+                return [decode(r[0]) for r in rows]
+
+            if kind == KIND_GEN:
+                row = cur.execute("SELECT meta FROM gen_lists WHERE name=?", (key,)).fetchone()
+                if not row:
+                    return MISSING
+                doc = decode(row[0])
+                rows = cur.execute(
+                    "SELECT data FROM gen_items WHERE list_name=? ORDER BY position", (key,)
+                ).fetchall()
+                doc["items"] = [decode(r[0]) for r in rows]
+                return doc
+
+            if kind in (KIND_DASHBOARDS, KIND_GEN_DASHBOARDS):
+                rows = cur.execute(
+                    "SELECT list_name, data FROM dashboards WHERE kind=?", (kind,)
+                ).fetchall()
+                return {r[0]: decode(r[1]) for r in rows} if rows else MISSING
+
+            if kind == KIND_TIMERS:
+                rows = cur.execute("SELECT timer_id, data FROM timers").fetchall()
+                return {r[0]: decode(r[1]) for r in rows} if rows else MISSING
+
+            if kind == KIND_AUTOPRUNE:
+                rows = cur.execute("SELECT guild_id, channel_id, data FROM autoprune").fetchall()
+                if not rows:
+                    return MISSING
+                guilds: Dict[str, Any] = {}
+                for gid, cid, data in rows:
+                    guilds.setdefault(gid, {"channels": {}})["channels"][cid] = decode(data)
+                return {"guilds": guilds}
+
+        raise ValueError(f"unknown kind: {kind!r}")
+
+    def exists(self, kind: str, key: str) -> bool:
+        if kind == KIND_LIST:
+            sql = "SELECT 1 FROM lists WHERE name=?"
+        elif kind == KIND_GEN:
+            sql = "SELECT 1 FROM gen_lists WHERE name=?"
+        else:
+            return self.read(kind, key) is not MISSING
+        with self._lock:
+            return self._db.execute(sql, (key,)).fetchone() is not None
+
+    def keys(self, kind: str) -> List[str]:
+        if kind not in NAMED_KINDS:
+            return [""] if self.read(kind, "") is not MISSING else []
+        table = "lists" if kind == KIND_LIST else "gen_lists"
+        with self._lock:
+            rows = self._db.execute(f"SELECT name FROM {table} ORDER BY name").fetchall()
+        return [r[0] for r in rows]
+
+    # ── full writes ─────────────────────────────────────────────────────────
+    def _write_locked(self, cur: sqlite3.Cursor, kind: str, key: str, doc: Any) -> None:
+        if kind == KIND_LIST:
+            cur.execute("INSERT OR IGNORE INTO lists (name) VALUES (?)", (key,))
+            cur.execute("DELETE FROM list_items WHERE list_name=?", (key,))
+            cur.executemany(
+                "INSERT INTO list_items (list_name, position, data) VALUES (?, ?, ?)",
+                [(key, i, self._dumps(it)) for i, it in enumerate(doc or [])],
+            )
+        elif kind == KIND_GEN:
+            if isinstance(doc, list):  # legacy top-level list of items
+                doc = {"role_id": None, "items": doc}
+            meta = {k: v for k, v in doc.items() if k != "items"}
+            cur.execute(
+                "INSERT OR REPLACE INTO gen_lists (name, meta) VALUES (?, ?)",
+                (key, self._dumps(meta)),
+            )
+            cur.execute("DELETE FROM gen_items WHERE list_name=?", (key,))
+            cur.executemany(
+                "INSERT INTO gen_items (list_name, position, name, data) VALUES (?, ?, ?, ?)",
+                [
+                    (key, i, it.get("name") if isinstance(it, dict) else None, self._dumps(it))
+                    for i, it in enumerate(doc.get("items", []))
+                ],
+            )
+        elif kind in (KIND_DASHBOARDS, KIND_GEN_DASHBOARDS):
+            cur.execute("DELETE FROM dashboards WHERE kind=?", (kind,))
+            cur.executemany(
+                "INSERT INTO dashboards (kind, list_name, data) VALUES (?, ?, ?)",
+                [(kind, name, self._dumps(v)) for name, v in (doc or {}).items()],
+            )
+        elif kind == KIND_TIMERS:
+            cur.execute("DELETE FROM timers")
+            cur.executemany(
+                "INSERT INTO timers (timer_id, data) VALUES (?, ?)",
+                [(tid, self._dumps(v)) for tid, v in (doc or {}).items()],
+            )
+        elif kind == KIND_AUTOPRUNE:
+            cur.execute("DELETE FROM autoprune")
+            rows = []
+            for gid, g in ((doc or {}).get("guilds") or {}).items():
+                for cid, cfg in ((g or {}).get("channels") or {}).items():
+                    rows.append((str(gid), str(cid), self._dumps(cfg)))
+            cur.executemany(
+                "INSERT INTO autoprune (guild_id, channel_id, data) VALUES (?, ?, ?)", rows
+            )
+        else:
+            raise ValueError(f"unknown kind: {kind!r}")
+
+    def write(self, kind: str, key: str, doc: Any) -> None:
+        with self._lock:
+            cur = self._db.cursor()
+            cur.execute("BEGIN")
+            try:
+                self._write_locked(cur, kind, key, doc)
+                cur.execute("COMMIT")
+            except Exception:
+                cur.execute("ROLLBACK")
+                raise
+
+    # ── incremental writes ──────────────────────────────────────────────────
+    def apply(self, kind: str, key: str, doc: Any, changes: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            cur = self._db.cursor()
+            cur.execute("BEGIN")
+            try:
+                for ch in changes:
+                    if not self._apply_one(cur, kind, key, ch):
+                        # Unknown shape for this table: fall back to a full rewrite
+                        self._write_locked(cur, kind, key, doc)
+                        break
+                cur.execute("COMMIT")
+            except Exception:
+                cur.execute("ROLLBACK")
+                raise
+
+    def _apply_one(self, cur: sqlite3.Cursor, kind: str, key: str, ch: Dict[str, Any]) -> bool:
+        op = ch.get("op")
+        if kind in (KIND_DASHBOARDS, KIND_GEN_DASHBOARDS):
+            if op == "put":
+                cur.execute(
+                    "INSERT OR REPLACE INTO dashboards (kind, list_name, data) VALUES (?, ?, ?)",
+                    (kind, ch["key"], self._dumps(ch["value"])),
+                )
+                return True
+            if op == "delete":
+                cur.execute(
+                    "DELETE FROM dashboards WHERE kind=? AND list_name=?", (kind, ch["key"])
+                )
+                return True
+        elif kind == KIND_TIMERS:
+            if op == "put":
+                cur.execute(
+                    "INSERT OR REPLACE INTO timers (timer_id, data) VALUES (?, ?)",
+                    (ch["key"], self._dumps(ch["value"])),
+                )
+                return True
+            if op == "delete":
+                cur.execute("DELETE FROM timers WHERE timer_id=?", (ch["key"],))
+                return True
+        elif kind == KIND_GEN:
+            if op == "set_item":
+                item = ch["item"]
+                cur.execute(
+                    "UPDATE gen_items SET name=?, data=? WHERE list_name=? AND position=?",
+                    (item.get("name"), self._dumps(item), key, int(ch["index"])),
+                )
+                return cur.rowcount == 1
+            if op == "set_field":
+                row = cur.execute(
+                    "SELECT data FROM gen_items WHERE list_name=? AND position=?",
+                    (key, int(ch["index"])),
+                ).fetchone()
+                if not row:
+                    return False
+                item = decode(row[0])
+                item[ch["field"]] = ch["value"]
+                cur.execute(
+                    "UPDATE gen_items SET name=?, data=? WHERE list_name=? AND position=?",
+                    (item.get("name"), self._dumps(item), key, int(ch["index"])),
+                )
+                return True
+            if op == "add_item":
+                # Appends only; inserting in the middle would shift every later position
+                (count,) = cur.execute(
+                    "SELECT COUNT(*) FROM gen_items WHERE list_name=?", (key,)
+                ).fetchone()
+                if int(ch["index"]) != count:
+                    return False
+                item = ch["item"]
+                cur.execute(
+                    "INSERT INTO gen_items (list_name, position, name, data) VALUES (?, ?, ?, ?)",
+                    (key, count, item.get("name"), self._dumps(item)),
+                )
+                return True
+            if op == "set_meta":
+                row = cur.execute("SELECT meta FROM gen_lists WHERE name=?", (key,)).fetchone()
+                if not row:
+                    return False
+                meta = decode(row[0])
+                meta[ch["field"]] = ch["value"]
+                cur.execute("UPDATE gen_lists SET meta=? WHERE name=?", (self._dumps(meta), key))
+                return True
+        return False
+
+    def delete(self, kind: str, key: str) -> None:
+        with self._lock:
+            cur = self._db.cursor()
+            cur.execute("BEGIN")
+            try:
+                if kind == KIND_LIST:
+                    cur.execute("DELETE FROM list_items WHERE list_name=?", (key,))
+                    cur.execute("DELETE FROM lists WHERE name=?", (key,))
+                elif kind == KIND_GEN:
+                    cur.execute("DELETE FROM gen_items WHERE list_name=?", (key,))
+                    cur.execute("DELETE FROM gen_lists WHERE name=?", (key,))
+                else:
+                    self._write_locked(cur, kind, key, None)
+                cur.execute("COMMIT")
+            except Exception:
+                cur.execute("ROLLBACK")
+                raise
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    # ── JSON import ─────────────────────────────────────────────────────────
+    def is_imported(self) -> bool:
+        with self._lock:
+            row = self._db.execute("SELECT value FROM meta WHERE key=?", (_IMPORT_MARKER,))
+            return row.fetchone() is not None
+
+    def import_from(self, source: StorageBackend) -> Dict[str, int]:
+        """Copy every document from `source` into this DB. Returns documents copied per kind."""
+        counts: Dict[str, int] = {}
+        for kind in NAMED_KINDS + SINGLETON_KINDS:
+            n = 0
+            for key in source.keys(kind):
+                doc = source.read(kind, key)
+                if doc is MISSING:
+                    continue
+                self.write(kind, key, doc)
+                n += 1
+            counts[kind] = n
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                (_IMPORT_MARKER, self._dumps({"from": source.name, "counts": counts})),
+            )
+        return counts
+
+    def import_once(self, source: StorageBackend) -> Dict[str, int]:
+        """Run import_from(source) unless this DB has already been imported into."""
+        if self.is_imported():
+            return {}
+        counts = self.import_from(source)
+        if any(counts.values()):
+            print(f"[storage] imported JSON data into {self.path}: {counts}")
+        return counts
+
+
+if __name__ == "__main__":
+    import data_manager
+
+    db = SqliteBackend(data_manager.SQLITE_PATH, serializer=data_manager.SERIALIZER)
+    print(f"Importing {data_manager.BASE_DIR} -> {db.path}")
+    print(db.import_from(data_manager.JSON_BACKEND))
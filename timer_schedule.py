@@ -0,0 +1,197 @@
+# timer_schedule.py
+# When recurring and chained timers fire next.
+#
+# A timer record can carry, besides its end_time:
+#   "repeat": {"every": seconds}           fires every N seconds
+#   "repeat": {"cron": "m h dom mon dow"}  fires on a five-field cron schedule (TIMER_TZ)
+#   "chain": [{"name", "duration"}, ...], "step": i   runs the steps one after another;
+#                                          with "repeat": {"loop": True} it starts over
+# advance_timer() moves such a timer on to its next run in place when it fires, so the
+# same record and message are reused and the heap scheduler simply gets a new end_time.
+# Cron expressions are parsed once into sorted field values and cached.
+import datetime as dt
+import functools
+import os
+import re
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+# Time zone cron schedules are read in
+TIMER_TZ = ZoneInfo(os.getenv("TIMER_TZ", "UTC") or "UTC")
+# Shortest interval or chain step: every run is a write, a message edit and a ping
+MIN_REPEAT_SEC = 60
+
+_DURATION_RE = re.compile(r"(\d+)\s*([dhms])", re.IGNORECASE)
+_UNIT_SEC = {"d": 86400, "h": 3600, "m": 60, "s": 1}
+
+
+def parse_duration(text: str) -> int:
+    """Seconds in "1d2h", "4h30m", "45m" or "90s"; a bare number is minutes."""
+    text = text.strip()
+    if text.isdigit():
+        return int(text) * 60
+    parts = _DURATION_RE.findall(text)
+    if not parts or _DURATION_RE.sub("", text).strip():
+        raise ValueError(f"can't read duration {text!r} (e.g. 4h30m)")
+    return sum(int(n) * _UNIT_SEC[unit.lower()] for n, unit in parts)
+
+
+def parse_chain(text: str) -> List[Dict[str, object]]:
+    """Steps from "Egg: 2h, Baby: 4h30m, Juvenile: 1d" (name: duration, comma separated)."""
+    steps = []
+    for part in text.split(","):
+        name, sep, duration = part.rpartition(":")
+        if not sep or not name.strip():
+            raise ValueError(f"step {part.strip()!r} should look like 'Name: 2h'")
+        seconds = parse_duration(duration)
+        if seconds < MIN_REPEAT_SEC:
+            raise ValueError(f"step {name.strip()!r} must last at least a minute")
+        steps.append({"name": name.strip(), "duration": seconds})
+    if not steps:
+        raise ValueError("a chain needs at least one step")
+    return steps
+
+
+# ─── Cron ──────────────────────────────────────────────────────────────────────
+class Cron(NamedTuple):
+    minutes: Tuple[int, ...]
+    hours: Tuple[int, ...]
+    days: FrozenSet[int]
+    months: FrozenSet[int]
+    weekdays: FrozenSet[int]  # 0 = Sunday
+    any_day: bool  # day-of-month field is *
+    any_weekday: bool  # day-of-week field is *
+
+
+_CRON_FIELDS = (
+    ("minute", 0, 59),
+    ("hour", 0, 23),
+    ("day", 1, 31),
+    ("month", 1, 12),
+    ("weekday", 0, 7),
+)
+
+
+def _cron_field(text: str, name: str, low: int, high: int) -> FrozenSet[int]:
+    values = set()
+    for part in text.split(","):
+        rng, _, step = part.partition("/")
+        try:
+            if rng == "*":
+                start, stop = low, high
+            elif "-" in rng:
+                a, _, b = rng.partition("-")
+                start, stop = int(a), int(b)
+            else:
+                start = stop = int(rng)
+                if step:
+                    stop = high
+            n = int(step) if step else 1
+        except ValueError:
+            raise ValueError(f"can't read cron {name} {part!r}") from None
+        if not (low <= start <= stop <= high) or n <= 0:
+            raise ValueError(f"cron {name} {part!r} is outside {low}-{high}")
+        values.update(range(start, stop + 1, n))
+    return frozenset(values)
+
+
+@functools.lru_cache(maxsize=256)
+def parse_cron(expr: str) -> Cron:
+    """Five fields: minute hour day-of-month month day-of-week (0 or 7 = Sunday), each
+    *, N, A-B, list A,B and /step. Day-of-month and day-of-week match either one when
+    both are given, as in cron."""
+    fields = expr.split()
+    if len(fields) != 5:
+        raise ValueError("cron needs 5 fields: minute hour day month weekday")
+    minutes, hours, days, months, weekdays = (
+        _cron_field(text, *spec) for text, spec in zip(fields, _CRON_FIELDS)
+    )
+    weekdays = frozenset(d % 7 for d in weekdays)
+    return Cron(
+        tuple(sorted(minutes)),
+        tuple(sorted(hours)),
+        days,
+        months,
+        weekdays,
+        fields[2] == "*",
+        fields[4] == "*",
+    )
+
+
+def _cron_day(cron: Cron, day: dt.date) -> bool:
+    if day.month not in cron.months:
+        return False
+    dom = day.day in cron.days
+    dow = (day.isoweekday() % 7) in cron.weekdays
+    if cron.any_day or cron.any_weekday:
+        return dom and dow
+    return dom or dow
+
+
+def cron_next(expr: str, after: float) -> float:
+    """First time strictly after `after` (epoch seconds) that matches the expression."""
+    cron = parse_cron(expr)
+    start = dt.datetime.fromtimestamp(after, TIMER_TZ).replace(second=0, microsecond=0)
+    start += dt.timedelta(minutes=1)
+    day = start.date()
+    for _ in range(366 * 5):  # far enough for Feb 29 on a given weekday
+        if _cron_day(cron, day):
+            for hour in cron.hours:
+                for minute in cron.minutes:
+                    t = dt.datetime(day.year, day.month, day.day, hour, minute, tzinfo=TIMER_TZ)
+                    if t >= start:
+                        return t.timestamp()
+        day += dt.timedelta(days=1)
+    raise ValueError(f"cron {expr!r} never fires")
+
+
+# ─── Advancing a timer ─────────────────────────────────────────────────────────
+def describe_repeat(data: dict) -> Optional[str]:
+    """One line about the timer's schedule for its embed, or None for a one-shot timer."""
+    chain = data.get("chain")
+    repeat = data.get("repeat") or {}
+    if chain:
+        step = int(data.get("step", 0))
+        line = f"⛓️ Step {step + 1}/{len(chain)} — {chain[step]['name']}"
+        return line + (" (loops)" if repeat.get("loop") else "")
+    if repeat.get("every"):
+        hrs, rem = divmod(int(repeat["every"]) // 60, 60)
+        return f"🔁 Every {hrs}h{rem:02d}m"
+    if repeat.get("cron"):
+        return f"🔁 `{repeat['cron']}`"
+    return None
+
+
+def advance_timer(data: dict, now: float) -> bool:
+    """Re-arm a recurring timer, or move a chain on to its next step, in place.
+
+    Sets end_time (and duration, step, runs) for the next run and returns True; returns
+    False when the timer is one-shot or its chain is finished, i.e. it really expires.
+    Runs missed while the bot was down are skipped, not fired late one after another.
+    """
+    end = float(data["end_time"])
+    chain = data.get("chain")
+    repeat = data.get("repeat") or {}
+    if chain:
+        step = int(data.get("step", 0)) + 1
+        if step >= len(chain):
+            if not repeat.get("loop"):
+                return False
+            step = 0
+        duration = int(chain[step]["duration"])
+        data["step"] = step
+        start = end if end + duration > now else now  # late: start the step from now
+    elif repeat.get("every"):
+        duration = int(repeat["every"])
+        missed = max(0, int((now - end) // duration))
+        start = end + missed * duration
+    elif repeat.get("cron"):
+        nxt = cron_next(repeat["cron"], max(end, now))
+        duration = max(1, int(nxt - max(end, now)))
+        start = nxt - duration
+    else:
+        return False
+    data["end_time"] = start + duration
+    data["duration"] = duration
+    data["runs"] = int(data.get("runs", 0)) + 1
+    return True
@@ -1,20 +1,244 @@
+import os
+import asyncio
+import heapq
 import time
 import uuid
 import discord
 from discord.ext import commands, tasks
 from discord import app_commands
-from data_manager import load_timers, add_timer, save_timers, remove_timer
+from dashboards import ChannelBackoff, edit_dashboard, retry_after
+from data_manager import (
+    aarchive_expired_timers,
+    acount_expired_timers,
+    aload_timers,
+    aput_timer,
+    aget_timer,
+    aupdate_timer,
+    aupdate_named_timer,
+    aremove_named_timer,
+    atimer_names,
+    aremove_channel_timers,
+)
+from timer_schedule import (
+    MIN_REPEAT_SEC,
+    advance_timer,
+    cron_next,
+    describe_repeat,
+    parse_chain,
+    parse_duration,
+)
+
+# Retention: expired timers stay in timers.json (editable, listed) for this long, then move
+# to the archive. Past TIMER_HOT_MAX_EXPIRED expired timers, the oldest go early.
+ARCHIVE_AFTER_SEC = float(os.getenv("TIMER_ARCHIVE_AFTER_SEC", str(24 * 3600)))
+HOT_MAX_EXPIRED = max(0, int(os.getenv("TIMER_HOT_MAX_EXPIRED", "200")))
+ARCHIVE_SWEEP_SEC = max(60.0, float(os.getenv("TIMER_ARCHIVE_SWEEP_SEC", "3600")))
+# Count archived timers per guild per day (timer_stats.json)
+TIMER_STATS = os.getenv("TIMER_STATS", "1") == "1"
+
+# Live timers: their message shows a progress bar, refreshed by one shared ticker every
+# TIMER_LIVE_TICK_SEC. Each channel gets at most TIMER_LIVE_CHANNEL_BUDGET edits per tick,
+# spread over the tick; timers over budget wait for the next tick, longest-waiting first.
+LIVE_TICK_SEC = max(10.0, float(os.getenv("TIMER_LIVE_TICK_SEC", "60")))
+LIVE_CHANNEL_BUDGET = max(1, int(os.getenv("TIMER_LIVE_CHANNEL_BUDGET", "20")))
+LIVE_BAR_WIDTH = 20
+
+
+def _running(data: dict) -> bool:
+    return not data.get("paused", False) and not data.get("expired", False)
+
+
+class TimerScheduler:
+    """Min-heap of (end_time, timer_id) over the running timers.
+
+    run() sleeps until the earliest end time and hands every timer due by then to
+    `expire`, so a timer fires within the wakeup latency instead of on the next poll, and
+    nothing runs while no timer is due. The heap is rebuilt from storage by load() and
+    kept current by schedule()/unschedule() on create, pause, resume, edit and delete;
+    entries superseded by a later schedule() are skipped when popped.
+    """
+
+    def __init__(self, expire):
+        self.expire = expire  # async (list of timer ids) -> None
+        self._heap: list[tuple[float, str]] = []
+        self._due: dict[str, float] = {}  # timer id -> live heap deadline
+        self._wake = asyncio.Event()
+
+    def load(self, timers: dict) -> None:
+        self._due = {tid: float(d["end_time"]) for tid, d in timers.items() if _running(d)}
+        self._heap = [(due, tid) for tid, due in self._due.items()]
+        heapq.heapify(self._heap)
+        self._wake.set()
+
+    def schedule(self, tid: str, data: dict) -> None:
+        """(Re)plan a timer from its stored data; paused or expired ones are dropped."""
+        if not _running(data):
+            self.unschedule(tid)
+            return
+        due = float(data["end_time"])
+        self._due[tid] = due
+        heapq.heappush(self._heap, (due, tid))
+        if len(self._heap) > 2 * len(self._due) + 64:
+            self._heap = [(d, t) for t, d in self._due.items()]
+            heapq.heapify(self._heap)
+        if self._heap[0][1] == tid:
+            self._wake.set()  # new earliest deadline
+
+    def unschedule(self, tid: str) -> None:
+        self._due.pop(tid, None)
+
+    def pop_due(self, now: float) -> list[str]:
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            end, tid = heapq.heappop(self._heap)
+            if self._due.get(tid) == end:
+                del self._due[tid]
+                due.append(tid)
+        return due
+
+    async def run(self) -> None:
+        while True:
+            due = self.pop_due(time.time())
+            if due:
+                await self.expire(due)
+                continue
+            timeout = self._heap[0][0] - time.time() if self._heap else None
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+
+def progress_bar(done: float, total: float, width: int = LIVE_BAR_WIDTH) -> str:
+    """Same glyphs as arkstatus_asa.bar()."""
+    if total <= 0:
+        return "—"
+    filled = int(round(min(max(done / total, 0.0), 1.0) * width))
+    return "▰" * filled + "▱" * (width - filled)
+
+
+def fmt_left(seconds: float) -> str:
+    minutes = int(seconds // 60)
+    if minutes <= 0:
+        return "<1m"
+    hrs, mins = divmod(minutes, 60)
+    return f"{hrs}h {mins:02d}m" if hrs else f"{mins}m"
+
+
+class TimerTicker:
+    """Keeps live timers' messages current on one shared tick.
+
+    Every tick renders each running live timer, skips those whose description is what
+    the message already shows (the bar and minutes left move slower than the tick for
+    most timers), and edits the rest channel by channel within the per-channel budget.
+    A channel that hits a 429 is left alone until its backoff runs out. With no live
+    timers the ticker sleeps until one is tracked.
+    """
+
+    def __init__(self, bot: commands.Bot, render, on_gone):
+        self.bot = bot
+        self.render = render  # (timer data, now) -> discord.Embed
+        self.on_gone = on_gone  # async (timer id) -> None, when its message was deleted
+        self.stats = {"ticks": 0, "edits": 0, "skipped": 0, "deferred": 0}
+        self._live: dict[str, dict] = {}  # timer id -> timer data
+        self._shown: dict[str, str] = {}  # timer id -> description the message shows
+        self._edited_at: dict[str, float] = {}
+        self._backoff = ChannelBackoff(cap=600.0)
+        self._wake = asyncio.Event()
+
+    def track(self, tid: str, data: dict, shown: str | None = None) -> None:
+        """Follow (or stop following) a timer after any change to it; `shown` is the
+        description its message was just edited to, if it was."""
+        if not (data.get("live") and _running(data) and data.get("message_id")):
+            self.drop(tid)
+            return
+        self._live[tid] = data
+        if shown is not None:
+            self._shown[tid] = shown
+            self._edited_at[tid] = time.time()
+        self._wake.set()
+
+    def drop(self, tid: str) -> None:
+        self._live.pop(tid, None)
+        self._shown.pop(tid, None)
+        self._edited_at.pop(tid, None)
+
+    def load(self, timers: dict) -> None:
+        for tid, data in timers.items():
+            self.track(tid, data)
+
+    async def run(self) -> None:
+        while True:
+            if not self._live:
+                self._wake.clear()
+                await self._wake.wait()
+            started = time.monotonic()
+            await self.tick()
+            await asyncio.sleep(max(0.0, LIVE_TICK_SEC - (time.monotonic() - started)))
+
+    async def tick(self) -> None:
+        self.stats["ticks"] += 1
+        now = time.time()
+        by_channel: dict[int, list] = {}
+        for tid, data in list(self._live.items()):
+            if now >= data["end_time"]:
+                continue  # the scheduler expires it
+            embed = self.render(data, now)
+            if self._shown.get(tid) == embed.description:
+                self.stats["skipped"] += 1
+                continue
+            by_channel.setdefault(data["channel_id"], []).append((tid, data, embed))
+        await asyncio.gather(*(self._edit_channel(ch, jobs) for ch, jobs in by_channel.items()))
+
+    async def _edit_channel(self, ch_id: int, jobs: list) -> None:
+        channel = self.bot.get_channel(ch_id)
+        if channel is None or self._backoff.remaining(ch_id):
+            self.stats["deferred"] += len(jobs)
+            return
+        jobs.sort(key=lambda job: self._edited_at.get(job[0], 0.0))  # longest-waiting first
+        self.stats["deferred"] += max(0, len(jobs) - LIVE_CHANNEL_BUDGET)
+        gap = LIVE_TICK_SEC / LIVE_CHANNEL_BUDGET / 2  # leave half the tick as headroom
+        for i, (tid, data, embed) in enumerate(jobs[:LIVE_CHANNEL_BUDGET]):
+            if i:
+                await asyncio.sleep(gap)
+            if self._live.get(tid) is not data:
+                continue  # changed (paused, edited, deleted) while we were pacing
+            try:
+                message_id = await edit_dashboard(
+                    channel, data["message_id"], embed=embed, source="timers", resend=False
+                )
+            except discord.HTTPException as e:
+                if e.status == 429:
+                    self._backoff.hit(ch_id, retry_after(e))
+                    self.stats["deferred"] += len(jobs[:LIVE_CHANNEL_BUDGET]) - i
+                    return
+                print(f"[timers] live update of {data['name']!r} failed: {e}")
+                continue
+            if message_id is None:
+                self.drop(tid)
+                await self.on_gone(tid)
+                continue
+            self.stats["edits"] += 1
+            self._shown[tid] = embed.description
+            self._edited_at[tid] = time.time()
 
 
 class TimerCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.expiration_loop.start()
+        self.scheduler = TimerScheduler(self._expire)
+        self.ticker = TimerTicker(bot, self.build_timer_embed, self._live_message_gone)
+        self._task = asyncio.get_running_loop().create_task(self._run_scheduler())
+        self._ticker_task = asyncio.get_running_loop().create_task(self._run_ticker())
+        self.retention_loop.start()
 
     def cog_unload(self):
-        self.expiration_loop.cancel()
+        self._task.cancel()
+        self._ticker_task.cancel()
+        self.retention_loop.cancel()
 
-    def build_timer_embed(self, data):
+    def build_timer_embed(self, data, now=None):
         embed = discord.Embed(title=f"Timer: {data['name']}")
         # Paused state
         if data.get("paused", False):
@@ -23,6 +247,8 @@ class TimerCog(commands.Cog):
             mins, sec = divmod(rem, 60)
             embed.description = f"⏸️ Paused — {hrs:02d}h{mins:02d}m{sec:02d}s"
             embed.color = 0xFFD700
+            if repeat := describe_repeat(data):
+                embed.description += f"\n{repeat}"
         # Expired state
         elif data.get("expired", False):
             embed.description = "✅ Expired"
@@ -32,6 +258,18 @@ class TimerCog(commands.Cog):
             end_ts = int(data["end_time"])
             embed.description = f"⏳ Ends <t:{end_ts}:R>"
             embed.color = 0x00FF00
+            # Live timers also show how far along they are (kept current by TimerTicker)
+            if data.get("live") and data.get("duration"):
+                left = max(0.0, data["end_time"] - (time.time() if now is None else now))
+                total = float(data["duration"])
+                done = min(max(total - left, 0.0), total)
+                embed.description += (
+                    f"\n{progress_bar(done, total)} {int(done * 100 // total)}%"
+                    f" · {fmt_left(left)} left"
+                )
+            # Recurring and chained timers say what they are (and which step they're on)
+            if repeat := describe_repeat(data):
+                embed.description += f"\n{repeat}"
 
         # Footer ping role or owner
         if data.get("role_id"):
@@ -43,7 +281,11 @@ class TimerCog(commands.Cog):
 
     @app_commands.command(name="create_timer", description="Create a countdown timer")
     @app_commands.describe(
-        name="Timer name", hours="Hours", minutes="Minutes", role="Role to ping when timer expires"
+        name="Timer name",
+        hours="Hours",
+        minutes="Minutes",
+        role="Role to ping when timer expires",
+        live="Show a progress bar that updates while the timer runs",
     )
     async def create_timer(
         self,
@@ -52,45 +294,162 @@ class TimerCog(commands.Cog):
         hours: int,
         minutes: int,
         role: discord.Role = None,
+        live: bool = False,
     ):
         total = hours * 3600 + minutes * 60
-        end_ts = time.time() + total
+        await self._start_timer(interaction, name, time.time() + total, total, role, live)
+
+    async def _start_timer(self, interaction, name, end_ts, total, role, live, **extra):
         tid = str(uuid.uuid4())
         timer_data = {
             "name": name,
             "end_time": end_ts,
+            "guild_id": interaction.guild_id,
             "channel_id": interaction.channel_id,
             "message_id": None,
             "paused": False,
             "owner_id": interaction.user.id,
             "role_id": role.id if role else None,
             "expired": False,
+            "created_at": int(time.time()),
+            "duration": total,
+            "live": live,
+            **extra,
         }
         embed = self.build_timer_embed(timer_data)
         await interaction.response.send_message(embed=embed)
         msg = await interaction.original_response()
         timer_data["message_id"] = msg.id
-        add_timer(tid, timer_data)
+        await aput_timer(tid, timer_data)
+        self.scheduler.schedule(tid, timer_data)
+        self.ticker.track(tid, timer_data, embed.description)
+
+    @app_commands.command(
+        name="create_recurring_timer",
+        description="Create a timer that starts over by itself, on an interval or a schedule",
+    )
+    @app_commands.describe(
+        name="Timer name",
+        every="Interval, e.g. 4h30m or 1d (ignored when a schedule is given)",
+        schedule="Cron schedule instead: minute hour day month weekday, e.g. 0 20 * * 1,4",
+        role="Role to ping each time the timer fires",
+        live="Show a progress bar that updates while the timer runs",
+    )
+    async def create_recurring_timer(
+        self,
+        interaction: discord.Interaction,
+        name: str,
+        every: str = None,
+        schedule: str = None,
+        role: discord.Role = None,
+        live: bool = False,
+    ):
+        now = time.time()
+        try:
+            if schedule:
+                repeat = {"cron": " ".join(schedule.split())}
+                end_ts = cron_next(repeat["cron"], now)
+            elif every:
+                repeat = {"every": parse_duration(every)}
+                if repeat["every"] < MIN_REPEAT_SEC:
+                    raise ValueError("the interval must be at least a minute")
+                end_ts = now + repeat["every"]
+            else:
+                raise ValueError("give an interval (every) or a cron schedule")
+        except ValueError as e:
+            return await interaction.response.send_message(f"❌ {e}", ephemeral=True)
+        total = max(1, int(end_ts - now))
+        await self._start_timer(interaction, name, end_ts, total, role, live, repeat=repeat)
+
+    @app_commands.command(
+        name="create_timer_chain",
+        description="Create a timer that runs through steps one after another",
+    )
+    @app_commands.describe(
+        name="Timer name",
+        steps="Steps as Name: duration, comma separated, e.g. Egg: 2h, Baby: 4h30m",
+        loop="Start over from the first step after the last one",
+        role="Role to ping at the end of each step",
+        live="Show a progress bar that updates while the timer runs",
+    )
+    async def create_timer_chain(
+        self,
+        interaction: discord.Interaction,
+        name: str,
+        steps: str,
+        loop: bool = False,
+        role: discord.Role = None,
+        live: bool = False,
+    ):
+        try:
+            chain = parse_chain(steps)
+        except ValueError as e:
+            return await interaction.response.send_message(f"❌ {e}", ephemeral=True)
+        total = chain[0]["duration"]
+        extra = {"chain": chain, "step": 0}
+        if loop:
+            extra["repeat"] = {"loop": True}
+        await self._start_timer(interaction, name, time.time() + total, total, role, live, **extra)
+
+    async def _refresh_timer_message(self, tid, data):
+        channel = self.bot.get_channel(data["channel_id"])
+        shown = None
+        if channel:
+            embed = self.build_timer_embed(data)
+            try:
+                # A deleted timer message stays deleted; only live ones are updated
+                if await edit_dashboard(
+                    channel,
+                    data["message_id"],
+                    embed=embed,
+                    source="timers",
+                    resend=False,
+                ):
+                    shown = embed.description
+            except:
+                pass
+        self.ticker.track(tid, data, shown)
+
+    async def _live_message_gone(self, tid):
+        await aupdate_timer(tid, lambda data: data.update(live=False))
+
+    @app_commands.command(
+        name="live_timer", description="Turn a timer's live progress bar on or off"
+    )
+    @app_commands.describe(name="Name of timer", enabled="Show a live progress bar")
+    async def live_timer(self, interaction: discord.Interaction, name: str, enabled: bool):
+        def _live(data):
+            data["live"] = enabled
+            # Timers from before live mode have no duration; count from now
+            left = data["remaining_time"] if data.get("paused") else data["end_time"] - time.time()
+            data.setdefault("duration", max(0, int(left)))
+
+        found = await aupdate_named_timer(
+            interaction.guild_id, name, _live, lambda data: not data.get("expired", False)
+        )
+        if found:
+            await self._refresh_timer_message(*found)
+            state = "on" if enabled else "off"
+            return await interaction.response.send_message(
+                f"📊 Live progress for timer '{name}' is {state}", ephemeral=True
+            )
+        await interaction.response.send_message(f"❌ No timer named '{name}' found", ephemeral=True)
 
     @app_commands.command(name="pause_timer", description="Pause a running timer")
     @app_commands.describe(name="Name of timer to pause")
     async def pause_timer(self, interaction: discord.Interaction, name: str):
-        timers = load_timers()
-        for tid, data in timers.items():
-            if data["name"].lower() == name.lower() and not data.get("paused", False):
-                data["remaining_time"] = data["end_time"] - time.time()
-                data["paused"] = True
-                save_timers(timers)
-                channel = self.bot.get_channel(data["channel_id"])
-                if channel:
-                    try:
-                        msg = await channel.fetch_message(data["message_id"])
-                        await msg.edit(embed=self.build_timer_embed(data))
-                    except:
-                        pass
-                return await interaction.response.send_message(
-                    f"⏸️ Paused timer '{name}'", ephemeral=True
-                )
+        def _pause(data):
+            data["remaining_time"] = data["end_time"] - time.time()
+            data["paused"] = True
+
+        found = await aupdate_named_timer(interaction.guild_id, name, _pause, _running)
+        if found:
+            tid, data = found
+            self.scheduler.unschedule(tid)
+            await self._refresh_timer_message(tid, data)
+            return await interaction.response.send_message(
+                f"⏸️ Paused timer '{name}'", ephemeral=True
+            )
         await interaction.response.send_message(
             f"❌ No running timer named '{name}' found", ephemeral=True
         )
@@ -98,23 +457,24 @@ class TimerCog(commands.Cog):
     @app_commands.command(name="resume_timer", description="Resume a paused timer")
     @app_commands.describe(name="Name of timer to resume")
     async def resume_timer(self, interaction: discord.Interaction, name: str):
-        timers = load_timers()
-        for tid, data in timers.items():
-            if data["name"].lower() == name.lower() and data.get("paused", False):
-                data["end_time"] = time.time() + data["remaining_time"]
-                data["paused"] = False
-                data.pop("remaining_time", None)
-                save_timers(timers)
-                channel = self.bot.get_channel(data["channel_id"])
-                if channel:
-                    try:
-                        msg = await channel.fetch_message(data["message_id"])
-                        await msg.edit(embed=self.build_timer_embed(data))
-                    except:
-                        pass
-                return await interaction.response.send_message(
-                    f"▶️ Resumed timer '{name}'", ephemeral=True
-                )
+        def _resume(data):
+            data["end_time"] = time.time() + data["remaining_time"]
+            data["paused"] = False
+            data.pop("remaining_time", None)
+
+        found = await aupdate_named_timer(
+            interaction.guild_id,
+            name,
+            _resume,
+            lambda data: data.get("paused", False) and not data.get("expired", False),
+        )
+        if found:
+            tid, data = found
+            self.scheduler.schedule(tid, data)
+            await self._refresh_timer_message(tid, data)
+            return await interaction.response.send_message(
+                f"▶️ Resumed timer '{name}'", ephemeral=True
+            )
         await interaction.response.send_message(
             f"❌ No paused timer named '{name}' found", ephemeral=True
         )
@@ -124,61 +484,186 @@ class TimerCog(commands.Cog):
     async def edit_timer(
         self, interaction: discord.Interaction, name: str, hours: int, minutes: int
     ):
-        timers = load_timers()
-        for tid, data in timers.items():
-            if data["name"].lower() == name.lower():
-                total = hours * 3600 + minutes * 60
-                if data.get("paused", False):
-                    data["remaining_time"] = total
-                else:
-                    data["end_time"] = time.time() + total
-                save_timers(timers)
-                channel = self.bot.get_channel(data["channel_id"])
-                if channel:
-                    try:
-                        msg = await channel.fetch_message(data["message_id"])
-                        await msg.edit(embed=self.build_timer_embed(data))
-                    except:
-                        pass
-                return await interaction.response.send_message(
-                    f"✏️ Updated timer '{name}' to {hours}h{minutes}m", ephemeral=True
-                )
+        total = hours * 3600 + minutes * 60
+
+        def _edit(data):
+            if data.get("paused", False):
+                data["remaining_time"] = total
+            else:
+                data["end_time"] = time.time() + total
+            data["duration"] = total
+
+        found = await aupdate_named_timer(
+            interaction.guild_id, name, _edit, lambda data: not data.get("expired", False)
+        )
+        if found:
+            tid, data = found
+            self.scheduler.schedule(tid, data)
+            await self._refresh_timer_message(tid, data)
+            return await interaction.response.send_message(
+                f"✏️ Updated timer '{name}' to {hours}h{minutes}m", ephemeral=True
+            )
         await interaction.response.send_message(f"❌ No timer named '{name}' found", ephemeral=True)
 
+    @app_commands.command(name="rearm_timer", description="Start a timer over, keeping its message")
+    @app_commands.describe(
+        name="Name of timer to start over",
+        hours="New hours (default: the timer's last duration)",
+        minutes="New minutes",
+    )
+    async def rearm_timer(
+        self, interaction: discord.Interaction, name: str, hours: int = None, minutes: int = None
+    ):
+        now = time.time()
+
+        def _rearm(data):
+            # Same record, same message: a chain goes back to its first step, a cron timer
+            # to its next slot, anything else runs its (new) duration again
+            if hours is not None or minutes is not None:
+                total = (hours or 0) * 3600 + (minutes or 0) * 60
+            elif data.get("chain"):
+                data["step"] = 0
+                total = int(data["chain"][0]["duration"])
+            elif (data.get("repeat") or {}).get("cron"):
+                total = max(1, int(cron_next(data["repeat"]["cron"], now) - now))
+            else:
+                total = int(data.get("duration", 0))
+            if total <= 0:
+                return False
+            data.update(end_time=now + total, duration=total, paused=False, expired=False)
+            data.pop("remaining_time", None)
+            data["runs"] = int(data.get("runs", 0)) + 1
+
+        found = await aupdate_named_timer(interaction.guild_id, name, _rearm)
+        if found:
+            tid, data = found
+            self.scheduler.schedule(tid, data)
+            await self._refresh_timer_message(tid, data)
+            return await interaction.response.send_message(
+                f"🔁 Timer '{name}' starts over, ends <t:{int(data['end_time'])}:R>", ephemeral=True
+            )
+        await interaction.response.send_message(
+            f"❌ No timer named '{name}' with a duration to start over", ephemeral=True
+        )
+
     @app_commands.command(name="delete_timer", description="Delete a timer")
     @app_commands.describe(name="Name of timer to delete")
     async def delete_timer(self, interaction: discord.Interaction, name: str):
-        timers = load_timers()
-        for tid, data in list(timers.items()):
-            if data["name"].lower() == name.lower():
-                remove_timer(tid)
-                return await interaction.response.send_message(
-                    f"🗑️ Deleted timer '{name}'", ephemeral=True
-                )
+        found = await aremove_named_timer(interaction.guild_id, name)
+        if found:
+            self.scheduler.unschedule(found[0])
+            self.ticker.drop(found[0])
+            return await interaction.response.send_message(
+                f"🗑️ Deleted timer '{name}'", ephemeral=True
+            )
         await interaction.response.send_message(f"❌ No timer named '{name}' found", ephemeral=True)
 
-    @tasks.loop(minutes=1)
-    async def expiration_loop(self):
-        if not self.bot.is_ready():
-            return
-        timers = load_timers()
+    @live_timer.autocomplete("name")
+    @pause_timer.autocomplete("name")
+    @resume_timer.autocomplete("name")
+    @edit_timer.autocomplete("name")
+    @rearm_timer.autocomplete("name")
+    @delete_timer.autocomplete("name")
+    async def _timer_name_autocomplete(self, interaction: discord.Interaction, current: str):
+        # Served from the store's name index; the user's own timers come first
+        names = await atimer_names(interaction.guild_id, current, interaction.user.id)
+        return [app_commands.Choice(name=n[:100], value=n[:100]) for n in names]
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        for tid in await aremove_channel_timers(channel.id):
+            self.scheduler.unschedule(tid)
+            self.ticker.drop(tid)
+
+    async def _run_scheduler(self):
+        await self.bot.wait_until_ready()
+        self.scheduler.load(await aload_timers())
+        while True:
+            try:
+                await self.scheduler.run()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[timers] scheduler error: {e}")
+                await asyncio.sleep(5)
+                self.scheduler.load(await aload_timers())  # pick up timers that were due
+
+    async def _run_ticker(self):
+        await self.bot.wait_until_ready()
+        self.ticker.load(await aload_timers())
+        while True:
+            try:
+                await self.ticker.run()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[timers] live ticker error: {e}")
+                await asyncio.sleep(LIVE_TICK_SEC)
+
+    async def _expire(self, tids):
+        # Mark each expiration as its own single-timer write, then announce. Recurring and
+        # chained timers are re-armed in the same write instead: new end_time, same record
+        # and message, back on the heap.
         now = time.time()
-        changed = False
-        for tid, data in timers.items():
-            if not data.get("expired", False) and not data.get("paused", False):
-                if now >= data["end_time"]:
-                    data["expired"] = True
-                    changed = True
-                    channel = self.bot.get_channel(data["channel_id"])
-                    ping = (
-                        f"<@&{data['role_id']}>"
-                        if data.get("role_id")
-                        else f"<@{data['owner_id']}>"
-                    )
-                    if channel:
-                        await channel.send(f"⏰ Timer **{data['name']}** expired! {ping}")
-        if changed:
-            save_timers(timers)
+        done = {}  # name of the chain step that just finished
+
+        def _mark(data):
+            if not _running(data) or now < data["end_time"]:
+                return False
+            if data.get("chain"):
+                done["step"] = data["chain"][int(data.get("step", 0))]["name"]
+            if not advance_timer(data, now):
+                data["expired"] = True
+
+        fired = []
+        for tid in tids:
+            done.clear()
+            data = await aupdate_timer(tid, _mark)
+            if data is not None:
+                fired.append((tid, data, done.get("step")))
+            elif (data := await aget_timer(tid)) is not None:
+                self.scheduler.schedule(tid, data)  # end moved since it was planned
+        for tid, data, step in fired:
+            head = f"⏰ Timer **{data['name']}**" + (f": **{step}** done" if step else "")
+            if data.get("expired", False):
+                if data.get("live"):
+                    await self._refresh_timer_message(tid, data)  # the bar ends at "Expired"
+                text = f"{head}, chain finished!" if step else f"{head} expired!"
+            else:
+                self.scheduler.schedule(tid, data)
+                await self._refresh_timer_message(tid, data)
+                nxt = f"<t:{int(data['end_time'])}:R>"
+                if step:
+                    text = f"{head}, **{data['chain'][data['step']]['name']}** ends {nxt}"
+                else:
+                    text = f"{head} fired! Next {nxt}"
+            channel = self.bot.get_channel(data["channel_id"])
+            ping = f"<@&{data['role_id']}>" if data.get("role_id") else f"<@{data['owner_id']}>"
+            if channel:
+                try:
+                    await channel.send(f"{text} {ping}")
+                except discord.HTTPException as e:
+                    print(f"[timers] could not announce {data['name']!r}: {e}")
+        if any(d.get("expired") for _, d, _ in fired):
+            if await acount_expired_timers() > HOT_MAX_EXPIRED:
+                await self._archive()
+
+    async def _archive(self):
+        try:
+            moved = await aarchive_expired_timers(ARCHIVE_AFTER_SEC, HOT_MAX_EXPIRED, TIMER_STATS)
+        except Exception as e:
+            print(f"[timers] archiving failed: {e}")
+            return
+        if moved:
+            print(f"[timers] archived {moved} expired timer(s)")
+
+    @tasks.loop(seconds=ARCHIVE_SWEEP_SEC)
+    async def retention_loop(self):
+        await self._archive()
+
+    @retention_loop.before_loop
+    async def _before_retention_loop(self):
+        await self.bot.wait_until_ready()
 
 
 async def setup(bot: commands.Bot):